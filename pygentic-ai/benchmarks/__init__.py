@@ -0,0 +1 @@
+"""Benchmarks of the framework, run as modules from the project root (``python -m benchmarks.suite``)."""
@@ -0,0 +1,139 @@
+"""Local models with injected latency for benchmarks.
+
+The models answer every agent of the package (router, fused router, main
+agent, guardrails, translator) without network access. Each call waits for a
+time-to-first-token sampled from a seeded latency distribution plus the time
+needed to "generate" its output tokens at a fixed token rate, so runs are
+repeatable and the measured time not spent in the model is framework overhead.
+"""
+
+import asyncio
+import math
+import random
+import zlib
+from collections.abc import Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, TextPart, ToolCallPart, UserPromptPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.usage import RequestUsage
+
+from pygentic_ai.schemas.agent import TaskType
+
+DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+# Model time accumulated by the current request, set by the benchmark for each request it runs
+model_time: ContextVar[list[float] | None] = ContextVar("model_time", default=None)
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Latency of a fake model call.
+
+    Attributes:
+        distribution: Distribution of the time to first token (fixed, uniform, exponential or lognormal)
+        mean: Mean time to first token in seconds
+        jitter: Spread of the distribution: half-width of the uniform distribution relative to
+            the mean, or sigma of the lognormal one (the mean is kept)
+        tokens_per_second: Output token rate (``None`` returns all tokens at once)
+        output_tokens: Number of output tokens of every answer
+    """
+
+    distribution: str = "fixed"
+    mean: float = 0.2
+    jitter: float = 0.5
+    tokens_per_second: float | None = None
+    output_tokens: int = 50
+
+    def __post_init__(self) -> None:
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution '{self.distribution}', expected one of {DISTRIBUTIONS}")
+
+    def sample(self, rng: random.Random) -> float:
+        """Sample the duration of one call in seconds."""
+        match self.distribution:
+            case "fixed":
+                first_token = self.mean
+            case "uniform":
+                first_token = rng.uniform(self.mean * (1 - self.jitter), self.mean * (1 + self.jitter))
+            case "exponential":
+                first_token = rng.expovariate(1 / self.mean) if self.mean > 0 else 0.0
+            case _:
+                first_token = self.mean * math.exp(rng.gauss(-(self.jitter**2) / 2, self.jitter))
+        generation = self.output_tokens / self.tokens_per_second if self.tokens_per_second else 0.0
+        return max(first_token, 0.0) + generation
+
+
+@dataclass
+class FakeModelFactory:
+    """Creates latency-injecting models sharing one seeded random generator.
+
+    Routes are picked from the user message (not the random generator), so
+    every message takes the same path through the workflow in every run.
+
+    Args:
+        profile: Latency of every call
+        seed: Seed of the latency samples
+        route_mix: Share of messages per route (defaults to conversation only)
+    """
+
+    profile: LatencyProfile = field(default_factory=LatencyProfile)
+    seed: int = 0
+    route_mix: Mapping[TaskType, float] = field(default_factory=lambda: {TaskType.conversation: 1.0})
+    calls: int = 0
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+        self._answer = " ".join(["word"] * self.profile.output_tokens)
+
+    def model(self) -> FunctionModel:
+        """Create a model for one agent."""
+        return FunctionModel(self._respond, model_name="fake")
+
+    def route_for(self, message: str) -> TaskType:
+        """Route the fake router assigns to a message."""
+        point = (zlib.crc32(message.encode()) % 10_000) / 10_000 * sum(self.route_mix.values())
+        for route, share in self.route_mix.items():
+            point -= share
+            if point < 0:
+                return route
+        return next(iter(self.route_mix))
+
+    async def _respond(self, messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        self.calls += 1
+        duration = self.profile.sample(self._rng)
+        accumulated = model_time.get()
+        if accumulated is not None:
+            accumulated.append(duration)
+        await asyncio.sleep(duration)
+
+        usage = RequestUsage(input_tokens=_prompt_tokens(messages), output_tokens=self.profile.output_tokens)
+        if not info.output_tools:
+            return ModelResponse(parts=[TextPart(self._answer)], usage=usage)
+
+        tool = info.output_tools[0]
+        route = self.route_for(_user_prompt(messages))
+        args: dict[str, object] = {"route": route.value, "reasoning": f"Benchmark route {route.name}"}
+        if "answer" in tool.parameters_json_schema["properties"]:
+            args["answer"] = self._answer if route is TaskType.conversation else None
+        return ModelResponse(parts=[ToolCallPart(tool.name, args)], usage=usage)
+
+
+def _user_prompt(messages: list[ModelMessage]) -> str:
+    for message in reversed(messages):
+        if isinstance(message, ModelRequest):
+            for part in message.parts:
+                if isinstance(part, UserPromptPart) and isinstance(part.content, str):
+                    return part.content
+    return ""
+
+
+def _prompt_tokens(messages: list[ModelMessage]) -> int:
+    words = 0
+    for message in messages:
+        for part in message.parts:
+            content = getattr(part, "content", None)
+            if isinstance(content, str):
+                words += len(content.split())
+    return words
@@ -0,0 +1,54 @@
+"""Measure how long importing the lightweight parts of the package takes.
+
+Every measurement runs in a fresh interpreter. The fastest of ``--repeat``
+runs is reported, and with ``--budget`` the script exits with status 1 when
+it is over budget, so the import time can be watched on a dedicated machine
+(wall-clock budgets are too noisy for shared CI runners).
+
+Usage:
+    python -m benchmarks.import_time --repeat 5 --budget 0.3
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+_MEASURE_IMPORTS = """
+import json, time
+
+started = time.perf_counter()
+import pygentic_ai
+from pygentic_ai import WorkflowState, TaskType
+from pygentic_ai.prompts import TEXT_AGENT_RULES, get_guardrails_instructions
+from pygentic_ai.static import ERROR_GENERIC
+print(json.dumps({"elapsed": time.perf_counter() - started}))
+"""
+
+
+def measure() -> float:
+    """Seconds a fresh interpreter takes to import the package, its state and its prompts."""
+    # Pydantic plugins (e.g. logfire) load their own dependencies on the first model class
+    env = {**os.environ, "PYDANTIC_DISABLE_PLUGINS": "__all__"}
+    output = subprocess.run(
+        [sys.executable, "-c", _MEASURE_IMPORTS], capture_output=True, text=True, check=True, env=env
+    ).stdout
+    return json.loads(output)["elapsed"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=None, help="Maximum import time in seconds")
+    args = parser.parse_args()
+
+    elapsed = min(measure() for _ in range(args.repeat))
+    print(f"import time: {elapsed * 1000:.1f} ms (best of {args.repeat})")
+    if args.budget is not None and elapsed > args.budget:
+        print(f"over budget ({args.budget * 1000:.0f} ms)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+"""Benchmark the framework's own throughput and overhead with fake models.
+
+Every agent is backed by a local model with injected latency (see
+``benchmarks.fake_models``), so the time a request spends outside the model is the
+overhead of the framework and the event loop. Each scenario runs at every
+concurrency level with a closed loop of workers:
+
+- ``graph``: ``user_assistant_graph``, timed node by node
+- ``fused_graph``: ``fused_assistant_graph``, timed node by node
+- ``engines``: router, main agent, guardrails and translator called in turn, timed engine by engine
+- ``manager``: ``AgentManager.session`` with ``run_workflow`` and a deadline
+
+Results (requests/sec, latency and overhead percentiles, event-loop lag and
+per-node overhead) are printed and can be saved as JSON. Comparing with a
+saved run reports the changes and exits with status 1 on a regression, so
+the suite can guard performance in CI (compare runs from the same machine).
+
+Usage (from the project root):
+    python -m benchmarks.suite --concurrency 1 8 32 --requests 200 --latency 0.05 --output results.json
+    python -m benchmarks.suite --latency 0.05 --distribution lognormal --compare results.json
+    python -m benchmarks.suite --scenarios graph fused_graph --latency 0.2  # standard vs fused workflow
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import ExitStack
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+from pydantic_graph import End, Graph
+
+from pygentic_ai import AgentManager, UsageLedger
+from pygentic_ai.engines import GenericRouter, GuardrailsAgent, ReasoningAgent, SimpleTranslatorWorker
+from pygentic_ai.schemas.agent import TaskType
+from pygentic_ai.workflows import WorkflowState, run_workflow
+from pygentic_ai.workflows.agent_workflow import fused_assistant_graph, user_assistant_graph
+from pygentic_ai.workflows.nodes import start_node_for
+
+from .fake_models import DISTRIBUTIONS, FakeModelFactory, LatencyProfile, model_time
+
+RESULTS_SCHEMA = 1
+
+AGENTS = {
+    "router": GenericRouter,
+    "agent": ReasoningAgent,
+    "guardrails": GuardrailsAgent,
+    "translator": SimpleTranslatorWorker,
+}
+
+# Generous, so the deadline machinery runs without ever cancelling a request
+WORKFLOW_BUDGET = 600.0
+
+# Overhead changes below this many seconds are noise, whatever their relative size
+MIN_OVERHEAD_DELTA = 0.0005
+
+# Time per request and node: (wall time, model time)
+Timings = dict[str, tuple[float, float]]
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of a sample (``q`` between 0 and 100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))]
+
+
+def summarize(values: Sequence[float]) -> dict[str, float]:
+    """Mean, median, tail percentiles and maximum of a sample."""
+    return {
+        "mean": statistics.fmean(values) if values else 0.0,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values, default=0.0),
+    }
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up a task sleeping at a fixed interval.
+
+    Args:
+        interval: Sleep interval in seconds
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "LoopLagMonitor":
+        self._task = asyncio.create_task(self._measure())
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        assert self._task is not None
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _measure(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, time.perf_counter() - started - self.interval))
+
+
+async def _timed(label: str, timings: Timings, call: Awaitable[Any]) -> Any:
+    calls = model_time.get()
+    assert calls is not None
+    mark = len(calls)
+    started = time.perf_counter()
+    result = await call
+    wall, model = timings.get(label, (0.0, 0.0))
+    timings[label] = (wall + time.perf_counter() - started, model + sum(calls[mark:]))
+    return result
+
+
+def graph_scenario(graph: Graph) -> Callable[[AgentManager, int], Awaitable[Timings]]:
+    """Scenario running a workflow graph node by node."""
+
+    async def run(manager: AgentManager, index: int) -> Timings:
+        timings: Timings = {}
+        deps = manager.to_deps(message=f"Question {index}", chat_history=[])
+        async with graph.iter(start_node_for(graph), state=WorkflowState(), deps=deps) as graph_run:
+            node = graph_run.next_node
+            while not isinstance(node, End):
+                node = await _timed(type(node).__name__, timings, graph_run.next(node))
+        return timings
+
+    return run
+
+
+async def engines_scenario(manager: AgentManager, index: int) -> Timings:
+    """Scenario calling every engine directly, as the workflow nodes do."""
+    timings: Timings = {}
+    message = f"Question {index}"
+    await _timed("GenericRouter.route", timings, manager.get("router").route(message))
+    result = await _timed("ReasoningAgent.generate_response", timings, manager.get("agent").generate_response(message))
+    await _timed("GuardrailsAgent.reformat", timings, manager.get("guardrails").reformat(str(result.output)))
+    await _timed("SimpleTranslatorWorker.translate", timings, manager.get("translator").translate(message, "polish"))
+    return timings
+
+
+async def manager_scenario(manager: AgentManager, index: int) -> Timings:
+    """Scenario serving a request like an application: manager session and ``run_workflow``."""
+    timings: Timings = {}
+    async with manager.session(message=f"Question {index}", chat_history=[]) as deps:
+        await _timed("run_workflow", timings, run_workflow(deps, budget=WORKFLOW_BUDGET))
+    return timings
+
+
+SCENARIOS: dict[str, Callable[[AgentManager, int], Awaitable[Timings]]] = {
+    "graph": graph_scenario(user_assistant_graph),
+    "fused_graph": graph_scenario(fused_assistant_graph),
+    "engines": engines_scenario,
+    "manager": manager_scenario,
+}
+
+
+async def run_scenario(
+    name: str,
+    factory: FakeModelFactory,
+    requests: int,
+    concurrency: int,
+    warmup: int = 5,
+) -> dict[str, Any]:
+    """Run one scenario at one concurrency level.
+
+    Args:
+        name: Scenario name (key of ``SCENARIOS``)
+        factory: Fake models answering the agents
+        requests: Number of measured requests
+        concurrency: Number of requests in flight
+        warmup: Number of requests run before measuring
+
+    Returns:
+        Metrics of the run (times in seconds)
+    """
+    scenario = SCENARIOS[name]
+    ledger = UsageLedger()
+    manager = AgentManager()
+    for agent_name, agent_class in AGENTS.items():
+        manager.register(agent_name, agent_class, api_key="sk-benchmark", ledger=ledger)
+    await manager.initialize()
+
+    latencies: list[float] = []
+    overheads: list[float] = []
+    nodes: defaultdict[str, list[tuple[float, float]]] = defaultdict(list)
+
+    async def one(index: int, measured: bool) -> None:
+        calls: list[float] = []
+        model_time.set(calls)
+        started = time.perf_counter()
+        timings = await scenario(manager, index)
+        elapsed = time.perf_counter() - started
+        if measured:
+            latencies.append(elapsed)
+            overheads.append(elapsed - sum(calls))
+            for node, timing in timings.items():
+                nodes[node].append(timing)
+
+    async def worker(indexes: itertools.count, total: int, measured: bool) -> None:
+        while (index := next(indexes)) < total:
+            # Each request gets its own context, so its model time is not mixed with other requests
+            await asyncio.create_task(one(index, measured))
+
+    with ExitStack() as stack:
+        for agent_name in AGENTS:
+            stack.enter_context(manager.get(agent_name).agent.override(model=factory.model()))
+
+        warmup_indexes = itertools.count(-warmup)
+        await asyncio.gather(*(worker(warmup_indexes, 0, False) for _ in range(concurrency)))
+        ledger.clear()
+        calls_before = factory.calls
+
+        indexes = itertools.count()
+        async with LoopLagMonitor() as lag:
+            started = time.perf_counter()
+            await asyncio.gather(*(worker(indexes, requests, True) for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+
+    return {
+        "scenario": name,
+        "concurrency": concurrency,
+        "requests": requests,
+        "elapsed": elapsed,
+        "rps": requests / elapsed,
+        "model_calls_per_request": (factory.calls - calls_before) / requests,
+        "tokens_per_request": ledger.totals().total_tokens / requests,
+        "latency": summarize(latencies),
+        "overhead": summarize(overheads),
+        "loop_lag": summarize(lag.lags),
+        "nodes": {
+            node: {
+                "count": len(timings),
+                "wall_p50": percentile([wall for wall, _ in timings], 50),
+                "model_mean": statistics.fmean(model for _, model in timings),
+                "overhead": summarize([wall - model for wall, model in timings]),
+            }
+            for node, timings in nodes.items()
+        },
+    }
+
+
+def metadata(config: dict[str, Any]) -> dict[str, Any]:
+    """Describe the environment of a run, so results are only compared with comparable ones."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    packages = {}
+    for package in ("pygentic-ai", "pydantic-ai-slim", "pydantic-graph"):
+        try:
+            packages[package] = version(package)
+        except PackageNotFoundError:
+            packages[package] = None
+    return {
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "packages": packages,
+        "config": config,
+    }
+
+
+def print_results(results: list[dict[str, Any]]) -> None:
+    print(
+        f"{'scenario':<14}{'conc':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}"
+        f"{'ovh p50':>10}{'ovh p99':>10}{'lag p99':>10}{'calls':>7}"
+    )
+    for result in results:
+        latency, overhead = result["latency"], result["overhead"]
+        print(
+            f"{result['scenario']:<14}{result['concurrency']:>6}{result['rps']:>9.1f}"
+            f"{latency['p50'] * 1000:>9.1f}{latency['p95'] * 1000:>9.1f}{latency['p99'] * 1000:>9.1f}"
+            f"{overhead['p50'] * 1000:>10.2f}{overhead['p99'] * 1000:>10.2f}"
+            f"{result['loop_lag']['p99'] * 1000:>10.2f}{result['model_calls_per_request']:>7.1f}"
+        )
+    print("(times in ms; overhead is latency not spent in the model)\n")
+
+    print(f"{'scenario':<14}{'conc':>6}  {'node':<36}{'count':>7}{'model':>9}{'ovh p50':>10}{'ovh p95':>10}")
+    for result in results:
+        for node, stats in result["nodes"].items():
+            print(
+                f"{result['scenario']:<14}{result['concurrency']:>6}  {node:<36}{stats['count']:>7}"
+                f"{stats['model_mean'] * 1000:>9.1f}{stats['overhead']['p50'] * 1000:>10.2f}"
+                f"{stats['overhead']['p95'] * 1000:>10.2f}"
+            )
+
+
+def compare(results: list[dict[str, Any]], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Compare results with a saved run.
+
+    A run regresses if its throughput drops, or its median overhead grows,
+    by more than ``threshold`` (relative).
+
+    Returns:
+        Descriptions of the regressions
+    """
+    if baseline.get("schema") != RESULTS_SCHEMA:
+        raise ValueError(f"Baseline has results schema {baseline.get('schema')}, expected {RESULTS_SCHEMA}")
+    previous = {(result["scenario"], result["concurrency"]): result for result in baseline["results"]}
+    regressions = []
+    print(f"\nCompared with {baseline['metadata'].get('git_commit')} ({baseline['metadata']['created']}):")
+    print(f"{'scenario':<14}{'conc':>6}{'rps':>16}{'ovh p50 [ms]':>22}")
+    for result in results:
+        key = (result["scenario"], result["concurrency"])
+        if key not in previous:
+            continue
+        old = previous[key]
+        rps_change = result["rps"] / old["rps"] - 1
+        old_overhead, overhead = old["overhead"]["p50"], result["overhead"]["p50"]
+        overhead_change = overhead / old_overhead - 1 if old_overhead > 0 else 0.0
+        print(
+            f"{key[0]:<14}{key[1]:>6}{old['rps']:>8.1f} {rps_change:>+6.1%}"
+            f"{old_overhead * 1000:>12.2f} -> {overhead * 1000:.2f}"
+        )
+        if rps_change < -threshold:
+            regressions.append(f"{key[0]} at concurrency {key[1]}: throughput {rps_change:+.1%}")
+        if overhead_change > threshold and overhead - old_overhead > MIN_OVERHEAD_DELTA:
+            regressions.append(f"{key[0]} at concurrency {key[1]}: median overhead {overhead_change:+.1%}")
+    return regressions
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario and concurrency")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean seconds to first token")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--jitter", type=float, default=0.5, help="Spread of the uniform and lognormal latency")
+    parser.add_argument("--tokens-per-second", type=float, default=None, help="Output token rate of the models")
+    parser.add_argument("--output-tokens", type=int, default=50)
+    parser.add_argument("--refuse-share", type=float, default=0.0, help="Share of messages the router refuses")
+    parser.add_argument("--translate-share", type=float, default=0.0, help="Share of messages routed to translation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Save the results as JSON")
+    parser.add_argument("--compare", type=Path, help="Compare with results saved by --output")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative change counted as a regression")
+    args = parser.parse_args()
+
+    profile = LatencyProfile(
+        distribution=args.distribution,
+        mean=args.latency,
+        jitter=args.jitter,
+        tokens_per_second=args.tokens_per_second,
+        output_tokens=args.output_tokens,
+    )
+    route_mix = {
+        TaskType.conversation: max(0.0, 1 - args.refuse_share - args.translate_share),
+        TaskType.refuse: args.refuse_share,
+        TaskType.translate: args.translate_share,
+    }
+    config = {
+        "profile": vars(profile),
+        "route_mix": {route.name: share for route, share in route_mix.items()},
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "seed": args.seed,
+    }
+
+    results = []
+    for name in args.scenarios:
+        for concurrency in args.concurrency:
+            factory = FakeModelFactory(profile=profile, seed=args.seed, route_mix=route_mix)
+            results.append(await run_scenario(name, factory, args.requests, concurrency, args.warmup))
+    print_results(results)
+
+    if args.output:
+        report = {"schema": RESULTS_SCHEMA, "metadata": metadata(config), "results": results}
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline["metadata"]["config"] != config:
+            print("\nWarning: the baseline was run with a different configuration")
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
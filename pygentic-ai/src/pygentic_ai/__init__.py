@@ -7,13 +7,43 @@ This package provides building blocks for creating custom AI agent workflows:
 - WorkflowState: State management for workflows
 - Workflow Nodes: Reusable workflow components
 - Tools: Utility functions for agents
+- UsageLedger: Usage and cost accounting across agent calls
+- LaneScheduler: Priority lanes sharing agent capacity between workloads
+- BatchCollector: Deferred agent calls submitted as provider batch jobs
+- Cassette: Recording and offline replay of agent model traffic
+- Profiler: Model, tool and framework time per node and agent, event-loop health
 """
 
-from pygentic_ai.engines.base import BaseAgent, BaseAgentDeps
-from pygentic_ai.manager import AgentManager
-from pygentic_ai.schemas import AgentMode, TaskType
-from pygentic_ai.workflows.agent_workflow import user_assistant_graph
-from pygentic_ai.workflows.state import RefusalInfo, WorkflowState
+from typing import TYPE_CHECKING, Any
+
+from pygentic_ai.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pygentic_ai.cassettes import Cassette, CassetteMissError, CassetteMode
+    from pygentic_ai.deferred import BatchBackend, BatchCollector, LocalBatchBackend, OpenAIBatchBackend
+    from pygentic_ai.engines.base import BaseAgent, BaseAgentDeps
+    from pygentic_ai.manager import AgentManager
+    from pygentic_ai.profiling import Profiler
+    from pygentic_ai.scheduling import Lane, LaneScheduler, LaneStats
+    from pygentic_ai.schemas import AgentMode, TaskType
+    from pygentic_ai.usage import ModelPrice, UsageLedger, usage_ledger
+    from pygentic_ai.workflows.agent_workflow import user_assistant_graph
+    from pygentic_ai.workflows.state import RefusalInfo, WorkflowState
+
+# Submodules are imported on first access, so that e.g. ``WorkflowState`` can be
+# used without loading Pydantic AI, Pydantic Graph and the provider SDKs
+_EXPORTS = {
+    "pygentic_ai.cassettes": ["Cassette", "CassetteMissError", "CassetteMode"],
+    "pygentic_ai.deferred": ["BatchBackend", "BatchCollector", "LocalBatchBackend", "OpenAIBatchBackend"],
+    "pygentic_ai.engines.base": ["BaseAgent", "BaseAgentDeps"],
+    "pygentic_ai.manager": ["AgentManager"],
+    "pygentic_ai.profiling": ["Profiler"],
+    "pygentic_ai.scheduling": ["Lane", "LaneScheduler", "LaneStats"],
+    "pygentic_ai.schemas": ["AgentMode", "TaskType"],
+    "pygentic_ai.usage": ["ModelPrice", "UsageLedger", "usage_ledger"],
+    "pygentic_ai.workflows.agent_workflow": ["user_assistant_graph"],
+    "pygentic_ai.workflows.state": ["RefusalInfo", "WorkflowState"],
+}
 
 __all__ = [
     # Core classes
@@ -25,16 +55,38 @@ __all__ = [
     # State
     "WorkflowState",
     "RefusalInfo",
+    # Usage
+    "ModelPrice",
+    "UsageLedger",
+    "usage_ledger",
+    # Scheduling
+    "Lane",
+    "LaneScheduler",
+    "LaneStats",
+    # Deferred batch mode
+    "BatchBackend",
+    "BatchCollector",
+    "LocalBatchBackend",
+    "OpenAIBatchBackend",
+    # Record and replay
+    "Cassette",
+    "CassetteMissError",
+    "CassetteMode",
+    # Profiling
+    "Profiler",
     # Enums
     "AgentMode",
     "TaskType",
 ]
 
 
-def __getattr__(name: str) -> str:
-    """Lazy load version from package metadata."""
+_get_export, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy load exports and the version from package metadata."""
     if name == "__version__":
         from importlib.metadata import version
 
         return version("pygentic-ai")
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _get_export(name)
@@ -0,0 +1,301 @@
+"""Record agent model traffic to cassette files and replay it offline."""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import IO, Any
+
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters, infer_model
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.providers import Provider, infer_provider, infer_provider_class
+from pydantic_ai.settings import ModelSettings
+
+from pygentic_ai.context import current_scope
+
+CASSETTE_VERSION = 1
+
+# Message fields identifying a request; timestamps, run ids and provider metadata differ between runs
+_KEY_FIELDS = ("part_kind", "tool_name", "content", "args", "tool_call_id")
+
+
+class CassetteMode(StrEnum):
+    """Whether a cassette records model traffic or serves it."""
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class CassetteMissError(LookupError):
+    """Raised when a replayed request was not recorded on the cassette."""
+
+
+@dataclass
+class CassetteStats:
+    """Counters of a cassette."""
+
+    recorded: int = 0
+    replayed: int = 0
+    misses: int = 0
+
+
+@dataclass
+class CassetteEntry:
+    """A recorded model request and its response.
+
+    Attributes:
+        key: Hash of the agent, tools and messages of the request
+        agent: Agent class that made the request
+        node: Workflow node the request was made from
+        model: Model that answered the request
+        latency: Seconds the model took to answer
+        request: Last message of the request (what the agent added in this turn)
+        response: Serialized model response
+    """
+
+    key: str
+    agent: str | None
+    node: str | None
+    model: str
+    latency: float
+    request: dict[str, Any]
+    response: dict[str, Any]
+
+
+class Cassette:
+    """Records the model requests of agent runs and replays them deterministically.
+
+    In record mode every model request made by an agent (router, generator,
+    guardrails, translator, ...) inside ``execution_scope(cassette=...)`` is
+    forwarded to the model and kept together with its response (including
+    tool calls) and latency; ``save`` writes them as JSON lines (gzipped if
+    the path ends with ``.gz``). In replay mode the same requests are answered
+    from the file without network access, optionally after their recorded
+    latency, so whole workflows can be load-tested and regression-tested
+    offline.
+
+    Requests are matched by agent, available tools and messages (without
+    timestamps or run ids). Tool results are not part of the match unless
+    ``match_tool_results`` is set, as tools run again during replay and may
+    return e.g. the current date. A request recorded several times is
+    answered with its responses in recorded order, starting over when they
+    run out.
+
+    Args:
+        path: Cassette file
+        mode: Record or replay
+        reproduce_latency: Whether replayed responses wait for their recorded latency
+        latency_scale: Factor applied to reproduced latencies
+        match_tool_results: Whether tool results must match the recording
+        verbose: Whether to print recorded and replayed requests
+
+    Example:
+        ```python
+        from pygentic_ai import Cassette
+        from pygentic_ai.context import execution_scope
+        from pygentic_ai.workflows import run_workflow
+
+        recorder = Cassette("traffic.jsonl.gz", mode="record")
+        with execution_scope(cassette=recorder):
+            await run_workflow(manager.to_deps(message="Hello!", chat_history=[]))
+        recorder.save()
+
+        player = Cassette("traffic.jsonl.gz", mode="replay", reproduce_latency=True)
+        with execution_scope(cassette=player):
+            await run_workflow(manager.to_deps(message="Hello!", chat_history=[]))
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: CassetteMode | str = CassetteMode.REPLAY,
+        reproduce_latency: bool = False,
+        latency_scale: float = 1.0,
+        match_tool_results: bool = False,
+        verbose: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.mode = CassetteMode(mode)
+        self.reproduce_latency = reproduce_latency
+        self.latency_scale = latency_scale
+        self.match_tool_results = match_tool_results
+        self.verbose = verbose
+        self.stats = CassetteStats()
+        self.entries: list[CassetteEntry] = []
+        self._by_key: dict[str, list[CassetteEntry]] = {}
+        self._served: dict[str, int] = {}
+        if self.mode is CassetteMode.REPLAY:
+            self.load()
+
+    def wrap(self, model: Model | str, agent: str | None = None) -> "CassetteModel":
+        """Wrap a model so that its requests are recorded or replayed.
+
+        Args:
+            model: Model the agent would call
+            agent: Name of the agent making the requests (part of the match)
+        """
+        return CassetteModel(model, self, agent)
+
+    def key(self, agent: str | None, messages: list[ModelMessage], parameters: ModelRequestParameters) -> str:
+        """Hash identifying a request across runs."""
+        tools = sorted(tool.name for tool in (*parameters.function_tools, *parameters.output_tools))
+        dumped = ModelMessagesTypeAdapter.dump_python(messages, mode="json")
+        payload = {"agent": agent, "tools": tools, "messages": [self._canonical(message) for message in dumped]}
+        content = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(content.encode()).hexdigest()[:32]
+
+    async def record(
+        self,
+        model: Model,
+        agent: str | None,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        """Send a request to the model and record it with its response and latency."""
+        started = time.perf_counter()
+        response = await model.request(messages, model_settings, parameters)
+        latency = time.perf_counter() - started
+
+        entry = CassetteEntry(
+            key=self.key(agent, messages, parameters),
+            agent=agent,
+            node=current_scope().node,
+            model=f"{model.system}:{model.model_name}",
+            latency=latency,
+            request=_compact(ModelMessagesTypeAdapter.dump_python(messages[-1:], mode="json")[0]),
+            response=_compact(ModelMessagesTypeAdapter.dump_python([response], mode="json")[0]),
+        )
+        self._add(entry)
+        self.stats.recorded += 1
+        if self.verbose:
+            print(f"Recorded {agent} request {entry.key} ({latency:.3f}s)")
+        return response
+
+    async def replay(
+        self, agent: str | None, messages: list[ModelMessage], parameters: ModelRequestParameters
+    ) -> ModelResponse:
+        """Answer a request with its recorded response.
+
+        Raises:
+            CassetteMissError: If the request was not recorded
+        """
+        key = self.key(agent, messages, parameters)
+        entries = self._by_key.get(key)
+        if not entries:
+            self.stats.misses += 1
+            raise CassetteMissError(f"No recorded response for {agent} request {key} on cassette {self.path}")
+
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        entry = entries[served % len(entries)]
+        if self.reproduce_latency:
+            await asyncio.sleep(entry.latency * self.latency_scale)
+
+        self.stats.replayed += 1
+        if self.verbose:
+            print(f"Replayed {agent} request {key}")
+        response = ModelMessagesTypeAdapter.validate_python([entry.response])[0]
+        assert isinstance(response, ModelResponse)
+        return response
+
+    def save(self) -> None:
+        """Write the recorded requests to the cassette file, replacing it."""
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        with self._open(temporary, "wt") as file:
+            header = {"version": CASSETTE_VERSION, "created": datetime.now(UTC).isoformat(timespec="seconds")}
+            file.write(json.dumps(header) + "\n")
+            for entry in self.entries:
+                file.write(json.dumps(vars(entry), separators=(",", ":"), ensure_ascii=False) + "\n")
+        os.replace(temporary, self.path)
+        if self.verbose:
+            print(f"Saved {len(self.entries)} requests to {self.path}")
+
+    def load(self) -> None:
+        """Read the recorded requests from the cassette file."""
+        with self._open(self.path, "rt") as file:
+            lines = iter(file)
+            header = json.loads(next(lines))
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(f"Unsupported cassette version {header.get('version')} in {self.path}")
+            for line in lines:
+                if line.strip():
+                    self._add(CassetteEntry(**json.loads(line)))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[CassetteEntry]:
+        return iter(self.entries)
+
+    def _add(self, entry: CassetteEntry) -> None:
+        self.entries.append(entry)
+        self._by_key.setdefault(entry.key, []).append(entry)
+
+    def _canonical(self, message: dict[str, Any]) -> dict[str, Any]:
+        parts = []
+        for part in message["parts"]:
+            fields = {name: part[name] for name in _KEY_FIELDS if name in part}
+            if part["part_kind"] in ("tool-return", "retry-prompt") and not self.match_tool_results:
+                fields.pop("content", None)
+            parts.append(fields)
+        return {"kind": message["kind"], "instructions": message.get("instructions"), "parts": parts}
+
+    @staticmethod
+    def _open(path: Path, mode: str) -> IO[str]:
+        if path.name.endswith(".gz") or path.name.endswith(".gz.tmp"):
+            return gzip.open(path, mode, encoding="utf-8")  # type: ignore[return-value]
+        return path.open(mode, encoding="utf-8")
+
+
+class CassetteModel(WrapperModel):
+    """Model whose requests are recorded to, or replayed from, a cassette.
+
+    Args:
+        wrapped: Model the requests are addressed to
+        cassette: Cassette recording or replaying the requests
+        agent: Name of the agent making the requests
+    """
+
+    def __init__(self, wrapped: Model | str, cassette: Cassette, agent: str | None = None) -> None:
+        if isinstance(wrapped, str) and cassette.mode is CassetteMode.REPLAY:
+            # Replayed requests never reach the provider, so it does not need credentials
+            wrapped = infer_model(wrapped, provider_factory=_offline_provider)
+        super().__init__(wrapped)
+        self.cassette = cassette
+        self.agent = agent
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        if self.cassette.mode is CassetteMode.REPLAY:
+            return await self.cassette.replay(self.agent, messages, model_request_parameters)
+        return await self.cassette.record(self.wrapped, self.agent, messages, model_settings, model_request_parameters)
+
+
+def _offline_provider(name: str) -> Provider[Any]:
+    try:
+        return infer_provider(name)
+    except Exception:
+        return infer_provider_class(name)(api_key="cassette-replay")  # type: ignore[call-arg]
+
+
+def _compact(value: Any) -> Any:
+    """Drop unset fields of a serialized message, which are restored as defaults when loading."""
+    if isinstance(value, dict):
+        return {key: _compact(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [_compact(item) for item in value]
+    return value
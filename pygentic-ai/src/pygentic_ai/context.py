@@ -0,0 +1,85 @@
+"""Execution scope shared by workflow nodes and agent calls."""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pygentic_ai.cassettes import Cassette
+    from pygentic_ai.deferred import BatchCollector
+    from pygentic_ai.profiling import RunProfile
+
+
+@dataclass(frozen=True)
+class ExecutionScope:
+    """Attributes describing the workflow step an agent call belongs to.
+
+    The scope is stored in a context variable, so it follows the code path
+    of a single workflow run (including tasks spawned from it) without
+    having to be threaded through every agent method.
+
+    Attributes:
+        run_id: Identifier of the workflow run
+        node: Name of the workflow node currently executing
+        tenant: Tenant the run is attributed to
+        session_id: Conversation session the run belongs to
+        deadline: ``time.monotonic()`` value by which agent calls must finish
+        lane: Scheduling lane of the agent calls (see ``LaneScheduler``)
+        batch_collector: Collector deferring the agent calls to provider batch jobs
+        cassette: Cassette recording or replaying the model requests of the agent calls
+        profile: Profile timing the agent calls of a profiled run (see ``Profiler``)
+    """
+
+    run_id: str | None = None
+    node: str | None = None
+    tenant: str | None = None
+    session_id: str | None = None
+    deadline: float | None = None
+    lane: str | None = None
+    batch_collector: "BatchCollector | None" = None
+    cassette: "Cassette | None" = None
+    profile: "RunProfile | None" = None
+
+    def remaining(self) -> float | None:
+        """Seconds left until the deadline, or None if there is no deadline."""
+        return self.deadline - time.monotonic() if self.deadline is not None else None
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when an agent call does not finish before the deadline of its scope."""
+
+
+_current_scope: ContextVar[ExecutionScope] = ContextVar("pygentic_ai_execution_scope", default=ExecutionScope())
+
+
+def current_scope() -> ExecutionScope:
+    """Get the execution scope of the current context."""
+    return _current_scope.get()
+
+
+@contextmanager
+def execution_scope(**attributes: Any) -> Iterator[ExecutionScope]:
+    """Extend the current execution scope for the duration of a block.
+
+    Attributes passed as ``None`` keep the value inherited from the outer scope.
+    A nested ``deadline`` can only tighten the inherited one.
+
+    Example:
+        ```python
+        with execution_scope(run_id="run-1", tenant="acme"):
+            await agent.generate_response("Hello")
+        ```
+    """
+    current = _current_scope.get()
+    overrides = {key: value for key, value in attributes.items() if value is not None}
+    if "deadline" in overrides and current.deadline is not None:
+        overrides["deadline"] = min(overrides["deadline"], current.deadline)
+    scope = replace(current, **overrides)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
@@ -0,0 +1,463 @@
+"""Deferred agent calls submitted as provider batch jobs."""
+
+import asyncio
+import json
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+_FINAL_BATCH_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchJobError(RuntimeError):
+    """Raised for a deferred request whose batch job failed or returned no result for it."""
+
+
+@dataclass
+class DeferredRequest:
+    """A model request waiting to be submitted in a batch job.
+
+    Attributes:
+        custom_id: Identifier mapping the batch result back to the request
+        model: Model the request is addressed to
+        messages: Messages of the request
+        model_settings: Model settings of the request
+        parameters: Tools and output mode of the request
+    """
+
+    custom_id: str
+    model: Model
+    messages: list[ModelMessage]
+    model_settings: ModelSettings | None
+    parameters: ModelRequestParameters
+
+
+@dataclass
+class DeferredStats:
+    """Statistics of deferred requests and batch jobs."""
+
+    requests: int = 0
+    jobs_submitted: int = 0
+    jobs_completed: int = 0
+    jobs_failed: int = 0
+    failed_requests: int = 0
+    turnaround_time: float = 0.0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.jobs_submitted if self.jobs_submitted else 0.0
+
+    @property
+    def mean_turnaround(self) -> float:
+        finished = self.jobs_completed + self.jobs_failed
+        return self.turnaround_time / finished if finished else 0.0
+
+
+class BatchBackend(ABC):
+    """Provider batch API used by a ``BatchCollector``."""
+
+    max_batch_size: int = 50_000
+
+    @abstractmethod
+    async def submit(self, requests: Sequence[DeferredRequest]) -> str:
+        """Submit requests to the same model as one batch job and return its identifier."""
+
+    @abstractmethod
+    async def poll(self, job_id: str) -> bool:
+        """Check whether a batch job has finished (successfully or not)."""
+
+    @abstractmethod
+    async def results(self, job_id: str) -> dict[str, ModelResponse | Exception]:
+        """Get the response (or error) of every request of a finished batch job by custom id."""
+
+
+class LocalBatchBackend(BatchBackend):
+    """Batch backend running jobs in-process, for tests and offline development.
+
+    Jobs finish ``turnaround`` seconds after submission and their requests
+    are then sent to ``model`` (or to the model each request was addressed to).
+
+    Args:
+        model: Model answering every request, e.g. a ``TestModel`` or ``FunctionModel``
+        turnaround: Seconds between submission and completion of a job
+
+    Example:
+        ```python
+        from pydantic_ai.models.test import TestModel
+        from pygentic_ai.deferred import BatchCollector, LocalBatchBackend
+
+        collector = BatchCollector(LocalBatchBackend(TestModel(), turnaround=1.0), poll_interval=0.1)
+        ```
+    """
+
+    def __init__(self, model: Model | None = None, turnaround: float = 0.0) -> None:
+        self.model = model
+        self.turnaround = turnaround
+        self.jobs: dict[str, list[DeferredRequest]] = {}
+        self._submitted_at: dict[str, float] = {}
+
+    async def submit(self, requests: Sequence[DeferredRequest]) -> str:
+        job_id = f"batch_{uuid.uuid4().hex}"
+        self.jobs[job_id] = list(requests)
+        self._submitted_at[job_id] = time.monotonic()
+        return job_id
+
+    async def poll(self, job_id: str) -> bool:
+        return time.monotonic() - self._submitted_at[job_id] >= self.turnaround
+
+    async def results(self, job_id: str) -> dict[str, ModelResponse | Exception]:
+        requests = self.jobs[job_id]
+        outcomes = await asyncio.gather(
+            *(
+                (self.model or request.model).request(request.messages, request.model_settings, request.parameters)
+                for request in requests
+            ),
+            return_exceptions=True,
+        )
+        results: dict[str, ModelResponse | Exception] = {}
+        for request, outcome in zip(requests, outcomes, strict=True):
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+            results[request.custom_id] = outcome
+        return results
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """Batch backend using the OpenAI Batch API for OpenAI chat models.
+
+    Requests are written to a JSONL file, uploaded and run as a
+    ``/v1/chat/completions`` batch job. Bodies and results are translated
+    through the public ``request`` method of a Pydantic AI OpenAI chat model
+    configured like the one the requests are addressed to, talking to an
+    in-memory transport: it captures the body instead of sending it and is
+    later answered with the batch output. Messages, tools, output modes
+    (tool, native, prompted) and model settings are therefore mapped exactly
+    as for a direct call.
+
+    Args:
+        client: ``openai.AsyncOpenAI`` client (defaults to the model's client)
+        completion_window: Completion window of the batch jobs
+    """
+
+    def __init__(self, client: Any = None, completion_window: str = "24h") -> None:
+        self.client = client
+        self.completion_window = completion_window
+        self._jobs: dict[str, _OpenAIBatchJob] = {}
+
+    async def submit(self, requests: Sequence[DeferredRequest]) -> str:
+        model = _unwrap(requests[0].model)
+        client = self.client or model.client  # type: ignore[attr-defined]
+        codec = _ChatCompletionCodec(model)
+        try:
+            lines = [
+                json.dumps(
+                    {
+                        "custom_id": request.custom_id,
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": await codec.body(request),
+                    }
+                )
+                for request in requests
+            ]
+            file = await client.files.create(file=("batch.jsonl", "\n".join(lines).encode()), purpose="batch")
+            batch = await client.batches.create(
+                input_file_id=file.id, endpoint="/v1/chat/completions", completion_window=self.completion_window
+            )
+        except BaseException:
+            await codec.aclose()
+            raise
+        by_id = {request.custom_id: request for request in requests}
+        self._jobs[batch.id] = _OpenAIBatchJob(client, batch, codec, by_id)
+        return batch.id
+
+    async def poll(self, job_id: str) -> bool:
+        job = self._jobs[job_id]
+        job.batch = await job.client.batches.retrieve(job_id)
+        return job.batch.status in _FINAL_BATCH_STATUSES
+
+    async def results(self, job_id: str) -> dict[str, ModelResponse | Exception]:
+        job = self._jobs.pop(job_id)
+        try:
+            return await self._read_results(job)
+        finally:
+            await job.codec.aclose()
+
+    @staticmethod
+    async def _read_results(job: "_OpenAIBatchJob") -> dict[str, ModelResponse | Exception]:
+        results: dict[str, ModelResponse | Exception] = {}
+        for file_id in (job.batch.output_file_id, job.batch.error_file_id):
+            if not file_id:
+                continue
+            content = await job.client.files.content(file_id)
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                request = job.requests.get(record.get("custom_id"))
+                response = record.get("response") or {}
+                if request is None:
+                    continue
+                if response.get("status_code") == 200:
+                    results[request.custom_id] = await job.codec.response(request, response["body"])
+                else:
+                    results[request.custom_id] = BatchJobError(
+                        f"Batch request failed: {record.get('error') or response.get('body')}"
+                    )
+        return results
+
+
+@dataclass
+class _OpenAIBatchJob:
+    client: Any
+    batch: Any
+    codec: "_ChatCompletionCodec"
+    requests: dict[str, DeferredRequest]
+
+
+class _ChatCompletionCodec:
+    """Maps requests to chat completion bodies and completions back to responses.
+
+    Calls are sequential: the transport holds one captured body and one reply at a time.
+    """
+
+    def __init__(self, model: Model) -> None:
+        import httpx
+        from openai import AsyncOpenAI
+        from pydantic_ai.models.openai import OpenAIChatModel
+        from pydantic_ai.providers.openai import OpenAIProvider
+
+        if not isinstance(model, OpenAIChatModel):
+            raise TypeError(f"OpenAIBatchBackend needs an OpenAI chat model, not {model.system}:{model.model_name}")
+        self._captured: dict[str, Any] = {}
+        self._reply: dict[str, Any] = {}
+        self._client = AsyncOpenAI(
+            api_key="batch",
+            base_url="http://batch.invalid/v1",
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self._exchange)),
+        )
+        self.model = OpenAIChatModel(
+            model.model_name,
+            provider=OpenAIProvider(openai_client=self._client),
+            profile=model.profile,
+            settings=model.settings,
+        )
+
+    async def body(self, request: DeferredRequest) -> dict[str, Any]:
+        """Chat completion body the model would send for the request."""
+        self._reply = _placeholder_completion(self.model.model_name)
+        await self.model.request(request.messages, request.model_settings, request.parameters)
+        return self._captured
+
+    async def response(self, request: DeferredRequest, completion: dict[str, Any]) -> ModelResponse:
+        """Model response for the chat completion returned by the batch job."""
+        self._reply = completion
+        return await self.model.request(request.messages, request.model_settings, request.parameters)
+
+    async def aclose(self) -> None:
+        """Close the local OpenAI client and its HTTP client."""
+        await self._client.close()
+
+    def _exchange(self, http_request: Any) -> Any:
+        import httpx
+
+        self._captured = json.loads(http_request.content)
+        return httpx.Response(200, json=self._reply)
+
+
+def _placeholder_completion(model_name: str) -> dict[str, Any]:
+    return {
+        "id": "batch-capture",
+        "object": "chat.completion",
+        "created": 0,
+        "model": model_name,
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": ""}}],
+    }
+
+
+def _unwrap(model: Model) -> Model:
+    while isinstance(model, WrapperModel):
+        model = model.wrapped
+    return model
+
+
+class BatchCollector:
+    """Collects model requests of deferred agent calls into batch jobs.
+
+    Requests are buffered until ``max_batch_size`` of them are waiting or
+    ``max_wait`` seconds have passed since the first one, then submitted
+    (one job per model) to the backend. Jobs are polled every
+    ``poll_interval`` seconds and their results handed back to the awaiting
+    agent calls, so workflow code runs unchanged, only slower and cheaper.
+
+    Agent calls made inside ``execution_scope(batch_collector=collector)``
+    (e.g. by ``BatchRunner(collector=...)``) are deferred, whichever agent
+    (router, generator, translator, ...) makes them.
+
+    Args:
+        backend: Provider batch API
+        max_batch_size: Maximum number of requests per job (defaults to the backend limit)
+        max_wait: Seconds a request waits for more requests before its job is submitted
+        poll_interval: Seconds between job status checks
+        verbose: Whether to print job submissions and completions
+
+    Example:
+        ```python
+        from pygentic_ai.deferred import BatchCollector, OpenAIBatchBackend
+        from pygentic_ai.workflows import BatchRunner
+
+        collector = BatchCollector(OpenAIBatchBackend(), max_wait=30.0, poll_interval=60.0)
+        runner = BatchRunner(manager, concurrency=5000, collector=collector)
+        await runner.run("messages.jsonl", "results.jsonl")
+        ```
+    """
+
+    def __init__(
+        self,
+        backend: BatchBackend,
+        max_batch_size: int | None = None,
+        max_wait: float = 5.0,
+        poll_interval: float = 30.0,
+        verbose: bool = False,
+    ) -> None:
+        self.backend = backend
+        self.max_batch_size = max_batch_size or backend.max_batch_size
+        self.max_wait = max_wait
+        self.poll_interval = poll_interval
+        self.verbose = verbose
+        self.stats = DeferredStats()
+        self._pending: list[tuple[DeferredRequest, asyncio.Future[ModelResponse]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._jobs: set[asyncio.Task[None]] = set()
+
+    def wrap(self, model: Model | str) -> "DeferredBatchModel":
+        """Wrap a model so that its requests are deferred to batch jobs."""
+        return DeferredBatchModel(model, self)
+
+    async def request(
+        self,
+        model: Model,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        """Queue a model request for the next batch job and wait for its response."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ModelResponse] = loop.create_future()
+        entry = (DeferredRequest(uuid.uuid4().hex, model, messages, model_settings, parameters), future)
+        self._pending.append(entry)
+        self.stats.requests += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if entry in self._pending:
+                self._pending.remove(entry)
+            raise
+
+    async def flush(self) -> None:
+        """Submit the waiting requests without waiting for ``max_wait``."""
+        self._flush()
+
+    async def drain(self) -> None:
+        """Submit the waiting requests and wait until every job has finished."""
+        self._flush()
+        while self._jobs:
+            await asyncio.gather(*self._jobs, return_exceptions=True)
+
+    @property
+    def pending(self) -> int:
+        """Number of requests waiting to be submitted."""
+        return len(self._pending)
+
+    @property
+    def jobs_in_flight(self) -> int:
+        """Number of submitted jobs that have not finished."""
+        return len(self._jobs)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+
+        groups: dict[tuple[str, str], list[tuple[DeferredRequest, asyncio.Future[ModelResponse]]]] = {}
+        for request, future in pending:
+            if not future.done():
+                groups.setdefault((request.model.system, request.model.model_name), []).append((request, future))
+        for group in groups.values():
+            for start in range(0, len(group), self.max_batch_size):
+                job = asyncio.create_task(self._run_job(group[start : start + self.max_batch_size]))
+                self._jobs.add(job)
+                job.add_done_callback(self._jobs.discard)
+
+    async def _run_job(self, batch: list[tuple[DeferredRequest, asyncio.Future[ModelResponse]]]) -> None:
+        submitted = time.monotonic()
+        try:
+            job_id = await self.backend.submit([request for request, _ in batch])
+            self.stats.jobs_submitted += 1
+            if self.verbose:
+                print(f"Batch job {job_id} submitted with {len(batch)} requests")
+            finished = await self.backend.poll(job_id)
+            while not finished:
+                await asyncio.sleep(self.poll_interval)
+                finished = await self.backend.poll(job_id)
+            results = await self.backend.results(job_id)
+        except Exception as e:
+            self.stats.jobs_failed += 1
+            self.stats.turnaround_time += time.monotonic() - submitted
+            if self.verbose:
+                print(f"Batch job of {len(batch)} requests failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(BatchJobError(f"Batch job failed: {e}"))
+            return
+
+        self.stats.jobs_completed += 1
+        self.stats.turnaround_time += time.monotonic() - submitted
+        if self.verbose:
+            print(f"Batch job {job_id} completed in {time.monotonic() - submitted:.1f}s")
+        for request, future in batch:
+            if future.done():
+                continue
+            outcome = results.get(request.custom_id) or BatchJobError(f"No result for request {request.custom_id}")
+            if isinstance(outcome, Exception):
+                self.stats.failed_requests += 1
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
+class DeferredBatchModel(WrapperModel):
+    """Model sending its requests through a ``BatchCollector`` instead of calling the provider directly.
+
+    Args:
+        wrapped: Model the requests are addressed to
+        collector: Collector submitting the requests as batch jobs
+    """
+
+    def __init__(self, wrapped: Model | str, collector: BatchCollector) -> None:
+        super().__init__(wrapped)
+        self.collector = collector
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        return await self.collector.request(self.wrapped, messages, model_settings, model_request_parameters)
@@ -1,10 +1,23 @@
 """Engine components for building AI agents."""
 
-from pygentic_ai.engines.base import BaseAgent, BaseAgentDeps
-from pygentic_ai.engines.guardrails import GuardrailsAgent, GuardrailsDeps
-from pygentic_ai.engines.reasoning import ReasoningAgent, ReasoningAgentDeps
-from pygentic_ai.engines.routers import GenericRouter, RouterDeps, RoutingResponse
-from pygentic_ai.engines.translators import SimpleTranslatorWorker, TranslatorDeps
+from typing import TYPE_CHECKING
+
+from pygentic_ai.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pygentic_ai.engines.base import BaseAgent, BaseAgentDeps
+    from pygentic_ai.engines.guardrails import GuardrailsAgent, GuardrailsDeps
+    from pygentic_ai.engines.reasoning import ReasoningAgent, ReasoningAgentDeps, RoutedAnswer
+    from pygentic_ai.engines.routers import GenericRouter, RouterDeps, RoutingResponse
+    from pygentic_ai.engines.translators import SimpleTranslatorWorker, TranslatorDeps
+
+_EXPORTS = {
+    "pygentic_ai.engines.base": ["BaseAgent", "BaseAgentDeps"],
+    "pygentic_ai.engines.guardrails": ["GuardrailsAgent", "GuardrailsDeps"],
+    "pygentic_ai.engines.reasoning": ["ReasoningAgent", "ReasoningAgentDeps", "RoutedAnswer"],
+    "pygentic_ai.engines.routers": ["GenericRouter", "RouterDeps", "RoutingResponse"],
+    "pygentic_ai.engines.translators": ["SimpleTranslatorWorker", "TranslatorDeps"],
+}
 
 __all__ = [
     "BaseAgent",
@@ -18,4 +31,7 @@ __all__ = [
     "GuardrailsDeps",
     "ReasoningAgent",
     "ReasoningAgentDeps",
+    "RoutedAnswer",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,14 +1,23 @@
 """Base agent classes for building custom AI agents."""
 
+import asyncio
+import time
 from abc import ABC
 from dataclasses import dataclass
 from typing import Any, Callable
 
 from pydantic_ai import Agent, RunContext, UsageLimits
-from pydantic_ai.mcp import MCPServerStreamableHTTP
 from pydantic_ai.messages import ModelMessage
+from pydantic_ai.models import Model
 from pydantic_ai.run import AgentRunResult
 
+from pygentic_ai.context import DeadlineExceededError, ExecutionScope, current_scope
+from pygentic_ai.mcp import MCPConnectionPool, PooledMCPServer, mcp_pool
+from pygentic_ai.profiling import ProfiledModel, profiled_tool
+from pygentic_ai.scheduling import LaneScheduler
+from pygentic_ai.tools.executor import ToolExecutor
+from pygentic_ai.tools.selection import ToolSelector
+from pygentic_ai.usage import UsageLedger, usage_ledger
 from pygentic_ai.utils.llm_vendor import set_api_key_for_vendor
 
 
@@ -48,6 +57,11 @@ class BaseAgent(ABC):
         instructions: Callable | str | None = None,
         mcp_urls: list[str] | None = None,
         usage_limits: UsageLimits | None = None,
+        ledger: UsageLedger | None = None,
+        mcp_connection_pool: MCPConnectionPool | None = None,
+        tool_executor: ToolExecutor | None = None,
+        tool_selector: ToolSelector | None = None,
+        scheduler: LaneScheduler | None = None,
         **kwargs,
     ) -> None:
         self.language = language
@@ -55,14 +69,18 @@ class BaseAgent(ABC):
         self.chat_history: list[ModelMessage] = []
         self.mcp_urls = mcp_urls or []
         self.usage_limits = usage_limits
+        self.ledger = ledger if ledger is not None else usage_ledger
+        self.mcp_pool = mcp_connection_pool if mcp_connection_pool is not None else mcp_pool
+        self.mcp_servers: list[PooledMCPServer] = []
+        self.scheduler = scheduler
 
         if api_key:
             set_api_key_for_vendor(llm_vendor, api_key)
 
         final_instructions = system_prompt or instructions
         model_string = f"{llm_vendor}:{llm_model}"
+        self.model_name = model_string
 
-        toolsets = []
         if self.mcp_urls:
             for mcp_url in self.mcp_urls:
                 try:
@@ -71,8 +89,7 @@ class BaseAgent(ABC):
                             print(f"Invalid MCP URL format: {mcp_url}")
                         continue
 
-                    mcp_server = MCPServerStreamableHTTP(mcp_url)
-                    toolsets.append(mcp_server)
+                    self.mcp_servers.append(self.mcp_pool.get(mcp_url))
                     if self.verbose:
                         print(f"MCP server enabled: {mcp_url}")
                 except Exception as e:
@@ -80,17 +97,24 @@ class BaseAgent(ABC):
                         print(f"Failed to initialize MCP server {mcp_url}: {e}")
                     continue
 
+        tools = tool_list or []
+        if tool_executor is not None:
+            tools = tool_executor.wrap_all(tools)
+        tools = [profiled_tool(tool) for tool in tools]
+
         agent_kwargs: dict[str, Any] = {
             "model": model_string,
-            "tools": tool_list or [],
+            "tools": tools,
             "deps_type": deps_type,
         }
-        if toolsets:
-            agent_kwargs["toolsets"] = toolsets
+        if self.mcp_servers:
+            agent_kwargs["toolsets"] = list(self.mcp_servers)
         if final_instructions:
             agent_kwargs["instructions"] = final_instructions
         if output_type is not None:
             agent_kwargs["output_type"] = output_type
+        if tool_selector is not None:
+            agent_kwargs["prepare_tools"] = tool_selector.prepare_tools
 
         self.agent = Agent(**agent_kwargs)
 
@@ -98,13 +122,45 @@ class BaseAgent(ABC):
         def add_language_context(ctx: RunContext[BaseAgentDeps]) -> str:
             return f"Please respond in {ctx.deps.language} language."
 
+    async def initialize(self) -> None:
+        """Open long-lived sessions to the agent's MCP servers and discover their tools.
+
+        Called by ``AgentManager.initialize``. Sessions and tool listings are
+        shared with every other agent using the same MCP server URL.
+        """
+        urls = [server.url for server in self.mcp_servers]
+        results = await asyncio.gather(*(self.mcp_pool.connect(url) for url in urls))
+        if self.verbose:
+            for url, connected in zip(urls, results, strict=True):
+                if not connected:
+                    print(f"MCP server not reachable yet, retrying in background: {url}")
+        await self.mcp_pool.discover(urls)
+
     async def generate_response(
         self,
         query: str,
         chat_history: list[ModelMessage] | None = None,
+        *,
+        language: str | None = None,
+        model: Model | str | None = None,
+        usage_limits: UsageLimits | None = None,
+        deps: BaseAgentDeps | None = None,
     ) -> AgentRunResult:
-        """Generate response using Pydantic AI agent."""
-        deps = BaseAgentDeps(language=self.language)
+        """Generate response using Pydantic AI agent.
+
+        Overrides apply to this call only, so one agent instance can serve
+        concurrent requests in different languages or with different models.
+
+        Args:
+            query: User message
+            chat_history: Previous messages of the conversation
+            language: Response language (defaults to the agent language)
+            model: Model to use instead of the configured one
+            usage_limits: Usage limits to use instead of the configured ones
+            deps: Dependencies to pass to the agent (takes precedence over ``language``)
+        """
+        if deps is None:
+            deps = BaseAgentDeps(language=language or self.language)
 
         run_kwargs: dict[str, Any] = {
             "user_prompt": query,
@@ -112,12 +168,78 @@ class BaseAgent(ABC):
             "deps": deps,
         }
 
-        if self.usage_limits:
-            run_kwargs["usage_limits"] = self.usage_limits
+        usage_limits = usage_limits or self.usage_limits
+        if usage_limits:
+            run_kwargs["usage_limits"] = usage_limits
 
-        result = await self.agent.run(**run_kwargs)
+        result = await self._run(model=model, **run_kwargs)
 
         if self.verbose:
             print(f"Usage: {result.usage()}")
 
         return result
+
+    async def _run(self, model: Model | str | None = None, **run_kwargs: Any) -> AgentRunResult:
+        """Run the Pydantic AI agent and record its usage in the ledger.
+
+        With a scheduler, the run waits for a slot in the lane of the
+        execution scope and its tokens are charged to that lane. If the scope
+        has a batch collector, the run's model requests are deferred to
+        provider batch jobs instead; if it has a cassette, they are recorded
+        to or replayed from it. In a profiled run, the time of the run and of
+        its model requests is added to the profile. If the scope has a
+        deadline, the run (including its wait for a slot) is cancelled when
+        it passes, closing its provider connection, and
+        ``DeadlineExceededError`` is raised.
+        """
+        if model is not None:
+            run_kwargs["model"] = model
+
+        scope = current_scope()
+        if scope.batch_collector is not None:
+            run_kwargs["model"] = scope.batch_collector.wrap(model or self.agent.model or self.model_name)
+        if scope.cassette is not None:
+            run_kwargs["model"] = scope.cassette.wrap(
+                run_kwargs.get("model") or self.agent.model or self.model_name, agent=type(self).__name__
+            )
+        if scope.profile is not None:
+            run_kwargs["model"] = ProfiledModel(
+                run_kwargs.get("model") or self.agent.model or self.model_name, scope.profile
+            )
+
+        if scope.deadline is None:
+            result = await self._scheduled_run(scope, run_kwargs)
+        else:
+            remaining = scope.deadline - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceededError(f"No time left for {type(self).__name__} call")
+            try:
+                async with asyncio.timeout(remaining):
+                    result = await self._scheduled_run(scope, run_kwargs)
+            except TimeoutError as e:
+                raise DeadlineExceededError(f"{type(self).__name__} call did not finish before the deadline") from e
+
+        self.ledger.record(result.usage(), model=self._model_label(model), agent=type(self).__name__)
+        return result
+
+    async def _scheduled_run(self, scope: ExecutionScope, run_kwargs: dict[str, Any]) -> AgentRunResult:
+        # Deferred calls wait for a batch job, not for provider capacity
+        if self.scheduler is None or scope.batch_collector is not None:
+            return await self._agent_run(scope, run_kwargs)
+        async with self.scheduler.slot(scope.lane):
+            result = await self._agent_run(scope, run_kwargs)
+        self.scheduler.record_tokens(scope.lane, result.usage().total_tokens)
+        return result
+
+    async def _agent_run(self, scope: ExecutionScope, run_kwargs: dict[str, Any]) -> AgentRunResult:
+        if scope.profile is None:
+            return await self.agent.run(**run_kwargs)
+        with scope.profile.agent(type(self).__name__):
+            return await self.agent.run(**run_kwargs)
+
+    def _model_label(self, model: Model | str | None) -> str:
+        if model is None:
+            return self.model_name
+        if isinstance(model, str):
+            return model
+        return f"{model.system}:{model.model_name}"
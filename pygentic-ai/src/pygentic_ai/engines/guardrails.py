@@ -1,16 +1,24 @@
 """Guardrails agent for output validation and reformatting."""
 
+import re
 from dataclasses import dataclass
 
+from pydantic_ai import UsageLimits
+from pydantic_ai.models import Model
+
 from pygentic_ai.engines.base import BaseAgent, BaseAgentDeps
 from pygentic_ai.prompts.worker_prompts import get_guardrails_instructions
 
+_EMOJI_PATTERN = re.compile("[\U0001f000-\U0001faff\u2600-\u27bf\u2b50\u2b55\ufe0f]")
+_EMOTICON_PATTERN = re.compile(r"(?<![\w:])[:;=][-o']?[)(\]\[DPp|/\\](?!\w)")
+_ANSWER_PREFIX_PATTERN = re.compile(r"\s*\**answer\**\s*:", re.IGNORECASE)
+
 
 @dataclass
 class GuardrailsDeps(BaseAgentDeps):
     """Dependencies for the guardrails agent."""
 
-    pass
+    soft_word_limit: int = 250
 
 
 class GuardrailsAgent(BaseAgent):
@@ -44,6 +52,11 @@ class GuardrailsAgent(BaseAgent):
         message: str,
         api_key: str | None = None,
         soft_word_limit: int = 250,
+        *,
+        language: str | None = None,
+        model: Model | str | None = None,
+        usage_limits: UsageLimits | None = None,
+        deps: GuardrailsDeps | None = None,
     ) -> str:
         """Reformat and validate output message.
 
@@ -51,6 +64,10 @@ class GuardrailsAgent(BaseAgent):
             message: Message to reformat
             api_key: API key for the model (unused, kept for compatibility)
             soft_word_limit: Maximum word count
+            language: Output language (defaults to the agent language)
+            model: Model to use for this call instead of the configured one
+            usage_limits: Usage limits for this call
+            deps: Dependencies to pass to the agent (takes precedence over ``language`` and ``soft_word_limit``)
 
         Returns:
             Reformatted message
@@ -58,11 +75,14 @@ class GuardrailsAgent(BaseAgent):
         if self.verbose:
             print(f"Formatting: \n -------- \n *Input* -> {message}")
 
-        deps = GuardrailsDeps(language=self.language)
+        if deps is None:
+            deps = GuardrailsDeps(language=language or self.language, soft_word_limit=soft_word_limit)
 
-        result = await self.agent.run(
+        result = await self._run(
             user_prompt=message,
             deps=deps,
+            model=model,
+            usage_limits=usage_limits,
         )
 
         formatted_message = str(result.output)
@@ -72,5 +92,30 @@ class GuardrailsAgent(BaseAgent):
 
         return formatted_message
 
+    def validate(self, message: str, soft_word_limit: int = 250, tolerance: float = 1.25) -> list[str]:
+        """Check a message against the formatting guidelines without calling the model.
+
+        Covers the rules that can be checked locally: emoticons, the "Answer:"
+        prefix and the word limit (exceeded by more than ``tolerance``, as the
+        limit is a soft one). The response language is not checked.
+
+        Args:
+            message: Message to check
+            soft_word_limit: Approximate maximum word count
+            tolerance: Factor by which the word limit may be exceeded
+
+        Returns:
+            Descriptions of the violated rules (empty if the message is valid)
+        """
+        violations = []
+        if _EMOJI_PATTERN.search(message) or _EMOTICON_PATTERN.search(message):
+            violations.append("contains emoticons")
+        if _ANSWER_PREFIX_PATTERN.match(message):
+            violations.append('starts with "Answer:"')
+        word_count = len(message.split())
+        if word_count > soft_word_limit * tolerance:
+            violations.append(f"has {word_count} words, limit is around {soft_word_limit}")
+        return violations
+
     # Alias for backward compatibility
     refformat = reformat
@@ -1,9 +1,17 @@
 """Reasoning agent for general-purpose AI interactions."""
 
 from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_ai import RunContext, UsageLimits
+from pydantic_ai.messages import ModelMessage
+from pydantic_ai.models import Model
+from pydantic_ai.run import AgentRunResult
 
 from pygentic_ai.engines.base import BaseAgent, BaseAgentDeps
-from pygentic_ai.prompts.agent_prompts import get_instructions_for_mode
+from pygentic_ai.prompts.agent_prompts import get_instructions_for_mode, get_output_constraints
+from pygentic_ai.prompts.registry import prompt_registry
 from pygentic_ai.schemas import AgentMode
 
 
@@ -14,14 +22,35 @@ class ReasoningAgentDeps(BaseAgentDeps):
     pass
 
 
+class RoutedAnswer(BaseModel):
+    """Structured response classifying the message and answering it in one call.
+
+    Attributes:
+        route: The route number (1=conversation, 2=refuse, 3=translate)
+        reasoning: Explanation for the routing decision
+        answer: Draft answer for standard conversation (route 1)
+    """
+
+    route: int
+    reasoning: str
+    answer: str | None = None
+
+
 class ReasoningAgent(BaseAgent):
     """Reasoning agent with tool usage capabilities.
 
     This is a general-purpose agent that can reason about problems and
     use tools to gather information before responding.
 
+    With ``inline_guardrails=True`` the guardrail constraints (language,
+    soft word limit, formatting rules) are part of the agent instructions,
+    and ``GuardrailsNode`` only calls the guardrails model when the answer
+    fails local validation.
+
     Args:
         deps_type: Dependencies type
+        inline_guardrails: Whether the agent follows the guardrail constraints itself
+        soft_word_limit: Approximate maximum answer length used with inline guardrails
         **kwargs: Additional BaseAgent arguments
 
     Example:
@@ -41,7 +70,65 @@ class ReasoningAgent(BaseAgent):
     def __init__(
         self,
         deps_type: type[BaseAgentDeps] = ReasoningAgentDeps,
+        inline_guardrails: bool = False,
+        soft_word_limit: int = 250,
         **kwargs,
     ) -> None:
+        self.inline_guardrails = inline_guardrails
+        self.soft_word_limit = soft_word_limit
         instructions = get_instructions_for_mode(AgentMode.GENERAL)
         super().__init__(deps_type=deps_type, instructions=instructions, **kwargs)
+
+        if inline_guardrails:
+
+            @self.agent.instructions
+            def add_output_constraints(ctx: RunContext[BaseAgentDeps]) -> str:
+                return get_output_constraints(ctx.deps.language, self.soft_word_limit)
+
+    async def route_and_generate(
+        self,
+        query: str,
+        chat_history: list[ModelMessage] | None = None,
+        *,
+        language: str | None = None,
+        model: Model | str | None = None,
+        usage_limits: UsageLimits | None = None,
+        deps: BaseAgentDeps | None = None,
+    ) -> AgentRunResult[RoutedAnswer]:
+        """Classify the message and answer it in a single model call.
+
+        Uses the agent's instructions and tools, so a conversational answer
+        is the same as from ``generate_response``; the answer is only
+        produced for route 1.
+
+        Args:
+            query: User message
+            chat_history: Previous messages of the conversation
+            language: Response language (defaults to the agent language)
+            model: Model to use instead of the configured one
+            usage_limits: Usage limits to use instead of the configured ones
+            deps: Dependencies to pass to the agent (takes precedence over ``language``)
+
+        Returns:
+            Run result with a RoutedAnswer output
+        """
+        if deps is None:
+            deps = ReasoningAgentDeps(language=language or self.language)
+
+        run_kwargs: dict[str, Any] = {
+            "user_prompt": query,
+            "message_history": chat_history or [],
+            "deps": deps,
+            "output_type": RoutedAnswer,
+            "instructions": prompt_registry.text("agent.routed_answer"),
+        }
+        usage_limits = usage_limits or self.usage_limits
+        if usage_limits:
+            run_kwargs["usage_limits"] = usage_limits
+
+        result = await self._run(model=model, **run_kwargs)
+
+        if self.verbose:
+            print(result.output.route, result.output.reasoning)
+
+        return result
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from typing import Callable
 
 from pydantic import BaseModel
+from pydantic_ai import UsageLimits
+from pydantic_ai.models import Model
 
 from pygentic_ai.engines.base import BaseAgent, BaseAgentDeps
 from pygentic_ai.prompts.worker_prompts import get_router_instructions
@@ -62,6 +64,11 @@ class GenericRouter(BaseAgent):
         message: str,
         api_key: str | None = None,
         logging: bool = False,
+        *,
+        language: str | None = None,
+        model: Model | str | None = None,
+        usage_limits: UsageLimits | None = None,
+        deps: RouterDeps | None = None,
     ) -> RoutingResponse:
         """Route message and return classification.
 
@@ -69,12 +76,17 @@ class GenericRouter(BaseAgent):
             message: Message to classify
             api_key: API key for the model (unused, kept for compatibility)
             logging: Whether to log the routing decision
+            language: Conversation language (defaults to the agent language)
+            model: Model to use for this call instead of the configured one
+            usage_limits: Usage limits for this call
+            deps: Dependencies to pass to the agent (takes precedence over ``language``)
 
         Returns:
             RoutingResponse with route and reasoning
         """
-        deps = RouterDeps(language=self.language)
-        result = await self.agent.run(user_prompt=message, deps=deps)
+        if deps is None:
+            deps = RouterDeps(language=language or self.language)
+        result = await self._run(user_prompt=message, deps=deps, model=model, usage_limits=usage_limits)
         routing = result.output
 
         # Type narrowing for ty check
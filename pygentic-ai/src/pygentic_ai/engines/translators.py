@@ -2,10 +2,11 @@
 
 from dataclasses import dataclass
 
-from pydantic_ai import RunContext
+from pydantic_ai import RunContext, UsageLimits
+from pydantic_ai.models import Model
 
 from pygentic_ai.engines.base import BaseAgent, BaseAgentDeps
-from pygentic_ai.prompts.worker_prompts import TEXT_TRANSLATOR_INSTRUCTIONS
+from pygentic_ai.prompts.worker_prompts import get_translator_instructions
 
 
 @dataclass
@@ -42,20 +43,35 @@ class SimpleTranslatorWorker(BaseAgent):
     ) -> None:
         self.target_language = target_language
 
-        instructions = system_prompt or TEXT_TRANSLATOR_INSTRUCTIONS
-        super().__init__(deps_type=TranslatorDeps, instructions=instructions, **kwargs)
+        if system_prompt is None:
+            # One memoized prompt per target language instead of static and dynamic parts joined on every run
+            super().__init__(deps_type=TranslatorDeps, instructions=get_translator_instructions, **kwargs)
+            return
+
+        super().__init__(deps_type=TranslatorDeps, instructions=system_prompt, **kwargs)
 
         @self.agent.instructions
         def add_target_language(ctx: RunContext[TranslatorDeps]) -> str:
             return f"Please translate the following text into {ctx.deps.target_language} language."
 
-    async def translate(self, query: str, language: str | None = None) -> str:
+    async def translate(
+        self,
+        query: str,
+        language: str | None = None,
+        *,
+        model: Model | str | None = None,
+        usage_limits: UsageLimits | None = None,
+        deps: TranslatorDeps | None = None,
+    ) -> str:
         """Translate text to any language.
 
         Args:
             query: Text to translate
             language: Target language (e.g. "polish", "angielski", "español", "中文")
                      If None, uses target_language from constructor
+            model: Model to use for this call instead of the configured one
+            usage_limits: Usage limits for this call
+            deps: Dependencies to pass to the agent (takes precedence over ``language``)
 
         Returns:
             Translated text
@@ -65,11 +81,14 @@ class SimpleTranslatorWorker(BaseAgent):
         if self.verbose:
             print(f"Translating to {target}: {query}")
 
-        deps = TranslatorDeps(language=self.language, target_language=target)
+        if deps is None:
+            deps = TranslatorDeps(language=self.language, target_language=target)
 
-        result = await self.agent.run(
+        result = await self._run(
             user_prompt=query,
             deps=deps,
+            model=model,
+            usage_limits=usage_limits,
         )
 
         if self.verbose:
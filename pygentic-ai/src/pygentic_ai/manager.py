@@ -1,11 +1,43 @@
 """Agent manager for registering and managing agents."""
 
+import asyncio
+import inspect
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager, suppress
 from typing import Any, Callable
 
+AgentFactory = tuple[Callable[..., Any], dict[str, Any]]
+
+
+class _Generation:
+    """Set of agents serving requests between two reloads."""
+
+    def __init__(self, agents: dict[str, Any], version: int) -> None:
+        self.agents = agents
+        self.version = version
+        self.in_flight = 0
+        self.drained = asyncio.Event()
+        self.drained.set()
+
+    def acquire(self) -> None:
+        self.in_flight += 1
+        self.drained.clear()
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        if self.in_flight == 0:
+            self.drained.set()
+
 
 class AgentManager:
     """Registry for agents and workflow components.
 
+    Agent configuration can be changed at runtime with ``reload``: the new
+    agents are built and initialized next to the serving ones, then swapped
+    in atomically. Requests served through ``session`` finish on the agents
+    they started with, and replaced agents are closed once drained.
+    ``to_deps`` is not pinned: use it for requests that need not outlive a reload.
+
     Example:
         ```python
         manager = AgentManager()
@@ -17,7 +49,11 @@ class AgentManager:
 
     def __init__(self) -> None:
         self._agents: dict[str, Any] = {}
-        self._factories: dict[str, tuple[Callable[..., Any], dict[str, Any]]] = {}
+        self._factories: dict[str, AgentFactory] = {}
+        self._generation = _Generation(self._agents, version=0)
+        self._reload_lock = asyncio.Lock()
+        self._retiring: set[asyncio.Task] = set()
+        self._uninitialized: list[Any] = []
 
     def register(self, name: str, agent_class: type, **config: Any) -> "AgentManager":
         """Register an agent with configuration (lazy initialization)."""
@@ -29,16 +65,161 @@ class AgentManager:
         self._agents[name] = instance
         return self
 
-    async def initialize(self) -> None:
-        """Initialize all registered agents from factories."""
+    def build(self) -> None:
+        """Construct registered agents without running their ``initialize`` hooks.
+
+        Lets a parent process build the agents once before forking workers;
+        ``initialize`` then only runs the hooks (e.g. MCP connections) in
+        each worker.
+        """
         for name, (agent_class, config) in self._factories.items():
             if name not in self._agents:
                 instance = agent_class(**config)
-                if hasattr(instance, "initialize") and callable(getattr(instance, "initialize")):
-                    init_method = getattr(instance, "initialize")
-                    if callable(init_method):
-                        await init_method()
                 self._agents[name] = instance
+                self._uninitialized.append(instance)
+
+    async def initialize(self) -> None:
+        """Initialize all registered agents from factories.
+
+        Agents are constructed first and their ``initialize`` hooks (e.g. MCP
+        connection and tool discovery) then run concurrently.
+        """
+        self.build()
+        pending, self._uninitialized = self._uninitialized, []
+        await asyncio.gather(*(self._initialize_instance(instance) for instance in pending))
+
+    @staticmethod
+    async def _initialize_instance(instance: Any) -> None:
+        init_method = getattr(instance, "initialize", None)
+        if callable(init_method):
+            await init_method()
+
+    async def reload(
+        self,
+        updates: dict[str, AgentFactory] | None = None,
+        remove: Iterable[str] = (),
+        wait: bool = False,
+        drain_timeout: float | None = 60.0,
+    ) -> list[str]:
+        """Swap in a new agent configuration without interrupting in-flight requests.
+
+        Changed agents are built and initialized (MCP connections, tool
+        discovery) while the current ones keep serving. The new set then
+        replaces the current one in a single step, so ``get``, ``to_deps`` and
+        ``session`` return the new agents from that point on. Agents whose
+        class and configuration did not change are reused as they are.
+        Replaced agents are closed (``close`` hook, if any) once every
+        ``session`` started before the swap has finished (or after
+        ``drain_timeout``); ``to_deps`` results are not tracked. If an agent fails to
+        initialize, the agents created so far are closed and the current ones
+        keep serving.
+
+        Args:
+            updates: Agent factories to add or replace, as ``{name: (agent_class, config)}``
+            remove: Names of agents to remove
+            wait: Whether to wait until replaced agents are drained and closed
+            drain_timeout: Seconds to wait for in-flight sessions before closing anyway
+
+        Returns:
+            Names of agents that were (re)created
+
+        Example:
+            ```python
+            await manager.reload({
+                "agent": (ReasoningAgent, {"api_key": key, "llm_model": "gpt-4o-mini"}),
+            })
+            ```
+        """
+        removed = set(remove)
+        async with self._reload_lock:
+            factories = dict(self._factories)
+            factories.update(updates or {})
+            for name in removed:
+                factories.pop(name, None)
+
+            agents: dict[str, Any] = {}
+            created: dict[str, Any] = {}
+            for name, (agent_class, config) in factories.items():
+                current = self._agents.get(name)
+                if current is not None and self._factories.get(name) == (agent_class, config):
+                    agents[name] = current
+                else:
+                    created[name] = agent_class(**config)
+            # Instances registered without a factory are kept unless removed
+            for name, instance in self._agents.items():
+                if name not in factories and name not in removed:
+                    agents[name] = instance
+
+            results = await asyncio.gather(
+                *(self._initialize_instance(instance) for instance in created.values()), return_exceptions=True
+            )
+            errors = [result for result in results if isinstance(result, BaseException)]
+            if errors:
+                # Nothing was swapped in: release what the new agents opened (e.g. MCP connections)
+                await asyncio.gather(*(self._close_instance(instance) for instance in created.values()))
+                raise errors[0]
+            agents.update(created)
+
+            retired = self._generation
+            retained = {id(instance) for instance in agents.values()}
+            replaced = [instance for instance in retired.agents.values() if id(instance) not in retained]
+
+            self._factories = factories
+            self._agents = agents
+            self._generation = _Generation(agents, version=retired.version + 1)
+
+        task = asyncio.create_task(self._retire(retired, replaced, drain_timeout))
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+        if wait:
+            await task
+        return list(created)
+
+    @asynccontextmanager
+    async def session(self, **extra_deps: Any) -> AsyncIterator[dict[str, Any]]:
+        """Get workflow dependencies pinned to the current agents for one request.
+
+        Agents replaced by ``reload`` while the session is open are kept alive
+        until it finishes.
+
+        Example:
+            ```python
+            async with manager.session(message="Hello", language="english") as deps:
+                result = await user_assistant_graph.run(StartNode(), state=WorkflowState(), deps=deps)
+            ```
+        """
+        generation = self._generation
+        generation.acquire()
+        try:
+            deps = dict(generation.agents)
+            deps.update(extra_deps)
+            yield deps
+        finally:
+            generation.release()
+
+    @property
+    def version(self) -> int:
+        """Number of reloads applied to the manager."""
+        return self._generation.version
+
+    @property
+    def in_flight(self) -> int:
+        """Number of open sessions on the current agents."""
+        return self._generation.in_flight
+
+    async def _retire(self, generation: _Generation, replaced: list[Any], drain_timeout: float | None) -> None:
+        with suppress(TimeoutError):
+            await asyncio.wait_for(generation.drained.wait(), drain_timeout)
+        for instance in replaced:
+            await self._close_instance(instance)
+
+    @staticmethod
+    async def _close_instance(instance: Any) -> None:
+        close = getattr(instance, "close", None)
+        if callable(close):
+            result = close()
+            if inspect.isawaitable(result):
+                await result
 
     def get(self, name: str) -> Any:
         """Get agent by name.
@@ -70,6 +251,10 @@ class AgentManager:
     def to_deps(self, **extra_deps: Any) -> dict[str, Any]:
         """Convert all agents to dependencies dict for graph.
 
+        The dict is not pinned to its agents: a ``reload`` may close agents
+        it refers to once their sessions are drained. Use ``session`` for
+        requests that must finish on the agents they started with.
+
         Args:
             **extra_deps: Additional dependencies (e.g. message, language, target_language)
 
@@ -0,0 +1,24 @@
+"""Shared MCP server connections for agents."""
+
+from typing import TYPE_CHECKING
+
+from pygentic_ai.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pygentic_ai.mcp.catalog import MCPToolCatalog
+    from pygentic_ai.mcp.pool import CatalogMCPServer, MCPConnectionPool, PooledMCPServer, mcp_pool
+
+_EXPORTS = {
+    "pygentic_ai.mcp.catalog": ["MCPToolCatalog"],
+    "pygentic_ai.mcp.pool": ["CatalogMCPServer", "MCPConnectionPool", "PooledMCPServer", "mcp_pool"],
+}
+
+__all__ = [
+    "CatalogMCPServer",
+    "MCPConnectionPool",
+    "MCPToolCatalog",
+    "PooledMCPServer",
+    "mcp_pool",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,132 @@
+"""TTL cache of MCP tool listings with stale-while-revalidate refresh."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from mcp import types as mcp_types
+
+
+@dataclass
+class _CatalogEntry:
+    tools: list[mcp_types.Tool]
+    fetched_at: float
+
+
+class MCPToolCatalog:
+    """Cache of tool listings of MCP servers keyed by URL.
+
+    A fresh listing is served from memory. Once it is older than ``ttl`` it is
+    still served, while a single background task refreshes it, so discovery
+    stays off the request path. Listings older than ``max_stale`` (or missing
+    ones) are fetched before returning. Concurrent fetches of the same URL
+    share one request.
+
+    Args:
+        ttl: Seconds a listing is considered fresh
+        max_stale: Seconds a stale listing may still be served while refreshing
+            (None serves stale listings indefinitely)
+        verbose: Whether to print refresh failures
+
+    Example:
+        ```python
+        from pygentic_ai.mcp import mcp_pool
+
+        mcp_pool.catalog.ttl = 60
+        mcp_pool.catalog.invalidate("http://localhost:8000/mcp")
+        ```
+    """
+
+    def __init__(self, ttl: float = 300.0, max_stale: float | None = 3600.0, verbose: bool = False) -> None:
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.verbose = verbose
+        self._entries: dict[str, _CatalogEntry] = {}
+        self._fetches: dict[str, asyncio.Task[list[mcp_types.Tool]]] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    async def list_tools(
+        self,
+        url: str,
+        fetch: Callable[[], Awaitable[list[mcp_types.Tool]]],
+    ) -> list[mcp_types.Tool]:
+        """Get the tool listing of a server, fetching it when needed.
+
+        Args:
+            url: MCP server URL used as cache key
+            fetch: Coroutine function listing the server tools
+
+        Returns:
+            List of MCP tool definitions
+        """
+        entry = self._entries.get(url)
+        if entry is not None:
+            age = time.monotonic() - entry.fetched_at
+            if age < self.ttl:
+                self.hits += 1
+                return entry.tools
+            if self.max_stale is None or age < self.ttl + self.max_stale:
+                self.stale_hits += 1
+                self._fetch(url, fetch)
+                return entry.tools
+
+        self.misses += 1
+        return await asyncio.shield(self._fetch(url, fetch))
+
+    def invalidate(self, url: str | None = None) -> None:
+        """Drop cached listings so the next access fetches them again.
+
+        Args:
+            url: Server URL to invalidate, or every server if None
+        """
+        if url is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(url, None)
+
+    def store(self, url: str, tools: list[mcp_types.Tool]) -> None:
+        """Cache a listing fetched elsewhere as fresh."""
+        self._entries[url] = _CatalogEntry(tools=tools, fetched_at=time.monotonic())
+
+    def reset_fetches(self) -> None:
+        """Forget in-flight refreshes, e.g. ones inherited from a parent process."""
+        self._fetches.clear()
+
+    def mark_stale(self, url: str) -> None:
+        """Keep serving a listing but refresh it in the background on next access."""
+        entry = self._entries.get(url)
+        if entry is not None:
+            entry.fetched_at = min(entry.fetched_at, time.monotonic() - self.ttl)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
+
+    def _fetch(
+        self,
+        url: str,
+        fetch: Callable[[], Awaitable[list[mcp_types.Tool]]],
+    ) -> asyncio.Task[list[mcp_types.Tool]]:
+        task = self._fetches.get(url)
+        if task is None:
+            task = asyncio.create_task(self._run_fetch(url, fetch), name=f"mcp-catalog:{url}")
+            self._fetches[url] = task
+            task.add_done_callback(lambda done: self._on_fetch_done(url, done))
+        return task
+
+    async def _run_fetch(
+        self,
+        url: str,
+        fetch: Callable[[], Awaitable[list[mcp_types.Tool]]],
+    ) -> list[mcp_types.Tool]:
+        tools = await fetch()
+        self.store(url, tools)
+        return tools
+
+    def _on_fetch_done(self, url: str, task: asyncio.Task[list[mcp_types.Tool]]) -> None:
+        if self._fetches.get(url) is task:
+            del self._fetches[url]
+        if not task.cancelled() and (error := task.exception()) is not None and self.verbose:
+            print(f"Failed to refresh MCP tools of {url}: {error}")
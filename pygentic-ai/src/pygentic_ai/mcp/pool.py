@@ -0,0 +1,313 @@
+"""Process-wide pool of MCP server connections keyed by URL."""
+
+import asyncio
+import os
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from mcp import types as mcp_types
+from mcp.shared.session import RequestResponder
+from pydantic_ai import RunContext
+from pydantic_ai.mcp import MCPServerStreamableHTTP
+from pydantic_ai.toolsets import ToolsetTool, WrapperToolset
+
+from pygentic_ai.mcp.catalog import MCPToolCatalog
+
+
+@dataclass
+class MCPServerStats:
+    """Connection and call statistics of a pooled MCP server."""
+
+    url: str
+    connected: bool = False
+    connects: int = 0
+    failures: int = 0
+    calls: int = 0
+    in_flight: int = 0
+
+
+class CatalogMCPServer(MCPServerStreamableHTTP):
+    """Streamable HTTP MCP server serving its tool listing from a tool catalog.
+
+    A ``notifications/tools/list_changed`` notification from the server marks
+    its cached listing stale, so it is refreshed on the next access.
+
+    Args:
+        url: MCP server URL
+        catalog: Tool listing cache shared by the pooled servers
+        **kwargs: Further arguments of ``MCPServerStreamableHTTP``
+    """
+
+    def __init__(self, url: str, catalog: MCPToolCatalog, **kwargs: Any) -> None:
+        super().__init__(url, cache_tools=False, **kwargs)
+        self.catalog = catalog
+
+    async def list_tools(self) -> list[mcp_types.Tool]:
+        """Get the server tools from the catalog, fetching them when needed."""
+        return await self.catalog.list_tools(self.url, self.fetch_tools)
+
+    async def fetch_tools(self) -> list[mcp_types.Tool]:
+        """List the server tools, bypassing the catalog."""
+        return await super().list_tools()
+
+    async def ping(self) -> None:
+        """Check that the session is alive with an MCP ``ping`` request."""
+        async with self:
+            await self._client.send_ping()
+
+    async def _handle_notification(
+        self,
+        message: RequestResponder[mcp_types.ServerRequest, mcp_types.ClientResult]
+        | mcp_types.ServerNotification
+        | Exception,
+    ) -> None:
+        await super()._handle_notification(message)
+        if isinstance(message, mcp_types.ServerNotification) and isinstance(
+            message.root, mcp_types.ToolListChangedNotification
+        ):
+            self.catalog.mark_stale(self.url)
+
+
+@dataclass
+class _PoolEntry:
+    url: str
+    server: CatalogMCPServer
+    semaphore: asyncio.Semaphore
+    stats: MCPServerStats
+    catalog: MCPToolCatalog
+    connected: asyncio.Event = field(default_factory=asyncio.Event)
+    stopping: asyncio.Event = field(default_factory=asyncio.Event)
+    keeper: asyncio.Task | None = None
+
+
+@dataclass
+class PooledMCPServer(WrapperToolset[Any]):
+    """MCP toolset shared by all agents pointing at the same server.
+
+    Wraps the pooled server, whose tool listing is served from the pool's
+    tool catalog, and bounds the number of concurrent tool calls made through it.
+    """
+
+    pool_entry: _PoolEntry = field(kw_only=True)
+
+    @property
+    def url(self) -> str:
+        return self.pool_entry.url
+
+    async def list_tools(self) -> list[mcp_types.Tool]:
+        """Get the server tools from the catalog."""
+        return await self.pool_entry.server.list_tools()
+
+    async def call_tool(
+        self,
+        name: str,
+        tool_args: dict[str, Any],
+        ctx: RunContext[Any],
+        tool: ToolsetTool[Any],
+    ) -> Any:
+        entry = self.pool_entry
+        async with entry.semaphore:
+            entry.stats.calls += 1
+            entry.stats.in_flight += 1
+            try:
+                return await self.wrapped.call_tool(name, tool_args, ctx, tool)
+            finally:
+                entry.stats.in_flight -= 1
+
+
+class MCPConnectionPool:
+    """Process-wide registry of MCP server connections keyed by URL.
+
+    Every agent asking for the same URL gets the same server, so concurrent
+    runs share one session instead of opening their own. Once ``connect`` is
+    called for a URL, a background keeper task holds the session open between
+    runs, checks it periodically with an MCP ``ping`` and reconnects with
+    exponential backoff when the connection drops. The cached tool listing is
+    refreshed after a reconnect or when the server announces a changed tool list.
+
+    Connections and their asyncio primitives belong to one process: in a
+    forked child (e.g. a ``WorkflowServer`` worker) every pool is reset
+    automatically, so the child opens its own sessions.
+
+    Args:
+        max_concurrent_calls: Maximum number of concurrent tool calls per server
+        keepalive_interval: Seconds between keep-alive checks
+        initial_backoff: Delay before the first reconnection attempt in seconds
+        max_backoff: Upper bound of the reconnection delay in seconds
+        server_factory: Callable creating an MCP server for a URL and the catalog
+        catalog: Tool listing cache shared by the pooled servers
+        verbose: Whether to print connection events
+
+    Example:
+        ```python
+        from pygentic_ai.mcp import mcp_pool
+
+        server = mcp_pool.get("http://localhost:8000/mcp")
+        await mcp_pool.connect("http://localhost:8000/mcp")
+        ...
+        await mcp_pool.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        max_concurrent_calls: int = 8,
+        keepalive_interval: float = 30.0,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        server_factory: Callable[[str, MCPToolCatalog], CatalogMCPServer] = CatalogMCPServer,
+        catalog: MCPToolCatalog | None = None,
+        verbose: bool = False,
+    ) -> None:
+        self.max_concurrent_calls = max_concurrent_calls
+        self.keepalive_interval = keepalive_interval
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.server_factory = server_factory
+        self.catalog = catalog if catalog is not None else MCPToolCatalog(verbose=verbose)
+        self.verbose = verbose
+        self._entries: dict[str, _PoolEntry] = {}
+        self._toolsets: dict[str, PooledMCPServer] = {}
+        _pools.add(self)
+
+    def get(self, url: str) -> PooledMCPServer:
+        """Get the shared toolset for an MCP server URL, creating it if needed."""
+        if url not in self._toolsets:
+            entry = self._new_entry(url)
+            self._entries[url] = entry
+            self._toolsets[url] = PooledMCPServer(wrapped=entry.server, pool_entry=entry)
+        return self._toolsets[url]
+
+    def reset(self) -> None:
+        """Forget open sessions and keeper tasks, e.g. ones inherited from a parent process.
+
+        Toolsets handed out before keep working: they get fresh servers that
+        connect on the next ``connect`` or run. Cached tool listings are kept.
+        """
+        self.catalog.reset_fetches()
+        for url, toolset in self._toolsets.items():
+            entry = self._new_entry(url)
+            self._entries[url] = entry
+            toolset.pool_entry = entry
+            toolset.wrapped = entry.server
+
+    async def connect(self, url: str, wait: float | None = 10.0) -> bool:
+        """Open a long-lived session to the server and keep it alive.
+
+        Args:
+            url: MCP server URL
+            wait: Seconds to wait for the first connection (None waits indefinitely)
+
+        Returns:
+            True if the server is connected when the call returns
+        """
+        entry = self.get(url).pool_entry
+        if entry.keeper is None or entry.keeper.done():
+            entry.stopping.clear()
+            entry.keeper = asyncio.create_task(self._keep_alive(entry), name=f"mcp-keepalive:{url}")
+        try:
+            await asyncio.wait_for(entry.connected.wait(), wait)
+        except TimeoutError:
+            return False
+        return True
+
+    async def discover(self, urls: list[str]) -> None:
+        """Fetch the tool listings of several servers concurrently into the catalog.
+
+        Args:
+            urls: MCP server URLs to discover
+        """
+        results = await asyncio.gather(
+            *(self.get(url).list_tools() for url in dict.fromkeys(urls)), return_exceptions=True
+        )
+        if self.verbose:
+            for url, result in zip(dict.fromkeys(urls), results, strict=True):
+                if isinstance(result, BaseException):
+                    print(f"Failed to discover MCP tools of {url}: {result}")
+
+    async def close(self, url: str | None = None) -> None:
+        """Stop keeper tasks and release their sessions.
+
+        Args:
+            url: Close a single server, or every pooled server if None
+        """
+        urls = [url] if url is not None else list(self._entries)
+        keepers = []
+        for pooled_url in urls:
+            entry = self._entries.get(pooled_url)
+            if entry is None or entry.keeper is None:
+                continue
+            entry.stopping.set()
+            keepers.append(entry.keeper)
+        await asyncio.gather(*keepers, return_exceptions=True)
+
+    def stats(self) -> list[MCPServerStats]:
+        """Get statistics of all pooled servers."""
+        return [entry.stats for entry in self._entries.values()]
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
+
+    def _new_entry(self, url: str) -> _PoolEntry:
+        return _PoolEntry(
+            url=url,
+            server=self.server_factory(url, self.catalog),
+            semaphore=asyncio.Semaphore(self.max_concurrent_calls),
+            stats=MCPServerStats(url=url),
+            catalog=self.catalog,
+        )
+
+    async def _keep_alive(self, entry: _PoolEntry) -> None:
+        backoff = self.initial_backoff
+        while not entry.stopping.is_set():
+            try:
+                async with entry.server:
+                    entry.connected.set()
+                    entry.stats.connected = True
+                    entry.stats.connects += 1
+                    if entry.stats.connects > 1:
+                        # The server may have been redeployed with a different tool set
+                        entry.catalog.mark_stale(entry.url)
+                    backoff = self.initial_backoff
+                    if self.verbose:
+                        print(f"MCP server connected: {entry.url}")
+                    while not await self._wait(entry.stopping, self.keepalive_interval):
+                        await self._ping(entry)
+            except Exception as e:
+                entry.stats.failures += 1
+                if self.verbose:
+                    print(f"MCP server {entry.url} disconnected: {e}. Reconnecting in {backoff:.1f}s")
+            finally:
+                entry.connected.clear()
+                entry.stats.connected = False
+
+            if await self._wait(entry.stopping, backoff):
+                break
+            backoff = min(backoff * 2, self.max_backoff)
+
+    @staticmethod
+    async def _ping(entry: _PoolEntry) -> None:
+        await entry.server.ping()
+
+    @staticmethod
+    async def _wait(event: asyncio.Event, seconds: float) -> bool:
+        try:
+            await asyncio.wait_for(event.wait(), seconds)
+        except TimeoutError:
+            return False
+        return True
+
+
+_pools: "weakref.WeakSet[MCPConnectionPool]" = weakref.WeakSet()
+
+
+def _reset_pools_after_fork() -> None:
+    for pool in list(_pools):
+        pool.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+mcp_pool = MCPConnectionPool()
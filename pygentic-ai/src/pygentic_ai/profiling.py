@@ -0,0 +1,445 @@
+"""Profiling of framework overhead and event-loop health."""
+
+import asyncio
+import functools
+import inspect
+import random
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AbstractContextManager, asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic_ai import RunContext
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+from pygentic_ai.context import current_scope, execution_scope
+
+# Number of profiled runs in progress in this process; profiled tools skip the scope lookup while it is zero
+_active_runs = 0
+
+
+@dataclass
+class TimingStats:
+    """Time of a workflow, node or agent, split into model, tool and framework time.
+
+    Attributes:
+        count: Number of measured calls
+        wall: Total wall time in seconds
+        model: Time spent waiting for model responses
+        tools: Time spent in tools
+        max_wall: Longest call
+    """
+
+    count: int = 0
+    wall: float = 0.0
+    model: float = 0.0
+    tools: float = 0.0
+    max_wall: float = 0.0
+
+    @property
+    def framework(self) -> float:
+        """Time spent neither in the model nor in tools."""
+        return max(0.0, self.wall - self.model - self.tools)
+
+    def add(self, wall: float, model: float, tools: float) -> None:
+        self.count += 1
+        self.wall += wall
+        self.model += model
+        self.tools += tools
+        self.max_wall = max(self.max_wall, wall)
+
+    def merge(self, other: "TimingStats") -> None:
+        self.count += other.count
+        self.wall += other.wall
+        self.model += other.model
+        self.tools += other.tools
+        self.max_wall = max(self.max_wall, other.max_wall)
+
+    def as_dict(self) -> dict[str, float]:
+        count = self.count or 1
+        return {
+            "count": self.count,
+            "wall": self.wall,
+            "model": self.model,
+            "tools": self.tools,
+            "framework": self.framework,
+            "mean_wall": self.wall / count,
+            "mean_framework": self.framework / count,
+            "framework_share": self.framework / self.wall if self.wall else 0.0,
+            "max_wall": self.max_wall,
+        }
+
+
+@dataclass
+class LagStats:
+    """Event-loop lag samples: totals of all samples and percentiles of the recent ones."""
+
+    samples: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def add(self, lag: float) -> None:
+        self.samples += 1
+        self.total += lag
+        self.max = max(self.max, lag)
+        self.recent.append(lag)
+
+    def as_dict(self) -> dict[str, float]:
+        recent = sorted(self.recent)
+
+        def percentile(q: float) -> float:
+            return recent[min(len(recent) - 1, int(q * len(recent)))] if recent else 0.0
+
+        return {
+            "samples": self.samples,
+            "mean": self.total / self.samples if self.samples else 0.0,
+            "p50": percentile(0.5),
+            "p99": percentile(0.99),
+            "max": self.max,
+        }
+
+
+@dataclass
+class BlockingCall:
+    """The event loop being blocked, with the code that was running at the time.
+
+    Attributes:
+        detected_at: ``time.time()`` when the block was detected
+        duration: Seconds the loop was blocked (updated once it runs again)
+        stack: Stack of the event-loop thread when the block was detected, innermost frame last
+    """
+
+    detected_at: float
+    duration: float
+    stack: list[str]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"detected_at": self.detected_at, "duration": self.duration, "stack": self.stack}
+
+
+class RunProfile:
+    """Timings of one profiled workflow run, by node and by agent.
+
+    Model and tool time are accumulated as the run makes model requests and
+    tool calls; the time of a node or agent call minus the model and tool
+    time accumulated during it is framework time.
+    """
+
+    def __init__(self) -> None:
+        self.model_time = 0.0
+        self.tool_time = 0.0
+        self.nodes: dict[str, TimingStats] = {}
+        self.agents: dict[str, TimingStats] = {}
+        self._lock = threading.Lock()
+
+    def add_model_time(self, seconds: float) -> None:
+        self.model_time += seconds
+
+    def add_tool_time(self, seconds: float) -> None:
+        # Sync tools run in worker threads
+        with self._lock:
+            self.tool_time += seconds
+
+    def node(self, name: str) -> AbstractContextManager[None]:
+        """Measure a workflow node."""
+        return self._measure(self.nodes, name)
+
+    def agent(self, name: str) -> AbstractContextManager[None]:
+        """Measure an agent run."""
+        return self._measure(self.agents, name)
+
+    @contextmanager
+    def _measure(self, stats: dict[str, TimingStats], name: str) -> Iterator[None]:
+        model, tools, started = self.model_time, self.tool_time, time.perf_counter()
+        try:
+            yield
+        finally:
+            timing = stats.get(name)
+            if timing is None:
+                timing = stats[name] = TimingStats()
+            timing.add(time.perf_counter() - started, self.model_time - model, self.tool_time - tools)
+
+
+class Profiler:
+    """Separates time in the model and in tools from framework time, and watches the event loop.
+
+    Workflow runs inside ``profiler.run()`` (and served by ``WorkflowServer(profiler=...)``)
+    are timed by node (when run with ``run_workflow``) and by agent. Each
+    measurement is split into model time, tool time and framework time: the
+    rest, e.g. building deps, rendering instructions, serializing history and
+    graph transitions. Node framework time also includes waiting for a
+    scheduler slot.
+
+    Once started, the profiler samples the event-loop lag and a watchdog
+    thread reports the stack of code blocking the loop (e.g. a sync call in
+    async code) for longer than ``block_threshold``.
+
+    For production, profile a sample of the runs: unsampled runs cost one
+    random draw, and the loop monitor wakes up every ``lag_interval``. Only
+    aggregates are kept, so memory does not grow with traffic.
+
+    Args:
+        sample_rate: Share of runs that are profiled
+        lag_interval: Seconds between event-loop lag samples
+        block_threshold: Seconds the loop may be blocked before it is reported (``None`` disables the watchdog)
+        max_blocking_calls: Number of most recent blocking calls kept
+        stack_depth: Number of innermost frames kept for a blocking call
+        verbose: Whether to print blocking calls as they are detected
+
+    Example:
+        ```python
+        from pygentic_ai.profiling import Profiler
+        from pygentic_ai.workflows import run_workflow
+
+        profiler = Profiler(sample_rate=0.05, block_threshold=0.1, verbose=True)
+        async with profiler:
+            with profiler.run():
+                await run_workflow(manager.to_deps(message="Hello!", chat_history=[]))
+            print(profiler.summary())
+        ```
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        lag_interval: float = 0.05,
+        block_threshold: float | None = 0.1,
+        max_blocking_calls: int = 100,
+        stack_depth: int = 12,
+        verbose: bool = False,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.lag_interval = lag_interval
+        self.block_threshold = block_threshold
+        self.stack_depth = stack_depth
+        self.verbose = verbose
+        self.runs = 0
+        self.workflow = TimingStats()
+        self.nodes: dict[str, TimingStats] = {}
+        self.agents: dict[str, TimingStats] = {}
+        self.loop_lag = LagStats()
+        self.blocking_calls: deque[BlockingCall] = deque(maxlen=max_blocking_calls)
+        self._monitor: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._loop_thread: int | None = None
+        self._heartbeat = 0.0
+        self._blocked: BlockingCall | None = None
+
+    @contextmanager
+    def run(self) -> Iterator[RunProfile | None]:
+        """Profile the agent calls (and ``run_workflow`` nodes) of a block, if the run is sampled."""
+        self.runs += 1
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            yield None
+            return
+
+        global _active_runs
+        profile = RunProfile()
+        started = time.perf_counter()
+        _active_runs += 1
+        try:
+            with execution_scope(profile=profile):
+                yield profile
+        finally:
+            _active_runs -= 1
+            self.workflow.add(time.perf_counter() - started, profile.model_time, profile.tool_time)
+            for totals, stats in ((self.nodes, profile.nodes), (self.agents, profile.agents)):
+                for name, timing in stats.items():
+                    totals.setdefault(name, TimingStats()).merge(timing)
+
+    async def start(self) -> None:
+        """Start sampling the lag of the running event loop and watching it for blocking calls."""
+        if self._monitor is not None:
+            return
+        self._loop_thread = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._monitor = asyncio.create_task(self._sample_lag())
+        if self.block_threshold is not None:
+            self._stopped.clear()
+            self._watchdog = threading.Thread(target=self._watch, name="pygentic-ai-loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the loop monitor and the watchdog."""
+        self._stopped.set()
+        if self._monitor is not None:
+            self._monitor.cancel()
+            await asyncio.gather(self._monitor, return_exceptions=True)
+            self._monitor = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def __aenter__(self) -> "Profiler":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    def report(self) -> dict[str, Any]:
+        """Aggregated timings (in seconds), event-loop lag and recent blocking calls."""
+        return {
+            "runs": self.runs,
+            "profiled_runs": self.workflow.count,
+            "workflow": self.workflow.as_dict(),
+            "nodes": {name: stats.as_dict() for name, stats in self.nodes.items()},
+            "agents": {name: stats.as_dict() for name, stats in self.agents.items()},
+            "loop_lag": self.loop_lag.as_dict(),
+            "blocking_calls": [call.as_dict() for call in self.blocking_calls],
+        }
+
+    def summary(self) -> str:
+        """Human-readable table of the mean time per call, in milliseconds."""
+        lines = [f"{'':<32}{'calls':>7}{'wall':>10}{'model':>10}{'tools':>10}{'framework':>11}"]
+        sections = [("workflow", {"run": self.workflow}), ("nodes", self.nodes), ("agents", self.agents)]
+        for title, stats in sections:
+            for name, timing in stats.items():
+                count = timing.count or 1
+                lines.append(
+                    f"{f'{title}: {name}':<32}{timing.count:>7}{timing.wall / count * 1000:>10.2f}"
+                    f"{timing.model / count * 1000:>10.2f}{timing.tools / count * 1000:>10.2f}"
+                    f"{timing.framework / count * 1000:>11.2f}"
+                )
+        lag = self.loop_lag.as_dict()
+        lines.append(
+            f"event loop lag: p50 {lag['p50'] * 1000:.2f} ms, p99 {lag['p99'] * 1000:.2f} ms, "
+            f"max {lag['max'] * 1000:.2f} ms; blocking calls: {len(self.blocking_calls)}"
+        )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Drop all collected timings and samples."""
+        self.runs = 0
+        self.workflow = TimingStats()
+        self.nodes.clear()
+        self.agents.clear()
+        self.loop_lag = LagStats()
+        self.blocking_calls.clear()
+
+    async def _sample_lag(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.lag_interval)
+            now = time.monotonic()
+            lag = max(0.0, now - started - self.lag_interval)
+            self._heartbeat = now
+            self.loop_lag.add(lag)
+            blocked, self._blocked = self._blocked, None
+            if blocked is not None:
+                blocked.duration = lag
+
+    def _watch(self) -> None:
+        assert self.block_threshold is not None
+        while not self._stopped.wait(self.block_threshold / 2):
+            stalled = time.monotonic() - self._heartbeat - self.lag_interval
+            if stalled < self.block_threshold or self._blocked is not None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)  # type: ignore[arg-type]
+            if frame is None:
+                continue
+            stack = [line.rstrip() for line in traceback.format_stack(frame)[-self.stack_depth :]]
+            blocked = BlockingCall(detected_at=time.time(), duration=stalled, stack=stack)
+            self._blocked = blocked
+            self.blocking_calls.append(blocked)
+            if self.verbose:
+                print(f"Event loop blocked for over {stalled:.3f}s at:\n" + "\n".join(stack))
+
+
+class ProfiledModel(WrapperModel):
+    """Model adding the time spent waiting for its responses to a run profile.
+
+    A streamed response counts as model time from the request until the
+    stream is closed, including the handling of its events in between.
+
+    Args:
+        wrapped: Model the requests are addressed to
+        profile: Profile of the run making the requests
+    """
+
+    def __init__(self, wrapped: Model | str, profile: RunProfile) -> None:
+        super().__init__(wrapped)
+        self.profile = profile
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        started = time.perf_counter()
+        try:
+            return await super().request(messages, model_settings, model_request_parameters)
+        finally:
+            self.profile.add_model_time(time.perf_counter() - started)
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        started = time.perf_counter()
+        try:
+            async with super().request_stream(
+                messages, model_settings, model_request_parameters, run_context
+            ) as response_stream:
+                yield response_stream
+        finally:
+            self.profile.add_model_time(time.perf_counter() - started)
+
+
+def profiled_tool(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a tool so that its time is added to the profile of the run calling it.
+
+    The wrapper keeps the signature, docstring and sync-ness of the tool, so
+    Pydantic AI generates the same schema and still runs sync tools in a thread.
+    While no profiled run is in progress, the wrapper calls the tool straight
+    away, without looking up the execution scope.
+    """
+    if not inspect.isfunction(func) and not inspect.ismethod(func):
+        return func
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def timed_async(*args: Any, **kwargs: Any) -> Any:
+            if not _active_runs:
+                return await func(*args, **kwargs)
+            profile = current_scope().profile
+            if profile is None:
+                return await func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                profile.add_tool_time(time.perf_counter() - started)
+
+        return timed_async
+
+    @functools.wraps(func)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        if not _active_runs:
+            return func(*args, **kwargs)
+        profile = current_scope().profile
+        if profile is None:
+            return func(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.add_tool_time(time.perf_counter() - started)
+
+    return timed
@@ -1,35 +1,99 @@
 """Agent prompts and instructions."""
 
-from pygentic_ai.prompts.agent_prompts import (
-    TEXT_AGENT_PRIMING,
-    TEXT_AGENT_RULES,
-    TEXT_REACTAGENT_GUIDANCE,
-    get_general_instructions,
-    get_instructions_for_mode,
-    get_language_instruction,
-)
-from pygentic_ai.prompts.worker_prompts import (
-    TEXT_GUARDRAILS_INSTRUCTIONS,
-    TEXT_ROUTER_INSTRUCTIONS,
-    TEXT_TRANSLATOR_INSTRUCTIONS,
-    get_guardrails_instructions,
-    get_router_instructions,
-    get_translator_instructions,
-)
+from typing import TYPE_CHECKING
+
+from pygentic_ai.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pygentic_ai.prompts.agent_prompts import (
+        TEXT_AGENT_PRIMING,
+        TEXT_AGENT_RULES,
+        TEXT_REACTAGENT_GUIDANCE,
+        TEXT_ROUTED_ANSWER_INSTRUCTIONS,
+        get_general_instructions,
+        get_instructions_for_mode,
+        get_language_instruction,
+        get_output_constraints,
+    )
+    from pygentic_ai.prompts.registry import (
+        PromptRegistry,
+        PromptTemplate,
+        RenderedPrompt,
+        RenderStats,
+        count_tokens,
+        estimate_tokens,
+        prompt_registry,
+    )
+    from pygentic_ai.prompts.worker_prompts import (
+        TEXT_GUARDRAILS_INSTRUCTIONS,
+        TEXT_OUTPUT_RULES,
+        TEXT_ROUTER_INSTRUCTIONS,
+        TEXT_TRANSLATOR_INSTRUCTIONS,
+        get_guardrails_instructions,
+        get_output_rules,
+        get_router_instructions,
+        get_translator_instructions,
+    )
+
+_EXPORTS = {
+    "pygentic_ai.prompts.agent_prompts": [
+        "TEXT_AGENT_PRIMING",
+        "TEXT_AGENT_RULES",
+        "TEXT_REACTAGENT_GUIDANCE",
+        "TEXT_ROUTED_ANSWER_INSTRUCTIONS",
+        "get_general_instructions",
+        "get_instructions_for_mode",
+        "get_language_instruction",
+        "get_output_constraints",
+    ],
+    "pygentic_ai.prompts.registry": [
+        "PromptRegistry",
+        "PromptTemplate",
+        "RenderedPrompt",
+        "RenderStats",
+        "count_tokens",
+        "estimate_tokens",
+        "prompt_registry",
+    ],
+    "pygentic_ai.prompts.worker_prompts": [
+        "TEXT_GUARDRAILS_INSTRUCTIONS",
+        "TEXT_OUTPUT_RULES",
+        "TEXT_ROUTER_INSTRUCTIONS",
+        "TEXT_TRANSLATOR_INSTRUCTIONS",
+        "get_guardrails_instructions",
+        "get_output_rules",
+        "get_router_instructions",
+        "get_translator_instructions",
+    ],
+}
 
 __all__ = [
     # Agent prompts
     "TEXT_AGENT_PRIMING",
     "TEXT_AGENT_RULES",
     "TEXT_REACTAGENT_GUIDANCE",
+    "TEXT_ROUTED_ANSWER_INSTRUCTIONS",
     "get_general_instructions",
     "get_instructions_for_mode",
     "get_language_instruction",
+    "get_output_constraints",
+    # Registry
+    "PromptRegistry",
+    "PromptTemplate",
+    "RenderedPrompt",
+    "RenderStats",
+    "count_tokens",
+    "estimate_tokens",
+    "prompt_registry",
     # Worker prompts
     "TEXT_GUARDRAILS_INSTRUCTIONS",
+    "TEXT_OUTPUT_RULES",
     "TEXT_ROUTER_INSTRUCTIONS",
     "TEXT_TRANSLATOR_INSTRUCTIONS",
     "get_guardrails_instructions",
+    "get_output_rules",
     "get_router_instructions",
     "get_translator_instructions",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
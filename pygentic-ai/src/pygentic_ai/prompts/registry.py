@@ -0,0 +1,233 @@
+"""Versioned prompt templates with memoized rendering."""
+
+import hashlib
+import string
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+_ENCODINGS: dict[str, Any] = {}
+_ENCODINGS_LOCK = threading.Lock()
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text (about four characters per token)."""
+    return max(1, round(len(text) / 4)) if text else 0
+
+
+def count_tokens(text: str, encoding: str = "o200k_base") -> int:
+    """Count the tokens of a text with tiktoken, or estimate them if it is unavailable.
+
+    Args:
+        text: Text to count
+        encoding: tiktoken encoding name
+    """
+    with _ENCODINGS_LOCK:
+        if encoding not in _ENCODINGS:
+            try:
+                import tiktoken
+
+                _ENCODINGS[encoding] = tiktoken.get_encoding(encoding)
+            except Exception:
+                # tiktoken not installed, or its encoding files cannot be downloaded
+                _ENCODINGS[encoding] = None
+        tokenizer = _ENCODINGS[encoding]
+    if tokenizer is None:
+        return estimate_tokens(text)
+    return len(tokenizer.encode(text))
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """A versioned prompt template using ``str.format`` placeholders.
+
+    Attributes:
+        name: Template name
+        template: Template text
+        version: Version label of the template
+        defaults: Values of placeholders that are not passed when rendering
+    """
+
+    name: str
+    template: str
+    version: str = "1"
+    defaults: Mapping[str, Any] = field(default_factory=dict)
+
+    @cached_property
+    def version_hash(self) -> str:
+        """Hash of the template name, version and text, usable as a cache key."""
+        content = f"{self.name}\0{self.version}\0{self.template}".encode()
+        return hashlib.sha256(content).hexdigest()[:16]
+
+    @cached_property
+    def fields(self) -> frozenset[str]:
+        """Names of the template placeholders."""
+        return frozenset(name for _, name, _, _ in string.Formatter().parse(self.template) if name)
+
+    def format(self, **params: Any) -> str:
+        """Render the template without memoization."""
+        return self.template.format(**{**self.defaults, **params})
+
+
+class RenderedPrompt:
+    """A rendered prompt with its token count, computed once on first access.
+
+    Attributes:
+        text: Rendered prompt text
+        template: Template the prompt was rendered from
+    """
+
+    def __init__(self, text: str, template: PromptTemplate, token_counter: Callable[[str], int]) -> None:
+        self.text = text
+        self.template = template
+        self._token_counter = token_counter
+
+    @cached_property
+    def tokens(self) -> int:
+        """Number of tokens of the prompt."""
+        return self._token_counter(self.text)
+
+    @property
+    def version_hash(self) -> str:
+        return self.template.version_hash
+
+    def __str__(self) -> str:
+        return self.text
+
+
+@dataclass
+class RenderStats:
+    """Memoization statistics of a prompt registry."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PromptRegistry:
+    """Registry of versioned prompt templates rendering each parameter set once.
+
+    Rendered prompts are kept in a bounded LRU cache keyed by template
+    version hash and parameters, so instructions built on every agent run
+    cost a dictionary lookup. Registering a new version of a template makes
+    it the active one; earlier versions stay available by version.
+
+    Args:
+        token_counter: Function counting the tokens of a text (defaults to
+            tiktoken if available, otherwise an estimate)
+        max_entries: Maximum number of rendered prompts kept
+
+    Example:
+        ```python
+        from pygentic_ai.prompts import prompt_registry
+
+        prompt_registry.register("support", "You help customers of {company}.", version="2")
+        prompt = prompt_registry.render("support", company="ACME")
+        print(prompt.text, prompt.tokens, prompt.version_hash)
+        ```
+    """
+
+    def __init__(self, token_counter: Callable[[str], int] | None = None, max_entries: int = 1024) -> None:
+        self.token_counter = token_counter or count_tokens
+        self.max_entries = max_entries
+        self.stats = RenderStats()
+        self._templates: dict[str, dict[str, PromptTemplate]] = {}
+        self._active: dict[str, str] = {}
+        self._rendered: OrderedDict[tuple[Hashable, ...], RenderedPrompt] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, name: str, template: str, version: str = "1", **defaults: Any) -> PromptTemplate:
+        """Register a template version and make it the active version of its name.
+
+        Args:
+            name: Template name
+            template: Template text with ``str.format`` placeholders
+            version: Version label
+            **defaults: Default values of placeholders
+
+        Returns:
+            The registered template
+        """
+        prompt_template = PromptTemplate(name=name, template=template, version=version, defaults=defaults)
+        with self._lock:
+            self._templates.setdefault(name, {})[version] = prompt_template
+            self._active[name] = version
+        return prompt_template
+
+    def get(self, name: str, version: str | None = None) -> PromptTemplate:
+        """Get the active (or a given) version of a template."""
+        try:
+            versions = self._templates[name]
+            return versions[version or self._active[name]]
+        except KeyError:
+            raise KeyError(f"Prompt template '{name}' (version {version or 'active'}) is not registered") from None
+
+    def render(self, name: str, version: str | None = None, **params: Any) -> RenderedPrompt:
+        """Render a template, reusing the result for parameters rendered before.
+
+        Args:
+            name: Template name
+            version: Template version (defaults to the active one)
+            **params: Placeholder values
+
+        Returns:
+            Rendered prompt with its token count and template version hash
+        """
+        prompt_template = self.get(name, version)
+        try:
+            key: tuple[Hashable, ...] = (prompt_template.version_hash, *sorted(params.items()))
+            hash(key)
+        except TypeError:
+            return RenderedPrompt(prompt_template.format(**params), prompt_template, self.token_counter)
+
+        with self._lock:
+            rendered = self._rendered.get(key)
+            if rendered is not None:
+                self._rendered.move_to_end(key)
+                self.stats.hits += 1
+                return rendered
+            self.stats.misses += 1
+
+        rendered = RenderedPrompt(prompt_template.format(**params), prompt_template, self.token_counter)
+        with self._lock:
+            self._rendered[key] = rendered
+            while len(self._rendered) > self.max_entries:
+                self._rendered.popitem(last=False)
+                self.stats.evictions += 1
+        return rendered
+
+    def text(self, name: str, **params: Any) -> str:
+        """Render the active version of a template and return its text."""
+        return self.render(name, **params).text
+
+    def version_hash(self, name: str) -> str:
+        """Get the version hash of the active version of a template."""
+        return self.get(name).version_hash
+
+    def version_hashes(self) -> dict[str, str]:
+        """Get the version hashes of the active versions of all templates."""
+        return {name: self.get(name).version_hash for name in self._active}
+
+    def fingerprint(self) -> str:
+        """Hash of all active template versions, changing whenever any prompt changes."""
+        content = "\0".join(f"{name}={digest}" for name, digest in sorted(self.version_hashes().items()))
+        return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+    def clear_cache(self) -> None:
+        """Drop all rendered prompts."""
+        with self._lock:
+            self._rendered.clear()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._active
+
+
+prompt_registry = PromptRegistry()
@@ -1,8 +1,11 @@
 """Worker agent prompts for specialized tasks."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic_ai import RunContext
+from pygentic_ai.prompts.registry import prompt_registry
+
+if TYPE_CHECKING:
+    from pydantic_ai import RunContext
 
 TEXT_ROUTER_INSTRUCTIONS = """
 You are a routing model designed to classify user messages depending on the
@@ -23,13 +26,16 @@ sentence reasoning. Return the route number (1, 2, or 3) and reasoning.
 """
 
 
-def get_router_instructions(ctx: RunContext[None]) -> str:
+prompt_registry.register("router", TEXT_ROUTER_INSTRUCTIONS)
+
+
+def get_router_instructions(ctx: "RunContext[None]") -> str:
     """Get router classification instructions.
 
     Args:
         ctx: RunContext
     """
-    return TEXT_ROUTER_INSTRUCTIONS
+    return prompt_registry.text("router")
 
 
 TEXT_TRANSLATOR_INSTRUCTIONS = """
@@ -42,14 +48,20 @@ Ensure proper grammar and natural phrasing.
 """
 
 
-def get_translator_instructions(ctx: RunContext[str]) -> str:
+prompt_registry.register(
+    "translator",
+    TEXT_TRANSLATOR_INSTRUCTIONS + "\n\nPlease translate the following text into {target_language} language.",
+)
+
+
+def get_translator_instructions(ctx: "RunContext[Any]") -> str:
     """Get translator instructions with target language context.
 
     Args:
-        ctx: RunContext containing the target language
+        ctx: RunContext containing the target language (as deps or their ``target_language``)
     """
-    target_language = ctx.deps if ctx.deps else "English"
-    return f"{TEXT_TRANSLATOR_INSTRUCTIONS}\n\nPlease translate the following text into {target_language} language."
+    target_language = getattr(ctx.deps, "target_language", ctx.deps) or "English"
+    return prompt_registry.text("translator", target_language=target_language)
 
 
 TEXT_GUARDRAILS_INSTRUCTIONS = """
@@ -59,46 +71,67 @@ guidelines.
 """
 
 
-def get_guardrails_instructions(ctx: RunContext[Any]) -> str:
+TEXT_OUTPUT_RULES = """
+- Use maximum of around {soft_word_limit} words - prioritize key information
+  and trim secondary details
+- NEVER use emoticons in your responses
+- NEVER include parts of your inner reasoning or summarization of your
+  actions (i.e. "I used tool to gather information") in your response
+- NEVER start your response with "Answer:" - use natural language as
+  defined for your profile
+"""
+
+
+prompt_registry.register("output_rules", TEXT_OUTPUT_RULES)
+prompt_registry.register(
+    "guardrails",
+    TEXT_GUARDRAILS_INSTRUCTIONS
+    + """
+**The output MUST be returned in {language} language.**
+
+## Output Rules:
+{output_rules}
+## Reformatting Guidelines:
+- Preserve all critical information while condensing verbose explanations
+- If the input message already follows the rules, do not change the message
+""",
+)
+
+
+def get_output_rules(soft_word_limit: int) -> str:
+    """Get the output rules enforced by the guardrails, shared with agents that follow them inline.
+
+    Args:
+        soft_word_limit: Approximate maximum number of words
+    """
+    return prompt_registry.text("output_rules", soft_word_limit=soft_word_limit)
+
+
+def get_guardrails_instructions(ctx: "RunContext[Any]") -> str:
     """Get guardrails instructions with formatting parameters.
 
     Args:
         ctx: RunContext containing formatting parameters (language, word_limit, etc.)
     """
     language = ctx.deps.language if ctx.deps and hasattr(ctx.deps, "language") else "english"
-    soft_word_limit = 250  # Default value
-
-    return f"""{TEXT_GUARDRAILS_INSTRUCTIONS}
-    **The output MUST be returned in {language} language.**
-
-    ## Length Control Guidelines:
-    - Use maximum of around {soft_word_limit} words
-    - If the input exceeds these limits, prioritize key information and trim secondary details
-    - Preserve all critical information while condensing verbose explanations
-    - If the input message fits the length guidelines, do not change the message
-
-    ## Formatting Rules:
-    - NEVER use emoticons in your responses
-    - NEVER include parts of your inner reasoning or summarization of your
-      actions (i.e. "I used tool to gather information") in your response
-    - NEVER start your response with "Answer:" - use natural language as
-      defined for your profile
-    """
+    soft_word_limit = getattr(ctx.deps, "soft_word_limit", 250)
+
+    return prompt_registry.text("guardrails", language=language, output_rules=get_output_rules(soft_word_limit))
 
 
 class RouterInstructions:
     """Router agent instructions."""
 
     @staticmethod
-    def classify_message(ctx: RunContext[None]) -> str:
-        return TEXT_ROUTER_INSTRUCTIONS
+    def classify_message(ctx: "RunContext[None]") -> str:
+        return prompt_registry.text("router")
 
 
 class TranslatorInstructions:
     """Translator agent instructions."""
 
     @staticmethod
-    def translate_text(ctx: RunContext[str]) -> str:
+    def translate_text(ctx: "RunContext[str]") -> str:
         return get_translator_instructions(ctx)
 
 
@@ -106,5 +139,5 @@ class GuardrailsInstructions:
     """Guardrails agent instructions."""
 
     @staticmethod
-    def reformat_output(ctx: RunContext[dict]) -> str:
+    def reformat_output(ctx: "RunContext[dict]") -> str:
         return get_guardrails_instructions(ctx)
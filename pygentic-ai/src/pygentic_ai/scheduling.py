@@ -0,0 +1,276 @@
+"""Priority lanes sharing agent capacity between workloads."""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Lane:
+    """Scheduling lane of a workload.
+
+    Attributes:
+        name: Lane name, referenced by the ``lane`` of the execution scope
+        weight: Share of capacity relative to other lanes with waiting calls of the same
+            kind (preemptible or not); between the two kinds priority is strict
+        max_concurrency: Maximum number of running calls of the lane
+        tokens_per_minute: Token budget of the lane over the scheduler's token window
+        preemptible: Whether queued calls of the lane yield to queued calls of
+            non-preemptible lanes (running calls are never interrupted)
+    """
+
+    name: str
+    weight: float = 1.0
+    max_concurrency: int | None = None
+    tokens_per_minute: int | None = None
+    preemptible: bool = False
+
+    def __post_init__(self) -> None:
+        if self.weight <= 0:
+            raise ValueError(f"Lane '{self.name}' weight must be positive")
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError(f"Lane '{self.name}' max_concurrency must be at least 1")
+        if self.tokens_per_minute is not None and self.tokens_per_minute <= 0:
+            raise ValueError(f"Lane '{self.name}' tokens_per_minute must be positive")
+
+
+DEFAULT_LANES = (
+    Lane("interactive", weight=8.0),
+    Lane("batch", weight=1.0, preemptible=True),
+)
+
+
+@dataclass
+class LaneStats:
+    """Statistics of a scheduling lane.
+
+    ``deferred`` counts the queued calls of a preemptible lane that were passed
+    over by a call of a non-preemptible lane, each call at most once.
+    """
+
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    tokens: int = 0
+    deferred: int = 0
+    wait_time: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        started = self.completed + self.running
+        return self.wait_time / started if started else 0.0
+
+
+@dataclass
+class _LaneState:
+    lane: Lane
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+    # Number of waiters at the head of the queue already counted as deferred
+    deferred_waiters: int = 0
+    running: int = 0
+    virtual_time: float = 0.0
+    token_log: deque[tuple[float, int]] = field(default_factory=deque)
+    stats: LaneStats = field(default_factory=LaneStats)
+
+    def pop_waiter(self) -> asyncio.Future[None]:
+        self.deferred_waiters = max(self.deferred_waiters - 1, 0)
+        return self.waiters.popleft()
+
+    def remove_waiter(self, waiter: asyncio.Future[None]) -> None:
+        if self.waiters.index(waiter) < self.deferred_waiters:
+            self.deferred_waiters -= 1
+        self.waiters.remove(waiter)
+
+    def defer_waiters(self) -> None:
+        self.stats.deferred += len(self.waiters) - self.deferred_waiters
+        self.deferred_waiters = len(self.waiters)
+
+    def tokens_in_window(self, now: float, window: float) -> int:
+        while self.token_log and self.token_log[0][0] <= now - window:
+            self.token_log.popleft()
+        return sum(tokens for _, tokens in self.token_log)
+
+
+class LaneScheduler:
+    """Schedules agent calls from several workloads onto shared capacity.
+
+    At most ``max_concurrency`` calls run at once. When a slot frees up it
+    goes to the lane with waiting calls that has received the least
+    capacity relative to its weight (weighted fair queuing), skipping lanes
+    at their concurrency cap or over their token budget. Queued calls of
+    preemptible lanes (batch work by default) yield to any queued call of a
+    non-preemptible lane, so interactive traffic jumps the batch queue while
+    batch jobs use whatever capacity is left.
+
+    This priority is strict: weights only share capacity among preemptible
+    lanes or among non-preemptible ones. As long as non-preemptible calls are
+    queued, preemptible lanes get no new slots whatever their weight; cap the
+    interactive lanes with ``max_concurrency`` (or make the batch lane
+    non-preemptible) to guarantee batch work a share.
+
+    Agents created with ``scheduler=...`` run every call through the
+    scheduler, in the lane of the current execution scope (``default_lane``
+    if unset).
+
+    Args:
+        lanes: Lane definitions
+        max_concurrency: Maximum number of concurrent agent calls across lanes
+        default_lane: Lane of calls made outside a lane scope
+        token_window: Seconds over which lane token budgets are measured
+
+    Example:
+        ```python
+        from pygentic_ai.context import execution_scope
+        from pygentic_ai.scheduling import Lane, LaneScheduler
+
+        scheduler = LaneScheduler(
+            lanes=[
+                Lane("interactive", weight=8),
+                Lane("batch", max_concurrency=8, tokens_per_minute=200_000, preemptible=True),
+            ],
+            max_concurrency=32,
+        )
+        agent = ReasoningAgent(api_key="sk-...", scheduler=scheduler)
+
+        with execution_scope(lane="batch"):
+            await agent.generate_response("Summarize this report...")
+        ```
+    """
+
+    def __init__(
+        self,
+        lanes: Iterable[Lane] = DEFAULT_LANES,
+        max_concurrency: int = 16,
+        default_lane: str = "interactive",
+        token_window: float = 60.0,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.default_lane = default_lane
+        self.token_window = token_window
+        self._lanes = {lane.name: _LaneState(lane) for lane in lanes}
+        if default_lane not in self._lanes:
+            raise ValueError(f"Default lane '{default_lane}' is not defined")
+        self._running = 0
+        self._virtual_clock = 0.0
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    @asynccontextmanager
+    async def slot(self, lane: str | None = None) -> AsyncIterator[None]:
+        """Hold a slot of a lane for the duration of an agent call.
+
+        Args:
+            lane: Lane name (defaults to ``default_lane``)
+        """
+        state = self._state(lane)
+        await self._acquire(state)
+        try:
+            yield
+        finally:
+            self._release(state)
+
+    def record_tokens(self, lane: str | None, tokens: int) -> None:
+        """Charge tokens used by a call to its lane budget."""
+        state = self._state(lane)
+        state.stats.tokens += tokens
+        if state.lane.tokens_per_minute is not None and tokens:
+            state.token_log.append((time.monotonic(), tokens))
+
+    def stats(self) -> dict[str, LaneStats]:
+        """Get statistics of every lane."""
+        for state in self._lanes.values():
+            state.stats.queued = sum(1 for waiter in state.waiters if not waiter.done())
+            state.stats.running = state.running
+        return {name: state.stats for name, state in self._lanes.items()}
+
+    def _state(self, lane: str | None) -> _LaneState:
+        name = lane or self.default_lane
+        try:
+            return self._lanes[name]
+        except KeyError:
+            raise ValueError(f"Unknown lane '{name}'") from None
+
+    async def _acquire(self, state: _LaneState) -> None:
+        if not state.waiters:
+            # A lane that was idle does not get credit for the capacity it did not use
+            state.virtual_time = max(state.virtual_time, self._virtual_clock)
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        queued_at = time.monotonic()
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just as the call was cancelled
+                self._release(state)
+            else:
+                waiter.cancel()
+                if waiter in state.waiters:
+                    state.remove_waiter(waiter)
+            raise
+        waited = time.monotonic() - queued_at
+        state.stats.wait_time += waited
+        state.stats.max_wait = max(state.stats.max_wait, waited)
+
+    def _release(self, state: _LaneState) -> None:
+        self._running -= 1
+        state.running -= 1
+        state.stats.completed += 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._running < self.max_concurrency:
+            state = self._next_lane()
+            if state is None:
+                return
+            waiter = state.pop_waiter()
+            self._running += 1
+            state.running += 1
+            self._virtual_clock = state.virtual_time
+            state.virtual_time += 1.0 / state.lane.weight
+            waiter.set_result(None)
+
+    def _next_lane(self) -> _LaneState | None:
+        now = time.monotonic()
+        eligible: list[_LaneState] = []
+        budget_blocked: list[_LaneState] = []
+        for state in self._lanes.values():
+            while state.waiters and state.waiters[0].done():
+                state.pop_waiter()
+            if not state.waiters:
+                continue
+            lane = state.lane
+            if lane.max_concurrency is not None and state.running >= lane.max_concurrency:
+                continue
+            if lane.tokens_per_minute is not None:
+                budget = lane.tokens_per_minute * self.token_window / 60.0
+                if state.tokens_in_window(now, self.token_window) >= budget:
+                    budget_blocked.append(state)
+                    continue
+            eligible.append(state)
+
+        if budget_blocked:
+            self._schedule_wakeup(budget_blocked)
+
+        if any(not state.lane.preemptible for state in eligible):
+            for state in eligible:
+                if state.lane.preemptible:
+                    state.defer_waiters()
+            eligible = [state for state in eligible if not state.lane.preemptible]
+        if not eligible:
+            return None
+        return min(eligible, key=lambda state: state.virtual_time)
+
+    def _schedule_wakeup(self, blocked: list[_LaneState]) -> None:
+        if self._wakeup is not None and not self._wakeup.cancelled():
+            self._wakeup.cancel()
+        logged = [state.token_log[0][0] for state in blocked if state.token_log]
+        if not logged:
+            return
+        expires = min(logged) + self.token_window
+        delay = max(expires - time.monotonic(), 0.0) + 0.001
+        self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
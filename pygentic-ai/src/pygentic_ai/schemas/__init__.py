@@ -1,10 +1,22 @@
 """Schemas and enums for pygentic-ai."""
 
-from pygentic_ai.schemas.agent import AgentMode, TaskType
-from pygentic_ai.schemas.messages import MessageRole
+from typing import TYPE_CHECKING
+
+from pygentic_ai.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pygentic_ai.schemas.agent import AgentMode, TaskType
+    from pygentic_ai.schemas.messages import MessageRole
+
+_EXPORTS = {
+    "pygentic_ai.schemas.agent": ["AgentMode", "TaskType"],
+    "pygentic_ai.schemas.messages": ["MessageRole"],
+}
 
 __all__ = [
     "AgentMode",
     "TaskType",
     "MessageRole",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,470 @@
+"""Pre-forking HTTP server exposing a workflow graph."""
+
+import argparse
+import asyncio
+import json
+import os
+import pkgutil
+import signal
+import socket
+import time
+import traceback
+from contextlib import nullcontext, suppress
+from http import HTTPStatus
+from typing import Any, Callable
+
+from pydantic_ai.messages import ModelMessagesTypeAdapter
+from pydantic_graph import Graph
+
+from pygentic_ai.manager import AgentManager
+from pygentic_ai.profiling import Profiler
+from pygentic_ai.workflows.admission import AdmissionController, OverloadedError
+from pygentic_ai.workflows.agent_workflow import user_assistant_graph
+from pygentic_ai.workflows.coalescing import WorkflowCoalescer
+from pygentic_ai.workflows.state import WorkflowState
+
+# Deps a client may set; run ids and scheduling lanes are assigned by the server
+REQUEST_FIELDS = ("message", "language", "chat_history", "target_language", "session_id", "tenant")
+MAX_BODY_SIZE = 1 << 20
+READ_TIMEOUT = 30.0
+
+
+class _BadRequestError(Exception):
+    def __init__(self, status: HTTPStatus, detail: str) -> None:
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+class WorkflowServer:
+    """HTTP server running a workflow graph in pre-forked worker processes.
+
+    The parent process imports the framework and builds the agents once,
+    binds the listening socket and forks ``workers`` processes that accept
+    connections from the shared socket, so every worker starts without
+    repeating the cold start. Each worker runs its own event loop, opens its
+    own MCP connections (``AgentManager.initialize``) and bounds its load
+    with an ``AdmissionController``.
+
+    Endpoints:
+        ``POST /workflow``: JSON body with ``message`` and optionally
+        ``language``, ``chat_history`` (Pydantic AI messages), ``target_language``,
+        ``session_id`` and ``tenant``; returns ``{"response": ...}``. Runs get
+        their own run id and the server's ``lane``.
+        ``GET /healthz``: health and load of the worker serving the request.
+        ``GET /profile``: profiler report of the worker serving the request (with a ``profiler``).
+
+    Signals sent to the parent:
+        ``SIGHUP``: graceful restart (fork new workers, drain old ones); the agents
+        are rebuilt only if ``manager`` is a function creating the manager
+        ``SIGTERM``/``SIGINT``: graceful shutdown
+
+    A client whose connection is reset or lost before its response is ready
+    cancels the workflow run. Closing only the sending side after the body
+    (half-close) keeps the run going.
+
+    Args:
+        manager: Agent manager, or a function creating it (called again on restart to
+            rebuild the agents; a manager instance is reused as is)
+        graph: Workflow graph to serve
+        host: Address to bind
+        port: Port to bind
+        workers: Number of worker processes (defaults to the CPU count)
+        budget: End-to-end time budget per request in seconds
+        max_in_flight: Maximum concurrent workflow runs per worker
+        max_queue: Maximum number of requests waiting per worker
+        drain_timeout: Seconds a stopping worker waits for in-flight requests
+        coalesce: Whether identical concurrent requests share one workflow run
+        lane: Scheduling lane of the runs' agent calls (see ``LaneScheduler``)
+        profiler: Profiler sampling the runs and watching the event loop of each worker
+        verbose: Whether to print lifecycle messages
+
+    Example:
+        ```python
+        from pygentic_ai.server import WorkflowServer
+
+        def create_manager() -> AgentManager:
+            manager = AgentManager()
+            manager.register("router", GenericRouter, api_key=config.api_key)
+            ...
+            return manager
+
+        WorkflowServer(create_manager, port=8000, workers=4, budget=30).serve_forever()
+        ```
+    """
+
+    def __init__(
+        self,
+        manager: AgentManager | Callable[[], AgentManager],
+        graph: Graph[WorkflowState, dict, str] = user_assistant_graph,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        workers: int | None = None,
+        budget: float | None = None,
+        max_in_flight: int = 64,
+        max_queue: int = 256,
+        drain_timeout: float = 30.0,
+        coalesce: bool = False,
+        lane: str | None = None,
+        profiler: Profiler | None = None,
+        verbose: bool = False,
+    ) -> None:
+        self.manager_factory = manager if callable(manager) and not isinstance(manager, AgentManager) else None
+        self.manager: AgentManager | None = manager if isinstance(manager, AgentManager) else None
+        self.graph = graph
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.budget = budget
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.drain_timeout = drain_timeout
+        self.coalesce = coalesce
+        self.lane = lane
+        self.profiler = profiler
+        self.verbose = verbose
+        self.worker_id = 0
+        self.admission: AdmissionController | None = None
+        self.coalescer: WorkflowCoalescer | None = None
+        self._stopping: asyncio.Event | None = None
+        self._connections: set[asyncio.Task] = set()
+        self._started_at = time.monotonic()
+        self._handled = 0
+        self._errors = 0
+        self._restart_requested = False
+        self._shutdown_requested = False
+
+    def serve_forever(self) -> None:
+        """Bind the socket, fork the workers and supervise them until shutdown.
+
+        Workers that exit unexpectedly are replaced.
+        """
+        listener = socket.create_server((self.host, self.port), backlog=1024)
+        self._load_manager()
+        if self.verbose:
+            print(f"Serving {self.graph.name} on http://{self.host}:{self.port} with {self.workers} workers")
+
+        signal.signal(signal.SIGHUP, self._request_restart)
+        signal.signal(signal.SIGTERM, self._request_shutdown)
+        signal.signal(signal.SIGINT, self._request_shutdown)
+
+        workers = {self._fork_worker(listener, worker_id): worker_id for worker_id in range(self.workers)}
+        retiring: set[int] = set()
+        try:
+            while not self._shutdown_requested:
+                if self._restart_requested:
+                    self._restart_requested = False
+                    if self.manager_factory is None and self.verbose:
+                        print("Restarting workers with the same agents (pass a manager factory to rebuild them)")
+                    self._load_manager(rebuild=True)
+                    retiring.update(workers)
+                    workers = {self._fork_worker(listener, worker_id): worker_id for worker_id in range(self.workers)}
+                    for pid in retiring:
+                        _signal_process(pid, signal.SIGTERM)
+                    if self.verbose:
+                        print(f"Restarted workers, draining {len(retiring)} old workers")
+
+                for pid in _reap_children():
+                    retiring.discard(pid)
+                    if pid in workers:
+                        worker_id = workers.pop(pid)
+                        if self.verbose:
+                            print(f"Worker {worker_id} (pid {pid}) exited, restarting it")
+                        workers[self._fork_worker(listener, worker_id)] = worker_id
+                time.sleep(0.1)
+        finally:
+            remaining = set(workers) | retiring
+            for pid in remaining:
+                _signal_process(pid, signal.SIGTERM)
+            deadline = time.monotonic() + self.drain_timeout + 5
+            while remaining and time.monotonic() < deadline:
+                remaining -= set(_reap_children())
+                time.sleep(0.1)
+            for pid in remaining:
+                _signal_process(pid, signal.SIGKILL)
+            listener.close()
+            if self.verbose:
+                print("Server stopped")
+
+    async def serve(self, listener: socket.socket, install_signal_handlers: bool = True) -> None:
+        """Serve requests from a listening socket in the current process until ``stop`` is called.
+
+        Args:
+            listener: Bound, listening socket
+            install_signal_handlers: Whether ``SIGTERM`` and ``SIGINT`` stop the server
+        """
+        self._load_manager()
+        assert self.manager is not None
+        self._stopping = asyncio.Event()
+        self.admission = AdmissionController(max_in_flight=self.max_in_flight, max_queue=self.max_queue)
+        if self.coalesce:
+            self.coalescer = WorkflowCoalescer(runner=self.admission.run, manager=self.manager)
+        loop = asyncio.get_running_loop()
+        if install_signal_handlers:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                loop.add_signal_handler(signum, self.stop)
+
+        await self.manager.initialize()
+        if self.profiler is not None:
+            await self.profiler.start()
+        server = await asyncio.start_server(self._handle_connection, sock=listener)
+        if self.verbose:
+            print(f"Worker {self.worker_id} (pid {os.getpid()}) ready")
+
+        async with server:
+            await self._stopping.wait()
+            server.close()
+            if self._connections:
+                await asyncio.wait(set(self._connections), timeout=self.drain_timeout)
+        if self.profiler is not None:
+            await self.profiler.stop()
+        if self.verbose:
+            print(f"Worker {self.worker_id} (pid {os.getpid()}) stopped")
+
+    def stop(self) -> None:
+        """Stop accepting connections and finish in-flight requests."""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    def health(self) -> dict[str, Any]:
+        """Health and load of this worker."""
+        stats = self.admission.stats if self.admission is not None else None
+        return {
+            "status": "draining" if self._stopping is not None and self._stopping.is_set() else "ok",
+            "worker": self.worker_id,
+            "pid": os.getpid(),
+            "uptime": round(time.monotonic() - self._started_at, 3),
+            "handled": self._handled,
+            "errors": self._errors,
+            "in_flight": stats.in_flight if stats else 0,
+            "queue_depth": stats.queue_depth if stats else 0,
+            "shed": stats.shed if stats else 0,
+        }
+
+    def _load_manager(self, rebuild: bool = False) -> None:
+        if self.manager_factory is not None and (self.manager is None or rebuild):
+            self.manager = self.manager_factory()
+        assert self.manager is not None
+        self.manager.build()
+
+    def _fork_worker(self, listener: socket.socket, worker_id: int) -> int:
+        pid = os.fork()
+        if pid:
+            return pid
+
+        exit_code = 0
+        try:
+            for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, signal.SIG_DFL)
+            self.worker_id = worker_id
+            self._started_at = time.monotonic()
+            asyncio.run(self.serve(listener))
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _request_restart(self, signum: int, frame: Any) -> None:
+        self._restart_requested = True
+
+    def _request_shutdown(self, signum: int, frame: Any) -> None:
+        self._shutdown_requested = True
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        try:
+            try:
+                async with asyncio.timeout(READ_TIMEOUT):
+                    method, path, body = await _read_request(reader)
+                response = await self._dispatch(method, path, body, writer)
+            except _BadRequestError as e:
+                response = (e.status, {"error": e.detail})
+            except (TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                return
+            if response is not None:
+                status, payload = response
+                self._handled += 1
+                await _write_response(writer, status, payload)
+        finally:
+            self._connections.discard(task)
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _dispatch(
+        self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter
+    ) -> tuple[HTTPStatus, dict[str, Any]] | None:
+        if path == "/healthz":
+            if method != "GET":
+                raise _BadRequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET")
+            health = self.health()
+            status = HTTPStatus.OK if health["status"] == "ok" else HTTPStatus.SERVICE_UNAVAILABLE
+            return status, health
+        if path == "/profile":
+            if method != "GET":
+                raise _BadRequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET")
+            if self.profiler is None:
+                raise _BadRequestError(HTTPStatus.NOT_FOUND, "Profiling is not enabled")
+            return HTTPStatus.OK, self.profiler.report()
+        if path != "/workflow":
+            raise _BadRequestError(HTTPStatus.NOT_FOUND, f"Unknown path: {path}")
+        if method != "POST":
+            raise _BadRequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST")
+
+        request_deps = _parse_workflow_request(body)
+        if self.lane is not None:
+            request_deps["lane"] = self.lane
+        run = asyncio.ensure_future(self._run_workflow(request_deps))
+        # A half-closed connection (end of input after the body) is no disconnect, a reset or lost one is
+        disconnect = asyncio.ensure_future(_connection_lost(writer))
+        try:
+            await asyncio.wait({run, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+            if not run.done():
+                # The client went away: cancel the run and its in-flight model calls
+                run.cancel()
+                with suppress(asyncio.CancelledError):
+                    await run
+                return None
+            return await run
+        finally:
+            disconnect.cancel()
+            run.cancel()
+
+    async def _run_workflow(self, request_deps: dict[str, Any]) -> tuple[HTTPStatus, dict[str, Any]]:
+        assert self.manager is not None
+        assert self.admission is not None
+        profiling = self.profiler.run() if self.profiler is not None else nullcontext()
+        try:
+            with profiling:
+                if self.coalescer is not None:
+                    # The shared run pins the agents itself, for as long as any request waits on it
+                    response = await self.coalescer.run(request_deps, self.graph, budget=self.budget)
+                else:
+                    async with self.manager.session(**request_deps) as deps:
+                        response = await self.admission.run(deps, self.graph, budget=self.budget)
+        except OverloadedError as e:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(e)}
+        except Exception as e:
+            self._errors += 1
+            if self.verbose:
+                print(f"Workflow failed: {type(e).__name__}: {e}")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Workflow failed"}
+        return HTTPStatus.OK, {"response": response}
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes]:
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    if not request_line:
+        raise asyncio.IncompleteReadError(b"", None)
+    try:
+        method, target, _ = request_line.split(" ", 2)
+    except ValueError:
+        raise _BadRequestError(HTTPStatus.BAD_REQUEST, "Malformed request line") from None
+
+    content_length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            try:
+                content_length = int(value.strip())
+            except ValueError:
+                raise _BadRequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length") from None
+    if content_length < 0:
+        raise _BadRequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+    if content_length > MAX_BODY_SIZE:
+        raise _BadRequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+
+    body = await reader.readexactly(content_length) if content_length else b""
+    return method.upper(), target.split("?", 1)[0], body
+
+
+def _parse_workflow_request(body: bytes) -> dict[str, Any]:
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise _BadRequestError(HTTPStatus.BAD_REQUEST, "Body must be JSON") from None
+    if not isinstance(payload, dict) or not isinstance(payload.get("message"), str):
+        raise _BadRequestError(HTTPStatus.BAD_REQUEST, "Body must be an object with a 'message' string")
+
+    request_deps = {key: payload[key] for key in REQUEST_FIELDS if payload.get(key) is not None}
+    try:
+        request_deps["chat_history"] = ModelMessagesTypeAdapter.validate_python(payload.get("chat_history") or [])
+    except ValueError as e:
+        raise _BadRequestError(HTTPStatus.BAD_REQUEST, f"Invalid chat_history: {e}") from None
+    return request_deps
+
+
+async def _connection_lost(writer: asyncio.StreamWriter) -> None:
+    with suppress(ConnectionError):
+        await writer.wait_closed()
+
+
+async def _write_response(writer: asyncio.StreamWriter, status: HTTPStatus, payload: dict[str, Any]) -> None:
+    body = json.dumps(payload, ensure_ascii=False).encode()
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    with suppress(ConnectionError):
+        await writer.drain()
+
+
+def _reap_children() -> list[int]:
+    exited = []
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return exited
+        if pid == 0:
+            return exited
+        exited.append(pid)
+
+
+def _signal_process(pid: int, signum: int) -> None:
+    with suppress(ProcessLookupError):
+        os.kill(pid, signum)
+
+
+def main() -> None:
+    """Command line entry point: ``python -m pygentic_ai.server package.module:create_manager``."""
+    parser = argparse.ArgumentParser(description="Serve a pygentic-ai workflow over HTTP.")
+    parser.add_argument("manager", help="Import path of an AgentManager or a function creating one")
+    parser.add_argument("--graph", default=None, help="Import path of the workflow graph")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--budget", type=float, default=None, help="Time budget per request in seconds")
+    parser.add_argument("--max-in-flight", type=int, default=64)
+    parser.add_argument("--coalesce", action="store_true", help="Share runs between identical concurrent requests")
+    parser.add_argument("--lane", default=None, help="Scheduling lane of the served runs")
+    parser.add_argument(
+        "--profile-sample-rate", type=float, default=None, help="Share of runs to profile (served at /profile)"
+    )
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    graph = pkgutil.resolve_name(args.graph) if args.graph else user_assistant_graph
+    WorkflowServer(
+        pkgutil.resolve_name(args.manager),
+        graph=graph,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        budget=args.budget,
+        max_in_flight=args.max_in_flight,
+        coalesce=args.coalesce,
+        lane=args.lane,
+        profiler=Profiler(sample_rate=args.profile_sample_rate) if args.profile_sample_rate is not None else None,
+        verbose=args.verbose,
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,25 @@
 """Static messages and default responses."""
 
-from pygentic_ai.static.default_msgs import ERROR_GENERIC, REFUSAL_GENERIC
+from typing import TYPE_CHECKING
+
+from pygentic_ai.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pygentic_ai.static.catalog import LANGUAGE_ALIASES, MessageCatalog, message_catalog, normalize_language
+    from pygentic_ai.static.default_msgs import ERROR_GENERIC, REFUSAL_GENERIC
+
+_EXPORTS = {
+    "pygentic_ai.static.catalog": ["LANGUAGE_ALIASES", "MessageCatalog", "message_catalog", "normalize_language"],
+    "pygentic_ai.static.default_msgs": ["ERROR_GENERIC", "REFUSAL_GENERIC"],
+}
 
 __all__ = [
     "ERROR_GENERIC",
     "REFUSAL_GENERIC",
+    "LANGUAGE_ALIASES",
+    "MessageCatalog",
+    "message_catalog",
+    "normalize_language",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,255 @@
+"""Localized static messages with cached machine-translated fallbacks."""
+
+import asyncio
+import contextlib
+import contextvars
+import json
+import os
+import string
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pygentic_ai.static.default_msgs import ERROR_GENERIC, REFUSAL_GENERIC
+
+if TYPE_CHECKING:
+    from pygentic_ai.engines.translators import SimpleTranslatorWorker
+
+LANGUAGE_ALIASES: dict[str, str] = {
+    "en": "english",
+    "eng": "english",
+    "angielski": "english",
+    "pl": "polish",
+    "pol": "polish",
+    "polski": "polish",
+    "es": "spanish",
+    "spa": "spanish",
+    "español": "spanish",
+    "espanol": "spanish",
+    "castellano": "spanish",
+    "de": "german",
+    "deu": "german",
+    "ger": "german",
+    "deutsch": "german",
+    "fr": "french",
+    "fra": "french",
+    "français": "french",
+    "francais": "french",
+    "it": "italian",
+    "ita": "italian",
+    "italiano": "italian",
+    "pt": "portuguese",
+    "por": "portuguese",
+    "português": "portuguese",
+    "portugues": "portuguese",
+    "nl": "dutch",
+    "nederlands": "dutch",
+    "uk": "ukrainian",
+    "українська": "ukrainian",
+    "ru": "russian",
+    "русский": "russian",
+    "cs": "czech",
+    "čeština": "czech",
+    "sv": "swedish",
+    "svenska": "swedish",
+    "ja": "japanese",
+    "日本語": "japanese",
+    "zh": "chinese",
+    "中文": "chinese",
+    "ko": "korean",
+    "한국어": "korean",
+}
+
+DEFAULT_MESSAGES: dict[str, Mapping[str, str]] = {
+    "error_generic": ERROR_GENERIC,
+    "refusal_generic": REFUSAL_GENERIC,
+}
+
+
+def normalize_language(language: str | None, default: str = "english") -> str:
+    """Normalize a language name, code or locale to the catalog's language name.
+
+    Example:
+        ```python
+        normalize_language("pl-PL")    # "polish"
+        normalize_language(" Deutsch")  # "german"
+        normalize_language("Klingon")   # "klingon"
+        ```
+    """
+    if not language or not language.strip():
+        return default
+    name = language.strip().lower().replace("_", "-")
+    if name in LANGUAGE_ALIASES:
+        return LANGUAGE_ALIASES[name]
+    primary = name.split("-", 1)[0]
+    return LANGUAGE_ALIASES.get(primary, primary)
+
+
+def _fields(text: str) -> set[str] | None:
+    try:
+        return {field for _, field, _, _ in string.Formatter().parse(text) if field is not None}
+    except ValueError:
+        return None
+
+
+class MessageCatalog:
+    """Static user-facing messages in any language, served from memory.
+
+    Messages for languages that are not in the catalog are machine-translated
+    from the source language once, by the translator agent, and kept (and
+    persisted to ``path`` if given). Until a translation is available, and if
+    it fails, the source language message is served. Language names, codes
+    and locales are normalized, so ``"pl"``, ``"pl-PL"`` and ``"Polski"`` share
+    one entry.
+
+    Args:
+        messages: Messages by key and language (defaults to the generic error and refusal)
+        translator: Agent translating missing locales
+        path: JSON file where translated messages are persisted and loaded from
+        source_language: Language translations are made from
+        retry_after: Seconds before a failed translation is attempted again
+        verbose: Whether to print translations
+
+    Example:
+        ```python
+        from pygentic_ai.static import MessageCatalog
+
+        catalog = MessageCatalog(translator=manager.get("translator"), path="messages.json")
+        text = await catalog.aget("refusal_generic", "pt-BR")
+        ```
+    """
+
+    def __init__(
+        self,
+        messages: Mapping[str, Mapping[str, str]] | None = None,
+        translator: "SimpleTranslatorWorker | None" = None,
+        path: str | Path | None = None,
+        source_language: str = "english",
+        retry_after: float = 300.0,
+        verbose: bool = False,
+    ) -> None:
+        self.translator = translator
+        self.path = Path(path) if path is not None else None
+        self.source_language = source_language
+        self.retry_after = retry_after
+        self.verbose = verbose
+        self._messages: dict[str, dict[str, str]] = {
+            key: {normalize_language(language): text.strip() for language, text in texts.items()}
+            for key, texts in (messages or DEFAULT_MESSAGES).items()
+        }
+        self._translated: dict[str, dict[str, str]] = {}
+        self._pending: dict[tuple[str, str], asyncio.Task[str | None]] = {}
+        self._failed: dict[tuple[str, str], float] = {}
+        self._write_lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self._translated = json.loads(self.path.read_text(encoding="utf-8"))
+
+    def get(self, key: str, language: str | None, translator: "SimpleTranslatorWorker | None" = None) -> str:
+        """Get a message without waiting for a translation.
+
+        If the language is missing and a translator is available, it is
+        translated in the background for later requests.
+
+        Args:
+            key: Message key
+            language: Language name, code or locale
+            translator: Translator to use instead of the catalog's one
+        """
+        language = normalize_language(language, self.source_language)
+        text = self._lookup(key, language)
+        if text is not None:
+            return text
+        if translator or self.translator:
+            # Without a running event loop there is nothing to translate in
+            with contextlib.suppress(RuntimeError):
+                self._translation(key, language, translator)
+        return self._source(key)
+
+    async def aget(self, key: str, language: str | None, translator: "SimpleTranslatorWorker | None" = None) -> str:
+        """Get a message, translating it first if the language is missing.
+
+        Concurrent requests for the same missing message share one translation.
+
+        Args:
+            key: Message key
+            language: Language name, code or locale
+            translator: Translator to use instead of the catalog's one
+        """
+        language = normalize_language(language, self.source_language)
+        text = self._lookup(key, language)
+        if text is not None:
+            return text
+        if translator or self.translator:
+            task = self._translation(key, language, translator)
+            if task is not None and (translated := await asyncio.shield(task)) is not None:
+                return translated
+        return self._source(key)
+
+    async def prefetch(self, languages: Iterable[str], translator: "SimpleTranslatorWorker | None" = None) -> None:
+        """Translate every message into the given languages ahead of time."""
+        keys = list(self._messages)
+        await asyncio.gather(*(self.aget(key, language, translator) for language in languages for key in keys))
+
+    def languages(self, key: str) -> set[str]:
+        """Languages a message is available in, built-in or translated."""
+        return set(self._messages[key]) | {language for language, texts in self._translated.items() if key in texts}
+
+    def _lookup(self, key: str, language: str) -> str | None:
+        if key not in self._messages:
+            raise KeyError(f"Unknown message '{key}'")
+        return self._messages[key].get(language) or self._translated.get(language, {}).get(key)
+
+    def _source(self, key: str) -> str:
+        return self._messages[key][self.source_language]
+
+    def _translation(
+        self, key: str, language: str, translator: "SimpleTranslatorWorker | None"
+    ) -> "asyncio.Task[str | None] | None":
+        pending = self._pending.get((key, language))
+        if pending is not None:
+            return pending
+        failed_at = self._failed.get((key, language))
+        if failed_at is not None and time.monotonic() - failed_at < self.retry_after:
+            return None
+        # The translation is shared by all requests, so it runs outside the scope (deadline, lane) of this one
+        task = asyncio.get_running_loop().create_task(
+            self._translate(key, language, translator or self.translator), context=contextvars.Context()
+        )
+        self._pending[(key, language)] = task
+        task.add_done_callback(lambda _: self._pending.pop((key, language), None))
+        return task
+
+    async def _translate(self, key: str, language: str, translator: "SimpleTranslatorWorker | None") -> str | None:
+        assert translator is not None
+        source = self._source(key)
+        try:
+            translated = (await translator.translate(source, language)).strip()
+        except Exception as e:
+            if self.verbose:
+                print(f"Failed to translate message '{key}' to {language}: {e}")
+            self._failed[(key, language)] = time.monotonic()
+            return None
+        if not translated or _fields(translated) != _fields(source):
+            if self.verbose:
+                print(f"Discarded translation of message '{key}' to {language}: placeholders do not match")
+            self._failed[(key, language)] = time.monotonic()
+            return None
+
+        self._translated.setdefault(language, {})[key] = translated
+        if self.verbose:
+            print(f"Translated message '{key}' to {language}")
+        if self.path is not None:
+            await asyncio.to_thread(self._persist, json.dumps(self._translated, ensure_ascii=False, indent=2))
+        return translated
+
+    def _persist(self, data: str) -> None:
+        assert self.path is not None
+        temporary = self.path.with_suffix(self.path.suffix + ".tmp")
+        with self._write_lock:
+            temporary.write_text(data, encoding="utf-8")
+            os.replace(temporary, self.path)
+
+
+message_catalog = MessageCatalog()
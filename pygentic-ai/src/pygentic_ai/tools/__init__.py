@@ -1,14 +1,40 @@
 """Tools for agents."""
 
-from pygentic_ai.tools.dateutils import DATEUTILS_TOOLS, get_current_week, get_today_date, get_weekday_from_date
-from pygentic_ai.tools.tool_registry import ToolManager, Toolpacks, tool_manager
+from typing import TYPE_CHECKING
+
+from pygentic_ai.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pygentic_ai.tools.dateutils import DATEUTILS_TOOLS, get_current_week, get_today_date, get_weekday_from_date
+    from pygentic_ai.tools.executor import ToolExecutor, ToolPolicy
+    from pygentic_ai.tools.memo import MemoPolicy, MemoScope, MemoStats, ToolMemoCache
+    from pygentic_ai.tools.selection import SelectionStats, ToolSelector
+    from pygentic_ai.tools.tool_registry import ToolManager, Toolpacks, tool_manager
+
+_EXPORTS = {
+    "pygentic_ai.tools.dateutils": ["DATEUTILS_TOOLS", "get_current_week", "get_today_date", "get_weekday_from_date"],
+    "pygentic_ai.tools.executor": ["ToolExecutor", "ToolPolicy"],
+    "pygentic_ai.tools.memo": ["MemoPolicy", "MemoScope", "MemoStats", "ToolMemoCache"],
+    "pygentic_ai.tools.selection": ["SelectionStats", "ToolSelector"],
+    "pygentic_ai.tools.tool_registry": ["ToolManager", "Toolpacks", "tool_manager"],
+}
 
 __all__ = [
     "DATEUTILS_TOOLS",
     "get_current_week",
     "get_today_date",
     "get_weekday_from_date",
+    "ToolExecutor",
+    "ToolPolicy",
+    "MemoPolicy",
+    "MemoScope",
+    "MemoStats",
+    "ToolMemoCache",
+    "SelectionStats",
+    "ToolSelector",
     "ToolManager",
     "Toolpacks",
     "tool_manager",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
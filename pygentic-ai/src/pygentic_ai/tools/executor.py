@@ -0,0 +1,200 @@
+"""Execution layer offloading sync tools from the event loop."""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, get_origin
+
+from pydantic_ai import ModelRetry, RunContext
+
+
+@dataclass(frozen=True)
+class ToolPolicy:
+    """Execution policy of a tool.
+
+    Attributes:
+        timeout: Seconds after which the call is abandoned and reported to the model
+        max_concurrency: Maximum number of concurrent calls of the tool
+        use_processes: Run the tool in the process pool (for CPU-bound tools defined at
+            module level; closures, decorated wrappers and tools taking a ``RunContext``
+            cannot be sent to another process)
+    """
+
+    timeout: float | None = None
+    max_concurrency: int | None = None
+    use_processes: bool = False
+
+
+class ToolExecutor:
+    """Runs agent tools without blocking the event loop.
+
+    Sync tools are executed in a dedicated, bounded thread pool (or a process
+    pool for CPU-bound tools), so a slow tool only occupies one of the
+    executor's workers instead of the loop shared by every concurrent
+    workflow. Tool calls requested by the model in a single turn are executed
+    concurrently by Pydantic AI; the executor enforces per-tool timeouts and
+    concurrency caps on top of that.
+
+    A sync call that times out is abandoned, not interrupted: its worker
+    stays busy until the function returns. Tools using the process pool are
+    checked when they are wrapped or get their policy: they must be picklable
+    and must not take a ``RunContext``.
+
+    Args:
+        max_workers: Size of the thread pool for sync tools
+        max_process_workers: Size of the process pool (created on first use)
+        default_policy: Policy of tools without an explicit one
+        policies: Policies keyed by tool name
+
+    Example:
+        ```python
+        from pygentic_ai.tools import ToolExecutor, ToolPolicy, tool_manager
+
+        executor = ToolExecutor(max_workers=16)
+        executor.set_policy("search_documents", ToolPolicy(timeout=10, max_concurrency=4))
+
+        agent = ReasoningAgent(
+            tool_list=tool_manager.get_toolpack(AgentMode.GENERAL),
+            tool_executor=executor,
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_process_workers: int | None = None,
+        default_policy: ToolPolicy | None = None,
+        policies: dict[str, ToolPolicy] | None = None,
+    ) -> None:
+        self.max_process_workers = max_process_workers
+        self.default_policy = default_policy or ToolPolicy()
+        self.policies: dict[str, ToolPolicy] = dict(policies or {})
+        self._threads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pygentic-tool")
+        self._processes: ProcessPoolExecutor | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._tools: dict[str, Callable[..., Any]] = {}
+
+    def set_policy(self, tool: str | Callable[..., Any], policy: ToolPolicy) -> "ToolExecutor":
+        """Set the execution policy of a tool.
+
+        Args:
+            tool: Tool function or its name
+            policy: Policy to apply
+
+        Raises:
+            ValueError: If the policy uses the process pool and the tool cannot run there
+        """
+        name = tool if isinstance(tool, str) else tool.__name__
+        func = self._tools.get(name) if isinstance(tool, str) else tool
+        if policy.use_processes and func is not None:
+            _check_process_tool(func)
+        self.policies[name] = policy
+        self._semaphores.pop(name, None)
+        return self
+
+    def policy_for(self, name: str) -> ToolPolicy:
+        """Get the execution policy of a tool by name."""
+        return self.policies.get(name, self.default_policy)
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a tool so it is executed according to its policy.
+
+        The wrapper keeps the signature and docstring of the tool, so Pydantic
+        AI generates the same tool schema.
+
+        Raises:
+            ValueError: If the policy of the tool uses the process pool and the tool cannot run there
+        """
+        name = func.__name__
+        is_async = inspect.iscoroutinefunction(func)
+        if self.policy_for(name).use_processes:
+            _check_process_tool(func)
+        self._tools[name] = func
+
+        @functools.wraps(func)
+        async def execute(*args: Any, **kwargs: Any) -> Any:
+            policy = self.policy_for(name)
+            semaphore = self._semaphore(name, policy)
+            if semaphore is None:
+                return await self._execute(func, is_async, policy, args, kwargs)
+            async with semaphore:
+                return await self._execute(func, is_async, policy, args, kwargs)
+
+        return execute
+
+    def wrap_all(self, tools: list[Callable[..., Any]]) -> list[Callable[..., Any]]:
+        """Wrap a list of tools."""
+        return [self.wrap(tool) for tool in tools]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pools."""
+        self._threads.shutdown(wait=wait)
+        if self._processes is not None:
+            self._processes.shutdown(wait=wait)
+            self._processes = None
+
+    async def _execute(
+        self,
+        func: Callable[..., Any],
+        is_async: bool,
+        policy: ToolPolicy,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        if is_async:
+            call = func(*args, **kwargs)
+        else:
+            loop = asyncio.get_running_loop()
+            if policy.use_processes:
+                target = functools.partial(func, *args, **kwargs)
+            else:
+                # Keep the execution scope (run, session) visible to the tool
+                target = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+            call = loop.run_in_executor(self._executor(policy), target)
+
+        try:
+            return await asyncio.wait_for(call, policy.timeout)
+        except TimeoutError:
+            raise ModelRetry(f"Tool '{func.__name__}' timed out after {policy.timeout} seconds.") from None
+
+    def _executor(self, policy: ToolPolicy) -> Executor:
+        if not policy.use_processes:
+            return self._threads
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(max_workers=self.max_process_workers)
+        return self._processes
+
+    def _semaphore(self, name: str, policy: ToolPolicy) -> asyncio.Semaphore | None:
+        if policy.max_concurrency is None:
+            return None
+        if name not in self._semaphores:
+            self._semaphores[name] = asyncio.Semaphore(policy.max_concurrency)
+        return self._semaphores[name]
+
+
+def _check_process_tool(func: Callable[..., Any]) -> None:
+    """Make sure a sync tool can be sent to the process pool (async tools run on the event loop)."""
+    if inspect.iscoroutinefunction(func):
+        return
+    name = getattr(func, "__name__", repr(func))
+    parameters = list(inspect.signature(func).parameters.values())
+    if parameters and _is_run_context(parameters[0].annotation):
+        raise ValueError(f"Tool '{name}' takes a RunContext, which cannot be sent to the process pool")
+    try:
+        pickle.dumps(func)
+    except Exception as e:
+        raise ValueError(
+            f"Tool '{name}' cannot be pickled for the process pool ({e}); "
+            "use a function defined at module level, without decorators"
+        ) from None
+
+
+def _is_run_context(annotation: Any) -> bool:
+    if isinstance(annotation, str):
+        return annotation.split("[", 1)[0].rsplit(".", 1)[-1] == "RunContext"
+    return annotation is RunContext or get_origin(annotation) is RunContext
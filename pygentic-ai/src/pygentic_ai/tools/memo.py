@@ -0,0 +1,180 @@
+"""Memoization of tool results."""
+
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Callable
+
+from pydantic_ai import RunContext
+
+from pygentic_ai.context import current_scope
+
+
+class MemoScope(StrEnum):
+    """Visibility of memoized tool results."""
+
+    RUN = "run"
+    SESSION = "session"
+    GLOBAL = "global"
+
+
+@dataclass(frozen=True)
+class MemoPolicy:
+    """Memoization policy of a tool.
+
+    Attributes:
+        ttl: Seconds a result stays valid (None keeps it until evicted)
+        scope: Whether results are shared within a workflow run, a session or globally
+        key: Function building the cache key from the normalized arguments
+            (defaults to the arguments themselves)
+    """
+
+    ttl: float | None = 300.0
+    scope: MemoScope = MemoScope.GLOBAL
+    key: Callable[[dict[str, Any]], Hashable] | None = None
+
+
+@dataclass
+class MemoStats:
+    """Hit statistics of a memoized tool."""
+
+    hits: int = 0
+    misses: int = 0
+    bypasses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_MISSING = object()
+
+
+class ToolMemoCache:
+    """Bounded LRU cache of tool results shared by memoized tools.
+
+    Args:
+        max_entries: Maximum number of cached results across all tools
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[Hashable, ...], tuple[float | None, Any]] = OrderedDict()
+        self._stats: dict[str, MemoStats] = {}
+        self._lock = threading.Lock()
+
+    def memoize(self, func: Callable[..., Any], policy: MemoPolicy) -> Callable[..., Any]:
+        """Wrap a tool so its results are served from the cache.
+
+        The wrapper keeps the signature and docstring of the tool. Exceptions
+        are not cached. Run or session scoped tools are called through
+        uncached when no run or session is active.
+        """
+        name = func.__name__
+        signature = inspect.signature(func)
+
+        def lookup_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[Hashable, ...] | None:
+            scope_id = self._scope_id(policy.scope)
+            if scope_id is _MISSING:
+                self.stats(name).bypasses += 1
+                return None
+            arguments = _normalize_arguments(signature, args, kwargs)
+            key = policy.key(arguments) if policy.key else json.dumps(arguments, sort_keys=True, default=repr)
+            return (name, policy.scope.value, scope_id, key)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_memoized(*args: Any, **kwargs: Any) -> Any:
+                key = lookup_key(args, kwargs)
+                if key is not None and (cached := self._get(name, key)) is not _MISSING:
+                    return cached
+                result = await func(*args, **kwargs)
+                if key is not None:
+                    self._put(name, key, result, policy.ttl)
+                return result
+
+            return async_memoized
+
+        @functools.wraps(func)
+        def memoized(*args: Any, **kwargs: Any) -> Any:
+            key = lookup_key(args, kwargs)
+            if key is not None and (cached := self._get(name, key)) is not _MISSING:
+                return cached
+            result = func(*args, **kwargs)
+            if key is not None:
+                self._put(name, key, result, policy.ttl)
+            return result
+
+        return memoized
+
+    def stats(self, name: str) -> MemoStats:
+        """Get hit statistics of a tool."""
+        return self._stats.setdefault(name, MemoStats())
+
+    def all_stats(self) -> dict[str, MemoStats]:
+        """Get hit statistics of all memoized tools."""
+        return dict(self._stats)
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Drop cached results.
+
+        Args:
+            name: Tool whose results are dropped, or every tool if None
+        """
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == name]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, name: str, key: tuple[Hashable, ...]) -> Any:
+        stats = self.stats(name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    stats.hits += 1
+                    return value
+                del self._entries[key]
+                stats.expirations += 1
+            stats.misses += 1
+            return _MISSING
+
+    def _put(self, name: str, key: tuple[Hashable, ...], value: Any, ttl: float | None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self.stats(str(evicted[0])).evictions += 1
+
+    @staticmethod
+    def _scope_id(scope: MemoScope) -> Any:
+        if scope is MemoScope.GLOBAL:
+            return None
+        execution = current_scope()
+        scope_id = execution.run_id if scope is MemoScope.RUN else execution.session_id
+        return scope_id if scope_id is not None else _MISSING
+
+
+def _normalize_arguments(signature: inspect.Signature, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return {name: value for name, value in bound.arguments.items() if not isinstance(value, RunContext)}
@@ -0,0 +1,183 @@
+"""Query-aware selection of the tools passed to the model."""
+
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic_ai import RunContext
+from pydantic_ai.tools import ToolDefinition
+
+_TOKEN_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase terms, breaking snake_case and camelCase identifiers."""
+    return [token.lower() for token in _TOKEN_PATTERN.findall(text)]
+
+
+@dataclass
+class SelectionStats:
+    """Statistics of tool selection."""
+
+    queries: int = 0
+    candidate_tools: int = 0
+    selected_tools: int = 0
+    recall_samples: int = 0
+    recall_sum: float = 0.0
+
+    @property
+    def recall(self) -> float | None:
+        """Mean recall@k over evaluated queries."""
+        return self.recall_sum / self.recall_samples if self.recall_samples else None
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of candidate tools that were not passed to the model."""
+        return 1 - self.selected_tools / self.candidate_tools if self.candidate_tools else 0.0
+
+
+class _BM25Index:
+    def __init__(self, tool_defs: list[ToolDefinition], k1: float, b: float) -> None:
+        self.k1 = k1
+        self.b = b
+        # Tool names are repeated so that matching a name outweighs matching its description
+        self.documents = [
+            Counter(tokenize(tool_def.name) * 2 + tokenize(tool_def.description or "")) for tool_def in tool_defs
+        ]
+        self.lengths = [sum(document.values()) for document in self.documents]
+        self.average_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+        document_frequency: Counter[str] = Counter()
+        for document in self.documents:
+            document_frequency.update(document.keys())
+        count = len(self.documents)
+        self.idf = {
+            term: math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+
+    def scores(self, query: str) -> list[float]:
+        terms = [term for term in tokenize(query) if term in self.idf]
+        scores = []
+        for document, length in zip(self.documents, self.lengths, strict=True):
+            score = 0.0
+            for term in terms:
+                frequency = document.get(term, 0)
+                if frequency:
+                    norm = self.k1 * (1 - self.b + self.b * length / self.average_length)
+                    score += self.idf[term] * frequency * (self.k1 + 1) / (frequency + norm)
+            scores.append(score)
+        return scores
+
+
+class ToolSelector:
+    """Passes only the tools relevant to the user query to the model.
+
+    Builds a BM25 index over tool names and descriptions (function tools and
+    MCP tools alike) and keeps the ``top_k`` best matching tools for each
+    run. When fewer than ``top_k`` tools match, the remaining slots are
+    filled with other tools in their original order. A query matching no
+    tool at all (e.g. one written in another language than the tool
+    descriptions) gets every tool. The index is rebuilt only when the set of
+    tools changes.
+
+    Args:
+        top_k: Maximum number of tools passed to the model
+        always_include: Names of tools that are always passed
+        k1: BM25 term frequency saturation
+        b: BM25 document length normalization
+
+    Example:
+        ```python
+        from pygentic_ai.tools import ToolSelector
+
+        selector = ToolSelector(top_k=10, always_include=["get_today_date"])
+        agent = ReasoningAgent(tool_list=tools, mcp_urls=urls, tool_selector=selector)
+
+        selector.evaluate("When is my next invoice due?", relevant={"list_invoices"})
+        print(selector.stats.recall, selector.stats.reduction)
+        ```
+    """
+
+    def __init__(
+        self,
+        top_k: int = 8,
+        always_include: Iterable[str] = (),
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> None:
+        self.top_k = top_k
+        self.always_include = set(always_include)
+        self.k1 = k1
+        self.b = b
+        self.stats = SelectionStats()
+        self._index: _BM25Index | None = None
+        self._indexed: tuple[tuple[str, str | None], ...] = ()
+        self._tool_defs: list[ToolDefinition] = []
+
+    def select(self, query: str, tool_defs: list[ToolDefinition]) -> list[ToolDefinition]:
+        """Select the tools most relevant to a query, keeping their original order."""
+        if len(tool_defs) <= self.top_k:
+            return tool_defs
+
+        index = self._index_for(tool_defs)
+        scores = index.scores(query)
+        if not any(scores):
+            return tool_defs
+        # Sorting is stable, so tools without a match fill the remaining slots in their original order
+        ranked = sorted(range(len(tool_defs)), key=lambda position: scores[position], reverse=True)
+
+        selected = {position for position, tool_def in enumerate(tool_defs) if tool_def.name in self.always_include}
+        for position in ranked:
+            if len(selected) >= self.top_k:
+                break
+            selected.add(position)
+
+        return [tool_def for position, tool_def in enumerate(tool_defs) if position in selected]
+
+    async def prepare_tools(self, ctx: RunContext[Any], tool_defs: list[ToolDefinition]) -> list[ToolDefinition]:
+        """Pydantic AI ``prepare_tools`` hook selecting tools for the run's user prompt."""
+        selected = self.select(_prompt_text(ctx.prompt), tool_defs)
+        if ctx.run_step <= 1:
+            self.stats.queries += 1
+            self.stats.candidate_tools += len(tool_defs)
+            self.stats.selected_tools += len(selected)
+        return selected
+
+    def evaluate(self, query: str, relevant: Iterable[str], tool_defs: list[ToolDefinition] | None = None) -> float:
+        """Measure recall@k of a query against the tools known to be relevant.
+
+        Args:
+            query: User query
+            relevant: Names of the tools the query needs
+            tool_defs: Candidate tools (defaults to the last indexed tools)
+
+        Returns:
+            Fraction of relevant tools that were selected
+        """
+        relevant_names = set(relevant)
+        if not relevant_names:
+            return 1.0
+        selected = {tool_def.name for tool_def in self.select(query, tool_defs or self._tool_defs)}
+        recall = len(relevant_names & selected) / len(relevant_names)
+        self.stats.recall_samples += 1
+        self.stats.recall_sum += recall
+        return recall
+
+    def _index_for(self, tool_defs: list[ToolDefinition]) -> _BM25Index:
+        signature = tuple((tool_def.name, tool_def.description) for tool_def in tool_defs)
+        if self._index is None or signature != self._indexed:
+            self._index = _BM25Index(tool_defs, self.k1, self.b)
+            self._indexed = signature
+            self._tool_defs = list(tool_defs)
+        return self._index
+
+
+def _prompt_text(prompt: Any) -> str:
+    if prompt is None:
+        return ""
+    if isinstance(prompt, str):
+        return prompt
+    return " ".join(part for part in prompt if isinstance(part, str))
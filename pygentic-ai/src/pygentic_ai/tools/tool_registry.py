@@ -1,10 +1,18 @@
 """Tool registry for managing agent toolpacks."""
 
+import importlib
+import threading
+import time
 from enum import Enum
+from importlib.metadata import entry_points
 from typing import Any, Callable
 
 from pygentic_ai.schemas import AgentMode
-from pygentic_ai.tools.dateutils import DATEUTILS_TOOLS
+from pygentic_ai.tools.memo import MemoPolicy, MemoStats, ToolMemoCache
+
+TOOLPACK_ENTRY_POINT_GROUP = "pygentic_ai.toolpacks"
+
+ToolpackSource = list[Callable[..., Any]] | str
 
 
 class Toolpacks(Enum):
@@ -14,28 +22,186 @@ class Toolpacks(Enum):
     UTILS = "dateutils"
 
 
+class _ToolpackMapping(dict[Toolpacks | str, ToolpackSource]):
+    """Toolpack names mapped to their tools.
+
+    Toolpacks registered as import strings are imported on first access and
+    replaced by their list of tools, so ``toolpacks[name]`` is always a list.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.import_times: dict[Toolpacks | str, float] = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, name: Toolpacks | str) -> list[Callable[..., Any]]:
+        source = super().__getitem__(name)
+        if not isinstance(source, str):
+            return source
+
+        with self._lock:
+            source = super().__getitem__(name)
+            if isinstance(source, str):
+                started = time.perf_counter()
+                source = list(_import_object(source))
+                self.import_times[name] = time.perf_counter() - started
+                super().__setitem__(name, source)
+            return source
+
+    def get(self, name: Toolpacks | str, default: Any = None) -> Any:
+        if name not in self:
+            return default
+        return self[name]
+
+    def values(self) -> list[list[Callable[..., Any]]]:  # type: ignore[override]
+        return [self[name] for name in self]
+
+    def items(self) -> list[tuple[Toolpacks | str, list[Callable[..., Any]]]]:  # type: ignore[override]
+        return [(name, self[name]) for name in self]
+
+
 class ToolManager:
-    """Manager for organizing tools by agent mode."""
+    """Manager for organizing tools by agent mode.
 
-    toolpacks: dict[Toolpacks, list[Callable[..., Any]]] = {
-        Toolpacks.GENERAL: [],
-        Toolpacks.UTILS: DATEUTILS_TOOLS,
-    }
+    Toolpacks may be registered as import strings (``"package.module:TOOLS"``)
+    or discovered from the ``pygentic_ai.toolpacks`` entry point group. Their
+    modules are imported only when first needed (by ``get_toolpack`` or by
+    reading ``toolpacks[name]``), the resolved tools replace the import string
+    and the import time of each toolpack is recorded in ``import_times``.
+
+    Tools can be given a memoization policy, in which case ``get_toolpack``
+    returns them wrapped so repeated calls with the same arguments are served
+    from a bounded cache.
+
+    Example:
+        ```python
+        from pygentic_ai.tools import MemoPolicy, MemoScope, tool_manager
+
+        tool_manager.register_toolpack("crm", "my_app.tools.crm:CRM_TOOLS", modes=[AgentMode.GENERAL])
+        tool_manager.memoize(search_documents, MemoPolicy(ttl=600, scope=MemoScope.SESSION))
+        tools = tool_manager.get_toolpack(AgentMode.GENERAL)
+        print(tool_manager.memo_stats())
+        ```
+    """
+
+    toolpacks: _ToolpackMapping = _ToolpackMapping(
+        {
+            Toolpacks.GENERAL: [],
+            Toolpacks.UTILS: "pygentic_ai.tools.dateutils:DATEUTILS_TOOLS",
+        }
+    )
 
-    mapping: dict[AgentMode, list[Toolpacks]] = {
+    mapping: dict[AgentMode, list[Toolpacks | str]] = {
         AgentMode.GENERAL: [Toolpacks.GENERAL, Toolpacks.UTILS],
     }
 
+    def __init__(self, memo_cache: ToolMemoCache | None = None) -> None:
+        # Copy the registered sources without importing them
+        self.toolpacks = _ToolpackMapping(dict.items(type(self).toolpacks))
+        self.mapping = {mode: list(toolpacks) for mode, toolpacks in type(self).mapping.items()}
+        self.memo_cache = memo_cache if memo_cache is not None else ToolMemoCache()
+        self.memo_policies: dict[str, MemoPolicy] = {}
+        self._memoized: dict[Callable[..., Any], Callable[..., Any]] = {}
+        self._entry_points: dict[str, str] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def import_times(self) -> dict[Toolpacks | str, float]:
+        """Import time in seconds of each toolpack imported from an import string."""
+        return self.toolpacks.import_times
+
     def get_toolpack(self, agent_mode: AgentMode) -> list[Callable[..., Any]]:
         """Get tools for a specific agent mode."""
         tool_list = []
         required_toolpacks = self.mapping.get(agent_mode, [])
 
         for toolpack in required_toolpacks:
-            tools = self.toolpacks.get(toolpack, [])
-            tool_list.extend(tools)
+            tools = self._resolve(toolpack)
+            tool_list.extend(self._apply_memo_policy(tool) for tool in tools)
 
         return tool_list
 
+    def register_toolpack(
+        self,
+        name: Toolpacks | str,
+        tools: ToolpackSource,
+        modes: list[AgentMode] | None = None,
+    ) -> "ToolManager":
+        """Register a toolpack without importing it.
+
+        Args:
+            name: Toolpack identifier
+            tools: List of tools or import string ``"package.module:ATTRIBUTE"``
+            modes: Agent modes the toolpack is added to
+        """
+        with self._lock:
+            self.toolpacks[name] = tools
+        for mode in modes or []:
+            if name not in self.mapping.setdefault(mode, []):
+                self.mapping[mode].append(name)
+        return self
+
+    def register_entry_points(self, modes: list[AgentMode] | None = None) -> list[str]:
+        """Register toolpacks advertised in the ``pygentic_ai.toolpacks`` entry point group.
+
+        Only entry point metadata is read; toolpack modules are imported on first use.
+
+        Args:
+            modes: Agent modes the discovered toolpacks are added to
+
+        Returns:
+            Names of the discovered toolpacks
+        """
+        discovered = self._discover_entry_points()
+        for name, import_string in discovered.items():
+            self.register_toolpack(name, import_string, modes=modes)
+        return list(discovered)
+
+    def _resolve(self, toolpack: Toolpacks | str) -> list[Callable[..., Any]]:
+        if toolpack not in self.toolpacks and isinstance(toolpack, str):
+            source = self._discover_entry_points().get(toolpack)
+            if source is not None:
+                with self._lock:
+                    self.toolpacks.setdefault(toolpack, source)
+        return self.toolpacks.get(toolpack, [])
+
+    def _discover_entry_points(self) -> dict[str, str]:
+        if self._entry_points is None:
+            self._entry_points = {ep.name: ep.value for ep in entry_points(group=TOOLPACK_ENTRY_POINT_GROUP)}
+        return self._entry_points
+
+    def memoize(self, tool: str | Callable[..., Any], policy: MemoPolicy | None = None) -> "ToolManager":
+        """Set the memoization policy of a tool.
+
+        Args:
+            tool: Tool function or its name
+            policy: Memoization policy (defaults to a global 5 minute TTL)
+        """
+        name = tool if isinstance(tool, str) else tool.__name__
+        self.memo_policies[name] = policy or MemoPolicy()
+        self._memoized = {func: wrapper for func, wrapper in self._memoized.items() if func.__name__ != name}
+        self.memo_cache.invalidate(name)
+        return self
+
+    def memo_stats(self) -> dict[str, MemoStats]:
+        """Get hit statistics of memoized tools."""
+        return self.memo_cache.all_stats()
+
+    def _apply_memo_policy(self, tool: Callable[..., Any]) -> Callable[..., Any]:
+        policy = self.memo_policies.get(tool.__name__)
+        if policy is None:
+            return tool
+        if tool not in self._memoized:
+            self._memoized[tool] = self.memo_cache.memoize(tool, policy)
+        return self._memoized[tool]
+
+
+def _import_object(import_string: str) -> Any:
+    module_name, _, attribute = import_string.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in attribute.split(".") if attribute else []:
+        obj = getattr(obj, part)
+    return obj
+
 
 tool_manager = ToolManager()
@@ -0,0 +1,231 @@
+"""Usage and cost accounting for agent calls."""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from pygentic_ai.context import current_scope
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """Price of a model in currency units per million tokens.
+
+    Attributes:
+        input_per_million: Price of one million request (input) tokens
+        output_per_million: Price of one million response (output) tokens
+    """
+
+    input_per_million: float
+    output_per_million: float
+
+    def cost(self, input_tokens: int, output_tokens: int) -> float:
+        """Calculate the cost of the given token counts."""
+        return (input_tokens * self.input_per_million + output_tokens * self.output_per_million) / 1_000_000
+
+
+@dataclass(frozen=True)
+class UsageRecord:
+    """Usage of a single agent call with its attribution."""
+
+    timestamp: float
+    model: str
+    agent: str | None
+    run_id: str | None
+    node: str | None
+    tenant: str | None
+    requests: int
+    input_tokens: int
+    output_tokens: int
+    cost: float
+    priced: bool
+
+
+@dataclass
+class UsageTotals:
+    """Aggregated usage of a group of agent calls."""
+
+    calls: int = 0
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+    unpriced_calls: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def add(self, record: UsageRecord) -> None:
+        """Add a usage record to the totals."""
+        self.calls += 1
+        self.requests += record.requests
+        self.input_tokens += record.input_tokens
+        self.output_tokens += record.output_tokens
+        self.cost += record.cost
+        if not record.priced:
+            self.unpriced_calls += 1
+
+
+@dataclass
+class _RunEntry:
+    totals: UsageTotals = field(default_factory=UsageTotals)
+    records: list[UsageRecord] = field(default_factory=list)
+
+
+class UsageLedger:
+    """Process-wide ledger collecting usage of every agent call.
+
+    Each record is attributed to the workflow run, node and tenant taken from
+    the current execution scope (see ``pygentic_ai.context``) and priced with
+    the configured price table. The ledger keeps lifetime totals, per-run
+    totals for the most recent runs and a bounded window of records used for
+    rolling totals.
+
+    Args:
+        prices: Price table keyed by model string (e.g. ``"openai:gpt-4o"``)
+        max_records: Number of most recent records kept for rolling totals
+        max_runs: Number of most recent runs kept for per-run totals
+
+    Example:
+        ```python
+        from pygentic_ai.usage import ModelPrice, usage_ledger
+
+        usage_ledger.set_price("openai:gpt-4o-mini", ModelPrice(0.15, 0.60))
+        ...
+        print(usage_ledger.run_totals(state.run_id))
+        print(usage_ledger.breakdown("node"))
+        ```
+    """
+
+    def __init__(
+        self,
+        prices: dict[str, ModelPrice] | None = None,
+        max_records: int = 10_000,
+        max_runs: int = 1_000,
+    ) -> None:
+        self.prices: dict[str, ModelPrice] = dict(prices or {})
+        self.max_runs = max_runs
+        self._records: deque[UsageRecord] = deque(maxlen=max_records)
+        self._runs: OrderedDict[str, _RunEntry] = OrderedDict()
+        self._lifetime = UsageTotals()
+        self._lock = threading.Lock()
+
+    def set_price(self, model: str, price: ModelPrice) -> "UsageLedger":
+        """Set the price of a model."""
+        self.prices[model] = price
+        return self
+
+    def record(self, usage: Any, model: str, agent: str | None = None) -> UsageRecord:
+        """Record usage of a single agent call.
+
+        Args:
+            usage: ``RunUsage`` returned by ``AgentRunResult.usage()``
+            model: Model string the call was made with
+            agent: Name of the agent class that made the call
+
+        Returns:
+            The stored usage record
+        """
+        scope = current_scope()
+        input_tokens = usage.input_tokens or 0
+        output_tokens = usage.output_tokens or 0
+        price = self.prices.get(model)
+
+        record = UsageRecord(
+            timestamp=time.time(),
+            model=model,
+            agent=agent,
+            run_id=scope.run_id,
+            node=scope.node,
+            tenant=scope.tenant,
+            requests=usage.requests or 0,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost=price.cost(input_tokens, output_tokens) if price else 0.0,
+            priced=price is not None,
+        )
+
+        with self._lock:
+            self._records.append(record)
+            self._lifetime.add(record)
+            if record.run_id is not None:
+                entry = self._runs.get(record.run_id)
+                if entry is None:
+                    entry = self._runs[record.run_id] = _RunEntry()
+                    while len(self._runs) > self.max_runs:
+                        self._runs.popitem(last=False)
+                else:
+                    self._runs.move_to_end(record.run_id)
+                entry.totals.add(record)
+                entry.records.append(record)
+
+        return record
+
+    def run_totals(self, run_id: str) -> UsageTotals:
+        """Get totals of a single workflow run."""
+        with self._lock:
+            entry = self._runs.get(run_id)
+            return UsageTotals(**vars(entry.totals)) if entry else UsageTotals()
+
+    def run_records(self, run_id: str) -> list[UsageRecord]:
+        """Get all records of a single workflow run."""
+        with self._lock:
+            entry = self._runs.get(run_id)
+            return list(entry.records) if entry else []
+
+    def totals(self) -> UsageTotals:
+        """Get lifetime totals of the process."""
+        with self._lock:
+            return UsageTotals(**vars(self._lifetime))
+
+    def rolling_totals(self, window: float = 60.0) -> UsageTotals:
+        """Get totals of the calls recorded within the last ``window`` seconds."""
+        since = time.time() - window
+        totals = UsageTotals()
+        for record in self._snapshot():
+            if record.timestamp >= since:
+                totals.add(record)
+        return totals
+
+    def breakdown(
+        self,
+        by: str,
+        run_id: str | None = None,
+        window: float | None = None,
+    ) -> dict[str | None, UsageTotals]:
+        """Group recorded usage by an attribute.
+
+        Args:
+            by: Record attribute to group by (``"model"``, ``"node"``, ``"agent"``, ``"tenant"``, ``"run_id"``)
+            run_id: Only include records of this run
+            window: Only include records from the last ``window`` seconds
+
+        Returns:
+            Totals keyed by attribute value
+        """
+        records = self.run_records(run_id) if run_id is not None else self._snapshot()
+        since = time.time() - window if window is not None else None
+
+        groups: dict[str | None, UsageTotals] = {}
+        for record in records:
+            if since is not None and record.timestamp < since:
+                continue
+            groups.setdefault(getattr(record, by), UsageTotals()).add(record)
+        return groups
+
+    def clear(self) -> None:
+        """Drop all recorded usage."""
+        with self._lock:
+            self._records.clear()
+            self._runs.clear()
+            self._lifetime = UsageTotals()
+
+    def _snapshot(self) -> list[UsageRecord]:
+        with self._lock:
+            return list(self._records)
+
+
+usage_ledger = UsageLedger()
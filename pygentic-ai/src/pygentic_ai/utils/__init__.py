@@ -1,7 +1,9 @@
 """Utility functions for pygentic-ai."""
 
+from pygentic_ai.utils.lazy import lazy_exports
 from pygentic_ai.utils.llm_vendor import set_api_key_for_vendor
 
 __all__ = [
+    "lazy_exports",
     "set_api_key_for_vendor",
 ]
@@ -0,0 +1,44 @@
+"""Lazy loading of package exports."""
+
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create the module ``__getattr__`` and ``__dir__`` of a package with lazily imported exports.
+
+    An export's module is imported on first access of the export, which is
+    then cached in the package namespace, so importing the package itself
+    stays cheap and later accesses cost nothing.
+
+    Args:
+        package: ``__name__`` of the package
+        exports: Names exported by the package, by defining module
+
+    Returns:
+        ``__getattr__`` and ``__dir__`` functions for the package
+
+    Example:
+        ```python
+        __getattr__, __dir__ = lazy_exports(__name__, {"pygentic_ai.workflows.state": ["WorkflowState"]})
+        ```
+    """
+    namespace = sys.modules[package].__dict__
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def get_export(name: str) -> Any:
+        module = modules.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def list_exports() -> list[str]:
+        return sorted({*namespace, *modules})
+
+    return get_export, list_exports
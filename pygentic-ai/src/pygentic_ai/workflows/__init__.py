@@ -1,8 +1,58 @@
 """Workflow components for building agent workflows."""
 
-from pygentic_ai.workflows.state import RefusalInfo, WorkflowState
+from typing import TYPE_CHECKING
+
+from pygentic_ai.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pygentic_ai.workflows.admission import AdmissionController, AdmissionStats, OverloadedError
+    from pygentic_ai.workflows.batch import BatchResult, BatchRunner, BatchStats
+    from pygentic_ai.workflows.coalescing import CoalescingStats, WorkflowCoalescer
+    from pygentic_ai.workflows.persistence import (
+        CheckpointStore,
+        FileCheckpointStore,
+        JSONLStatePersistence,
+        SQLiteCheckpointStore,
+        SQLiteStatePersistence,
+        run_checkpointed,
+    )
+    from pygentic_ai.workflows.runner import run_workflow
+    from pygentic_ai.workflows.state import RefusalInfo, WorkflowState
+
+_EXPORTS = {
+    "pygentic_ai.workflows.admission": ["AdmissionController", "AdmissionStats", "OverloadedError"],
+    "pygentic_ai.workflows.batch": ["BatchResult", "BatchRunner", "BatchStats"],
+    "pygentic_ai.workflows.coalescing": ["CoalescingStats", "WorkflowCoalescer"],
+    "pygentic_ai.workflows.persistence": [
+        "CheckpointStore",
+        "FileCheckpointStore",
+        "JSONLStatePersistence",
+        "SQLiteCheckpointStore",
+        "SQLiteStatePersistence",
+        "run_checkpointed",
+    ],
+    "pygentic_ai.workflows.runner": ["run_workflow"],
+    "pygentic_ai.workflows.state": ["RefusalInfo", "WorkflowState"],
+}
 
 __all__ = [
     "WorkflowState",
     "RefusalInfo",
+    "BatchRunner",
+    "BatchResult",
+    "BatchStats",
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "SQLiteCheckpointStore",
+    "JSONLStatePersistence",
+    "SQLiteStatePersistence",
+    "run_checkpointed",
+    "run_workflow",
+    "AdmissionController",
+    "AdmissionStats",
+    "OverloadedError",
+    "WorkflowCoalescer",
+    "CoalescingStats",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,190 @@
+"""Admission control and load shedding for workflow execution."""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic_graph import Graph
+
+from pygentic_ai.workflows.agent_workflow import user_assistant_graph
+from pygentic_ai.workflows.runner import run_workflow
+from pygentic_ai.workflows.state import WorkflowState
+
+
+class OverloadedError(RuntimeError):
+    """Raised when a request is rejected because the workflow is over capacity."""
+
+
+@dataclass
+class AdmissionStats:
+    """Load statistics of an admission controller."""
+
+    in_flight: int = 0
+    queue_depth: int = 0
+    admitted: int = 0
+    queued: int = 0
+    degraded: int = 0
+    rejected_queue_full: int = 0
+    rejected_timeout: int = 0
+    queue_wait_time: float = 0.0
+
+    @property
+    def shed(self) -> int:
+        """Requests rejected for any reason."""
+        return self.rejected_queue_full + self.rejected_timeout
+
+    @property
+    def mean_queue_wait(self) -> float:
+        return self.queue_wait_time / self.queued if self.queued else 0.0
+
+
+class AdmissionController:
+    """Bounds the number of concurrent workflow runs and sheds excess load.
+
+    Up to ``max_in_flight`` runs execute at once; further requests wait in a
+    FIFO queue of at most ``max_queue`` entries for at most
+    ``max_queue_delay`` seconds. Requests arriving to a full queue, or
+    waiting too long, are rejected with ``OverloadedError`` right away
+    instead of slowing down every other request.
+
+    With ``degraded_deps``, requests that had to wait for a slot run with
+    those deps merged in, e.g. ``{"skip_guardrails": True}`` to drop the
+    guardrails pass while the system is over capacity.
+
+    Args:
+        max_in_flight: Maximum number of concurrent runs
+        max_queue: Maximum number of waiting requests
+        max_queue_delay: Maximum seconds a request waits for a slot
+        degraded_deps: Deps merged into requests admitted while over capacity
+        verbose: Whether to print shed requests
+
+    Example:
+        ```python
+        from pygentic_ai.workflows import AdmissionController, OverloadedError
+
+        admission = AdmissionController(max_in_flight=64, max_queue=128, degraded_deps={"skip_guardrails": True})
+
+        try:
+            response = await admission.run(manager.to_deps(message=message), budget=10)
+        except OverloadedError:
+            return Response(status_code=503)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 64,
+        max_queue: int = 256,
+        max_queue_delay: float = 2.0,
+        degraded_deps: dict[str, Any] | None = None,
+        verbose: bool = False,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.max_queue_delay = max_queue_delay
+        self.degraded_deps = degraded_deps
+        self.verbose = verbose
+        self._stats = AdmissionStats()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def stats(self) -> AdmissionStats:
+        """Current load statistics."""
+        self._stats.queue_depth = len(self._waiters)
+        return self._stats
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[bool]:
+        """Hold a run slot for the duration of a block.
+
+        Yields:
+            Whether the request had to wait, i.e. the system is over capacity
+
+        Raises:
+            OverloadedError: If the queue is full or the wait exceeds ``max_queue_delay``
+        """
+        waited = await self._acquire()
+        try:
+            yield waited
+        finally:
+            self._release()
+
+    async def run(
+        self,
+        deps: dict[str, Any],
+        graph: Graph[WorkflowState, dict, str] = user_assistant_graph,
+        *,
+        budget: float | None = None,
+    ) -> str:
+        """Run a workflow once admitted.
+
+        Time spent in the queue counts against the budget.
+
+        Args:
+            deps: Workflow dependencies
+            graph: Workflow graph to run
+            budget: End-to-end time budget in seconds, including queueing
+
+        Raises:
+            OverloadedError: If the request is shed
+        """
+        started = time.monotonic()
+        async with self.admit() as waited:
+            if waited and self.degraded_deps:
+                deps = {**deps, **self.degraded_deps}
+                self._stats.degraded += 1
+            if budget is not None:
+                budget -= time.monotonic() - started
+            return await run_workflow(deps, graph, budget=budget)
+
+    async def _acquire(self) -> bool:
+        if self._stats.in_flight < self.max_in_flight and not self._waiters:
+            self._stats.in_flight += 1
+            self._stats.admitted += 1
+            return False
+
+        if len(self._waiters) >= self.max_queue:
+            self._stats.rejected_queue_full += 1
+            if self.verbose:
+                print(f"Admission: queue full ({self.max_queue}), request rejected")
+            raise OverloadedError("Workflow queue is full")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._stats.queued += 1
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(waiter, self.max_queue_delay)
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait ended
+                self._release()
+            else:
+                waiter.cancel()
+                with suppress(ValueError):
+                    self._waiters.remove(waiter)
+            if isinstance(e, TimeoutError):
+                self._stats.rejected_timeout += 1
+                if self.verbose:
+                    print(f"Admission: no slot within {self.max_queue_delay}s, request rejected")
+                raise OverloadedError("Timed out waiting for a workflow slot") from None
+            raise
+        finally:
+            self._stats.queue_wait_time += time.monotonic() - started
+
+        self._stats.admitted += 1
+        return True
+
+    def _release(self) -> None:
+        self._stats.in_flight -= 1
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Hand the slot over directly so arriving requests cannot overtake the queue
+                self._stats.in_flight += 1
+                waiter.set_result(None)
+                return
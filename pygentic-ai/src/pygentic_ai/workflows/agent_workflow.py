@@ -3,7 +3,9 @@
 from pydantic_graph import Graph
 
 from pygentic_ai.workflows.nodes import (
+    ClassifyGenerateNode,
     ClassifyNode,
+    FusedStartNode,
     GenerateNode,
     GuardrailsNode,
     RefuseNode,
@@ -15,3 +17,9 @@ user_assistant_graph = Graph(
     nodes=(StartNode, ClassifyNode, GenerateNode, GuardrailsNode, TranslateNode, RefuseNode),  # type: ignore[arg-type]
     name="UserAssistantWorkflow",
 )
+
+# Classifies and drafts the answer in one call, halving sequential model calls for conversation
+fused_assistant_graph = Graph(
+    nodes=(FusedStartNode, ClassifyGenerateNode, GenerateNode, GuardrailsNode, TranslateNode, RefuseNode),  # type: ignore[arg-type]
+    name="FusedAssistantWorkflow",
+)
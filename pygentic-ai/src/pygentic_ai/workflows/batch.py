@@ -0,0 +1,340 @@
+"""Batch execution of workflows over large input streams."""
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Container, Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pydantic_graph import Graph
+
+from pygentic_ai.context import execution_scope
+from pygentic_ai.deferred import BatchCollector
+from pygentic_ai.manager import AgentManager
+from pygentic_ai.workflows.agent_workflow import user_assistant_graph
+from pygentic_ai.workflows.nodes import start_node_for
+from pygentic_ai.workflows.state import WorkflowState
+
+BatchInput = str | dict[str, Any]
+
+_READ_CHUNK_SIZE = 1 << 16
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a single batch item.
+
+    Attributes:
+        offset: Position of the item in the input stream
+        output: Workflow output, or None if the run failed
+        error: Error description if the run failed
+        run_id: Workflow run identifier
+        duration: Run time in seconds
+    """
+
+    offset: int
+    output: str | None
+    error: str | None = None
+    run_id: str = ""
+    duration: float = 0.0
+
+
+@dataclass
+class BatchStats:
+    """Progress and throughput of a batch run."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    busy_time: float = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return self.submitted - self.completed - self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Finished items per second."""
+        elapsed = self.elapsed
+        return (self.completed + self.failed) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        finished = self.completed + self.failed
+        return self.busy_time / finished if finished else 0.0
+
+
+class BatchRunner:
+    """Streams inputs through a workflow graph with bounded concurrency.
+
+    Inputs are pulled from the source only when a worker can take them, so
+    memory stays bounded regardless of the input size. Results are produced
+    as runs finish, or in input order with ``ordered=True`` (at most
+    ``max_pending`` items are then held while waiting for a slow one).
+
+    Each input is either a message string or a dict of workflow deps
+    containing at least ``message`` (e.g. ``language``, ``chat_history``).
+
+    Args:
+        manager: Agent manager providing the workflow deps
+        graph: Workflow graph to run
+        concurrency: Number of concurrent workflow runs
+        ordered: Whether results are produced in input order
+        max_pending: Maximum number of items between the source and the consumer
+            (defaults to four times the concurrency)
+        deps: Extra deps passed to every run
+        lane: Scheduling lane of the runs' agent calls (see ``LaneScheduler``)
+        collector: Collector deferring the runs' agent calls to provider batch jobs
+            (batch jobs hold at most ``concurrency`` requests, so raise it accordingly)
+        on_progress: Callback receiving the stats every ``progress_interval`` seconds
+        progress_interval: Seconds between progress reports
+        verbose: Whether to print progress reports
+
+    Example:
+        ```python
+        from pygentic_ai.workflows import BatchRunner
+
+        runner = BatchRunner(manager, concurrency=32, verbose=True)
+        stats = await runner.run("messages.jsonl", "results.jsonl", resume=True)
+        print(stats.throughput)
+        ```
+    """
+
+    def __init__(
+        self,
+        manager: AgentManager,
+        graph: Graph = user_assistant_graph,
+        concurrency: int = 16,
+        ordered: bool = False,
+        max_pending: int | None = None,
+        deps: dict[str, Any] | None = None,
+        on_progress: Callable[[BatchStats], None] | None = None,
+        progress_interval: float = 10.0,
+        lane: str | None = "batch",
+        collector: BatchCollector | None = None,
+        verbose: bool = False,
+    ) -> None:
+        self.manager = manager
+        self.graph = graph
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.max_pending = max_pending or concurrency * 4
+        self.deps = deps or {}
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self.lane = lane
+        self.collector = collector
+        self.verbose = verbose
+        self.stats = BatchStats()
+
+    async def stream(
+        self,
+        inputs: Iterable[BatchInput] | AsyncIterable[BatchInput] | str | Path,
+        skip: Container[int] = (),
+    ) -> AsyncIterator[BatchResult]:
+        """Run the workflow over the inputs and yield results as they are ready.
+
+        Args:
+            inputs: Iterable, async iterable or path of a JSONL file
+            skip: Offsets of inputs that are already done
+        """
+        self.stats = BatchStats()
+        window = asyncio.Semaphore(self.max_pending)
+        jobs: asyncio.Queue[tuple[int, int, BatchInput] | None] = asyncio.Queue(maxsize=self.concurrency)
+        results: asyncio.Queue[tuple[int, BatchResult] | None] = asyncio.Queue()
+
+        async def produce() -> None:
+            sequence = 0
+            async for offset, item in _enumerate(inputs):
+                if offset in skip:
+                    self.stats.skipped += 1
+                    continue
+                await window.acquire()
+                await jobs.put((sequence, offset, item))
+                self.stats.submitted += 1
+                sequence += 1
+            for _ in range(self.concurrency):
+                await jobs.put(None)
+
+        async def work() -> None:
+            while (job := await jobs.get()) is not None:
+                sequence, offset, item = job
+                await results.put((sequence, await self._run_item(offset, item)))
+
+        async def supervise() -> None:
+            try:
+                await asyncio.gather(produce(), *(work() for _ in range(self.concurrency)))
+            finally:
+                await results.put(None)
+
+        supervisor = asyncio.create_task(supervise())
+        reporter = asyncio.create_task(self._report_progress())
+        buffered: dict[int, BatchResult] = {}
+        next_sequence = 0
+        try:
+            while (finished := await results.get()) is not None:
+                sequence, result = finished
+                if not self.ordered:
+                    window.release()
+                    yield result
+                    continue
+                buffered[sequence] = result
+                while next_sequence in buffered:
+                    window.release()
+                    yield buffered.pop(next_sequence)
+                    next_sequence += 1
+            await supervisor
+        finally:
+            supervisor.cancel()
+            reporter.cancel()
+            self._emit_progress()
+
+    async def run(
+        self,
+        inputs: Iterable[BatchInput] | AsyncIterable[BatchInput] | str | Path,
+        output: str | Path,
+        resume: bool = True,
+        retry_failed: bool = True,
+    ) -> BatchStats:
+        """Run the workflow over the inputs and append results to a JSONL file.
+
+        Results are appended as they are produced: lines finished while a
+        write is in progress are written together by the next one, in a
+        worker thread, so the event loop never waits on the disk. An
+        interrupted batch can be resumed: offsets already completed in the
+        output file are skipped. Failed items (e.g. on provider or rate-limit errors) are run
+        again; their new result is appended, and the last line of an offset
+        supersedes earlier ones.
+
+        Args:
+            inputs: Iterable, async iterable or path of a JSONL file
+            output: Path of the JSONL results file
+            resume: Whether to skip inputs already present in the output file
+            retry_failed: Whether inputs that failed in an earlier run are retried on resume
+
+        Returns:
+            Final batch statistics
+        """
+        output_path = Path(output)
+        done = await asyncio.to_thread(_completed_offsets, output_path, retry_failed) if resume else set()
+
+        file = await asyncio.to_thread(output_path.open, "a" if resume else "w", encoding="utf-8")
+        lines: list[str] = []
+        writing: asyncio.Future[None] | None = None
+        try:
+            async for result in self.stream(inputs, skip=done):
+                lines.append(json.dumps(asdict(result), ensure_ascii=False) + "\n")
+                # Wait for the write in progress only once it is done or too many lines are waiting
+                if writing is not None and (writing.done() or len(lines) >= self.max_pending):
+                    await writing
+                    writing = None
+                if writing is None:
+                    writing = asyncio.ensure_future(asyncio.to_thread(_write_lines, file, lines))
+                    lines = []
+        finally:
+            try:
+                if writing is not None:
+                    await writing
+                if lines:
+                    await asyncio.to_thread(_write_lines, file, lines)
+            finally:
+                file.close()
+        return self.stats
+
+    async def _run_item(self, offset: int, item: BatchInput) -> BatchResult:
+        item_deps = {"message": item} if isinstance(item, str) else dict(item)
+        state = WorkflowState()
+        started = time.perf_counter()
+        try:
+            with execution_scope(batch_collector=self.collector):
+                async with self.manager.session(**{"lane": self.lane, **self.deps, **item_deps}) as deps:
+                    result = await self.graph.run(start_node_for(self.graph), state=state, deps=deps)
+            self.stats.completed += 1
+            outcome = BatchResult(offset=offset, output=str(result.output), run_id=state.run_id)
+        except Exception as e:
+            self.stats.failed += 1
+            outcome = BatchResult(offset=offset, output=None, error=f"{type(e).__name__}: {e}", run_id=state.run_id)
+        outcome.duration = time.perf_counter() - started
+        self.stats.busy_time += outcome.duration
+        return outcome
+
+    async def _report_progress(self) -> None:
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            self._emit_progress()
+
+    def _emit_progress(self) -> None:
+        if self.on_progress is not None:
+            self.on_progress(self.stats)
+        if self.verbose:
+            stats = self.stats
+            print(
+                f"Batch: {stats.completed} completed, {stats.failed} failed, {stats.in_flight} in flight, "
+                f"{stats.throughput:.1f} items/s"
+            )
+
+
+async def _enumerate(
+    inputs: Iterable[BatchInput] | AsyncIterable[BatchInput] | str | Path,
+) -> AsyncIterator[tuple[int, BatchInput]]:
+    if isinstance(inputs, str | Path):
+        file = await asyncio.to_thread(Path(inputs).open, encoding="utf-8")
+        try:
+            offset = 0
+            while lines := await asyncio.to_thread(file.readlines, _READ_CHUNK_SIZE):
+                for line in lines:
+                    if line.strip():
+                        yield offset, json.loads(line)
+                        offset += 1
+        finally:
+            file.close()
+        return
+    if isinstance(inputs, AsyncIterable):
+        offset = 0
+        async for item in inputs:
+            yield offset, item
+            offset += 1
+        return
+    for offset, item in enumerate(inputs):
+        yield offset, item
+
+
+def _write_lines(file: Any, lines: list[str]) -> None:
+    file.write("".join(lines))
+    file.flush()
+
+
+def _completed_offsets(path: Path, retry_failed: bool = True) -> set[int]:
+    """Read the offsets done in a results file, dropping a trailing partial line.
+
+    An offset is done once a line reports it without error (or with any
+    outcome when failed items are not retried).
+    """
+    if not path.exists():
+        return set()
+    offsets = set()
+    complete_size = 0
+    with path.open("rb") as file:
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+                if record.get("error") is None or not retry_failed:
+                    offsets.add(record["offset"])
+            except (ValueError, KeyError, AttributeError):
+                continue
+            finally:
+                complete_size += len(line)
+    # A line cut short by an interrupted write is removed and its input retried
+    os.truncate(path, complete_size)
+    return offsets
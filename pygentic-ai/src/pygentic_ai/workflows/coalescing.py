@@ -0,0 +1,158 @@
+"""Coalescing of identical concurrent workflow requests."""
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic_ai.messages import ModelMessagesTypeAdapter
+from pydantic_graph import Graph
+
+from pygentic_ai.manager import AgentManager
+from pygentic_ai.workflows.agent_workflow import user_assistant_graph
+from pygentic_ai.workflows.runner import run_workflow
+from pygentic_ai.workflows.state import WorkflowState
+
+WorkflowRunner = Callable[..., Awaitable[str]]
+
+DEFAULT_KEY_FIELDS = ("message", "language", "target_language", "tenant")
+
+
+@dataclass
+class CoalescingStats:
+    """Statistics of request coalescing."""
+
+    runs: int = 0
+    coalesced: int = 0
+    cancelled_runs: int = 0
+
+    @property
+    def coalescing_rate(self) -> float:
+        """Fraction of requests served by another request's run."""
+        requests = self.runs + self.coalesced
+        return self.coalesced / requests if requests else 0.0
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task[str]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class WorkflowCoalescer:
+    """Shares one workflow run between identical requests in flight at the same time.
+
+    Requests are identical when they target the same graph and have the
+    same ``key_fields`` deps and chat history. The first request starts the
+    run; requests arriving before it finishes wait for its result (or
+    exception) instead of running the graph again. Results are not cached
+    after the run finishes.
+
+    The run belongs to all waiting requests: it keeps going when the request
+    that started it is cancelled, and is cancelled only when every waiting
+    request has gone away.
+
+    With a ``manager``, requests pass only their own deps (message, language,
+    chat history...) and the shared run takes the agents from a
+    ``manager.session()`` it holds until it finishes, so a ``reload`` cannot
+    close them while any request waits, even after the request that started
+    the run is gone.
+
+    Args:
+        runner: Function running the workflow, called as ``runner(deps, graph, budget=...)``
+            (defaults to ``run_workflow``; ``AdmissionController.run`` also fits)
+        key_fields: Deps identifying a request, in addition to the chat history
+        manager: Agent manager whose session pins the agents of each shared run
+
+    Example:
+        ```python
+        from pygentic_ai.workflows import AdmissionController, WorkflowCoalescer
+
+        admission = AdmissionController(max_in_flight=64)
+        coalescer = WorkflowCoalescer(runner=admission.run, manager=manager)
+
+        response = await coalescer.run({"message": message, "language": "english"}, budget=10)
+        ```
+    """
+
+    def __init__(
+        self,
+        runner: WorkflowRunner = run_workflow,
+        key_fields: Iterable[str] = DEFAULT_KEY_FIELDS,
+        manager: AgentManager | None = None,
+    ) -> None:
+        self.runner = runner
+        self.key_fields = tuple(key_fields)
+        self.manager = manager
+        self.stats = CoalescingStats()
+        self._flights: dict[str, _Flight] = {}
+
+    async def run(
+        self,
+        deps: dict[str, Any],
+        graph: Graph[WorkflowState, dict, str] = user_assistant_graph,
+        *,
+        budget: float | None = None,
+    ) -> str:
+        """Run the workflow, or join an identical run already in flight.
+
+        Args:
+            deps: Workflow dependencies (without the agents when the coalescer has a manager)
+            graph: Workflow graph to run
+            budget: End-to-end time budget in seconds (of the run this request starts)
+
+        Returns:
+            Output of the shared workflow run
+        """
+        key = self.key(deps, graph)
+        flight = self._flights.get(key)
+        if flight is None:
+            task = asyncio.create_task(self._run_flight(deps, graph, budget))
+            flight = _Flight(task)
+            self._flights[key] = flight
+            task.add_done_callback(lambda _: self._forget(key, flight))
+            self.stats.runs += 1
+        else:
+            self.stats.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Nobody is waiting for the result any more
+                flight.task.cancel()
+                self.stats.cancelled_runs += 1
+                self._forget(key, flight)
+
+    async def _run_flight(
+        self, deps: dict[str, Any], graph: Graph[WorkflowState, dict, str], budget: float | None
+    ) -> str:
+        if self.manager is None:
+            return await self.runner(deps, graph, budget=budget)
+        async with self.manager.session(**deps) as pinned_deps:
+            return await self.runner(pinned_deps, graph, budget=budget)
+
+    def key(self, deps: dict[str, Any], graph: Graph[WorkflowState, dict, str]) -> str:
+        """Build the key identifying identical requests."""
+        fields = {name: deps.get(name) for name in self.key_fields}
+        history = ModelMessagesTypeAdapter.dump_python(deps.get("chat_history") or [], mode="json")
+        # Timestamps differ between otherwise identical histories
+        for message in history:
+            message.pop("timestamp", None)
+            for part in message.get("parts", []):
+                part.pop("timestamp", None)
+        payload = json.dumps([graph.name, fields, history], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct runs in flight."""
+        return len(self._flights)
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
@@ -1,17 +1,36 @@
 """Workflow node components for building agent workflows."""
 
-from pygentic_ai.workflows.nodes.base import StartNode
-from pygentic_ai.workflows.nodes.generation import GenerateNode
-from pygentic_ai.workflows.nodes.guardrails import GuardrailsNode
-from pygentic_ai.workflows.nodes.refusal import RefuseNode
-from pygentic_ai.workflows.nodes.routing import ClassifyNode
-from pygentic_ai.workflows.nodes.translation import TranslateNode
+from typing import TYPE_CHECKING
+
+from pygentic_ai.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pygentic_ai.workflows.nodes.base import FusedStartNode, StartNode, start_node_for
+    from pygentic_ai.workflows.nodes.generation import GenerateNode
+    from pygentic_ai.workflows.nodes.guardrails import GuardrailsNode
+    from pygentic_ai.workflows.nodes.refusal import RefuseNode
+    from pygentic_ai.workflows.nodes.routing import ClassifyGenerateNode, ClassifyNode
+    from pygentic_ai.workflows.nodes.translation import TranslateNode
+
+_EXPORTS = {
+    "pygentic_ai.workflows.nodes.base": ["FusedStartNode", "StartNode", "start_node_for"],
+    "pygentic_ai.workflows.nodes.generation": ["GenerateNode"],
+    "pygentic_ai.workflows.nodes.guardrails": ["GuardrailsNode"],
+    "pygentic_ai.workflows.nodes.refusal": ["RefuseNode"],
+    "pygentic_ai.workflows.nodes.routing": ["ClassifyGenerateNode", "ClassifyNode"],
+    "pygentic_ai.workflows.nodes.translation": ["TranslateNode"],
+}
 
 __all__ = [
     "StartNode",
+    "FusedStartNode",
     "ClassifyNode",
+    "ClassifyGenerateNode",
     "GenerateNode",
     "GuardrailsNode",
     "RefuseNode",
     "TranslateNode",
+    "start_node_for",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
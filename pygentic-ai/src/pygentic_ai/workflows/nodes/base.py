@@ -1,14 +1,65 @@
 """Base/Start node for workflows."""
 
+import time
+import uuid
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pydantic_graph import BaseNode, GraphRunContext
 
+from pygentic_ai.context import ExecutionScope, current_scope, execution_scope
 from pygentic_ai.workflows.state import WorkflowState
 
 if TYPE_CHECKING:
-    from pygentic_ai.workflows.nodes.routing import ClassifyNode
+    from pydantic_graph import Graph
+
+    from pygentic_ai.workflows.nodes.routing import ClassifyGenerateNode, ClassifyNode
+
+
+# Share of the remaining run time a node may use, leaving time for the nodes after it
+NODE_DEADLINE_SHARES: dict[str, float] = {
+    "classify": 0.25,
+    "classify_generate": 0.75,
+    "generate": 0.7,
+    "translate": 0.7,
+    "guardrails": 1.0,
+}
+
+
+def node_scope(ctx: GraphRunContext[WorkflowState, dict], node: str) -> AbstractContextManager[ExecutionScope]:
+    """Open the execution scope for agent calls made by a workflow node.
+
+    If the run has a deadline, the node gets its share of the remaining
+    time (see ``NODE_DEADLINE_SHARES``).
+
+    Args:
+        ctx: Graph run context of the node
+        node: Name the node's agent calls are attributed to
+    """
+    attributes: dict[str, Any] = {
+        "run_id": ctx.state.run_id or None,
+        "node": node,
+        "tenant": ctx.deps.get("tenant"),
+        "session_id": ctx.deps.get("session_id"),
+        "lane": ctx.deps.get("lane"),
+    }
+    remaining = current_scope().remaining()
+    if remaining is not None:
+        attributes["deadline"] = time.monotonic() + max(remaining, 0.0) * NODE_DEADLINE_SHARES.get(node, 1.0)
+    return execution_scope(**attributes)
+
+
+def start_node_for(graph: "Graph[WorkflowState, dict, str]") -> BaseNode[WorkflowState, dict, str]:
+    """Create the entry node of a workflow graph, i.e. the first node it was defined with."""
+    node_def = next(iter(graph.node_defs.values()))
+    return node_def.node()
+
+
+def _start_run(ctx: GraphRunContext[WorkflowState, dict]) -> None:
+    ctx.state.current_message = ctx.deps["message"]
+    if not ctx.state.run_id:
+        ctx.state.run_id = ctx.deps.get("run_id") or uuid.uuid4().hex
 
 
 @dataclass
@@ -17,6 +68,7 @@ class StartNode(BaseNode[WorkflowState, dict, str]):
 
     This node should be the entry point for most workflows. It extracts
     the user message from dependencies and stores it in the workflow state.
+    A ``run_id`` passed in dependencies is kept, otherwise a new one is generated.
 
     Example:
         ```python
@@ -33,5 +85,20 @@ class StartNode(BaseNode[WorkflowState, dict, str]):
     async def run(self, ctx: GraphRunContext[WorkflowState, dict]) -> "ClassifyNode":
         from pygentic_ai.workflows.nodes.routing import ClassifyNode
 
-        ctx.state.current_message = ctx.deps["message"]
+        _start_run(ctx)
         return ClassifyNode()
+
+
+@dataclass
+class FusedStartNode(BaseNode[WorkflowState, dict, str]):
+    """Entry node of workflows that classify and answer a message in one call.
+
+    Initializes the workflow state like ``StartNode`` and continues with
+    ``ClassifyGenerateNode``.
+    """
+
+    async def run(self, ctx: GraphRunContext[WorkflowState, dict]) -> "ClassifyGenerateNode":
+        from pygentic_ai.workflows.nodes.routing import ClassifyGenerateNode
+
+        _start_run(ctx)
+        return ClassifyGenerateNode()
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from pydantic_graph import BaseNode, GraphRunContext
 
+from pygentic_ai.workflows.nodes.base import node_scope
 from pygentic_ai.workflows.state import WorkflowState
 
 if TYPE_CHECKING:
@@ -24,6 +25,11 @@ class GenerateNode(BaseNode[WorkflowState, dict, str]):
 
         agent = ctx.deps["agent"]
         chat_history = ctx.deps.get("chat_history", [])
-        response = await agent.generate_response(ctx.state.current_message, chat_history)
+        with node_scope(ctx, "generate"):
+            response = await agent.generate_response(
+                ctx.state.current_message,
+                chat_history,
+                language=ctx.deps.get("language"),
+            )
         ctx.state.generated_response = str(response.output)
         return GuardrailsNode()
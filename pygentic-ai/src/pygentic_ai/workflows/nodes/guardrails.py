@@ -4,6 +4,8 @@ from dataclasses import dataclass
 
 from pydantic_graph import BaseNode, End, GraphRunContext
 
+from pygentic_ai.schemas import TaskType
+from pygentic_ai.workflows.nodes.base import node_scope
 from pygentic_ai.workflows.state import WorkflowState
 
 
@@ -13,9 +15,35 @@ class GuardrailsNode(BaseNode[WorkflowState, dict, str]):
 
     This is typically the final processing node before returning the response.
     It applies guardrails to ensure the response meets formatting and content guidelines.
+
+    When the main agent follows the guardrail constraints itself
+    (``inline_guardrails``), its conversation responses are validated
+    locally and the guardrails model is only called if validation fails.
+    Other responses (e.g. translations) are always reformatted. The ``skip_guardrails``
+    dep returns the response unchanged (used to shed load).
     """
 
     async def run(self, ctx: GraphRunContext[WorkflowState, dict]) -> End[str]:
         guardrails = ctx.deps["guardrails"]
-        result = await guardrails.reformat(ctx.state.generated_response)
+        response = ctx.state.generated_response
+        if ctx.deps.get("skip_guardrails"):
+            return End(response)
+
+        agent = ctx.deps.get("agent")
+        soft_word_limit = 250
+
+        if ctx.state.task_type == TaskType.conversation and getattr(agent, "inline_guardrails", False):
+            soft_word_limit = agent.soft_word_limit
+            violations = guardrails.validate(response, soft_word_limit=soft_word_limit)
+            if not violations:
+                return End(response)
+            if guardrails.verbose:
+                print(f"Guardrails validation failed: {', '.join(violations)}")
+
+        with node_scope(ctx, "guardrails"):
+            result = await guardrails.reformat(
+                response,
+                soft_word_limit=soft_word_limit,
+                language=ctx.deps.get("language"),
+            )
         return End(result)
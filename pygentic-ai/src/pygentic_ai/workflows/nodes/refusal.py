@@ -4,7 +4,7 @@ from dataclasses import dataclass
 
 from pydantic_graph import BaseNode, End, GraphRunContext
 
-from pygentic_ai.static.default_msgs import REFUSAL_GENERIC
+from pygentic_ai.static.catalog import message_catalog
 from pygentic_ai.workflows.state import WorkflowState
 
 
@@ -13,11 +13,15 @@ class RefuseNode(BaseNode[WorkflowState, dict, str]):
     """Node that returns a refusal response with the reason.
 
     This node is used when the router classifies a message as requiring refusal
-    (e.g., attempts to jailbreak the system).
+    (e.g., attempts to jailbreak the system). The message comes from the
+    ``message_catalog`` deps entry (or the shared ``message_catalog``), which
+    translates it with the ``translator`` agent once for languages it lacks.
     """
 
     async def run(self, ctx: GraphRunContext[WorkflowState, dict]) -> End[str]:
         language = ctx.deps.get("language", "english")
         refusal_reason = ctx.state.refusal_info.refusal_reason if ctx.state.refusal_info else "Unknown reason"
-        response = REFUSAL_GENERIC[language].format(refusal_reason=refusal_reason)
+        catalog = ctx.deps.get("message_catalog") or message_catalog
+        template = await catalog.aget("refusal_generic", language, translator=ctx.deps.get("translator"))
+        response = template.format(refusal_reason=refusal_reason)
         return End(response)
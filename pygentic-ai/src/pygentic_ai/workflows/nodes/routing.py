@@ -6,10 +6,12 @@ from typing import TYPE_CHECKING
 from pydantic_graph import BaseNode, GraphRunContext
 
 from pygentic_ai.schemas.agent import TaskType
+from pygentic_ai.workflows.nodes.base import node_scope
 from pygentic_ai.workflows.state import WorkflowState
 
 if TYPE_CHECKING:
     from pygentic_ai.workflows.nodes.generation import GenerateNode
+    from pygentic_ai.workflows.nodes.guardrails import GuardrailsNode
     from pygentic_ai.workflows.nodes.refusal import RefuseNode
     from pygentic_ai.workflows.nodes.translation import TranslateNode
 
@@ -28,7 +30,8 @@ class ClassifyNode(BaseNode[WorkflowState, dict, str]):
         from pygentic_ai.workflows.nodes.translation import TranslateNode
 
         router = ctx.deps["router"]
-        classification = await router.route(ctx.state.current_message)
+        with node_scope(ctx, "classify"):
+            classification = await router.route(ctx.state.current_message, language=ctx.deps.get("language"))
 
         if classification.route == TaskType.refuse.value:
             ctx.state.set_refusal(ctx.state.current_message, classification.reasoning)
@@ -40,3 +43,46 @@ class ClassifyNode(BaseNode[WorkflowState, dict, str]):
             return TranslateNode()
 
         return GenerateNode()
+
+
+@dataclass
+class ClassifyGenerateNode(BaseNode[WorkflowState, dict, str]):
+    """Node that classifies the message and drafts the answer in one model call.
+
+    The main agent returns the route together with the answer for standard
+    conversation, which then goes straight to guardrails. Refusal and
+    translation are handled by their usual nodes; if the model returns no
+    answer for a conversation, the node falls back to ``GenerateNode``.
+    """
+
+    async def run(
+        self, ctx: GraphRunContext[WorkflowState, dict]
+    ) -> "GuardrailsNode | GenerateNode | RefuseNode | TranslateNode":
+        from pygentic_ai.workflows.nodes.generation import GenerateNode
+        from pygentic_ai.workflows.nodes.guardrails import GuardrailsNode
+        from pygentic_ai.workflows.nodes.refusal import RefuseNode
+        from pygentic_ai.workflows.nodes.translation import TranslateNode
+
+        agent = ctx.deps["agent"]
+        with node_scope(ctx, "classify_generate"):
+            result = await agent.route_and_generate(
+                ctx.state.current_message,
+                ctx.deps.get("chat_history", []),
+                language=ctx.deps.get("language"),
+            )
+        routed = result.output
+
+        if routed.route == TaskType.refuse.value:
+            ctx.state.set_refusal(ctx.state.current_message, routed.reasoning)
+            return RefuseNode()
+
+        ctx.state.task_type = TaskType(routed.route)
+
+        if routed.route == TaskType.translate.value:
+            return TranslateNode()
+
+        if not routed.answer:
+            return GenerateNode()
+
+        ctx.state.generated_response = routed.answer
+        return GuardrailsNode()
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from pydantic_graph import BaseNode, GraphRunContext
 
+from pygentic_ai.workflows.nodes.base import node_scope
 from pygentic_ai.workflows.state import WorkflowState
 
 if TYPE_CHECKING:
@@ -25,7 +26,8 @@ class TranslateNode(BaseNode[WorkflowState, dict, str]):
         translator = ctx.deps["translator"]
         target_lang = ctx.deps.get("target_language", "english")
 
-        result = await translator.translate(ctx.state.current_message, target_lang)
+        with node_scope(ctx, "translate"):
+            result = await translator.translate(ctx.state.current_message, target_lang)
 
         ctx.state.generated_response = result
         return GuardrailsNode()
@@ -0,0 +1,323 @@
+"""Durable checkpointing of workflow runs."""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Annotated, Any
+
+import pydantic
+from pydantic_graph import BaseNode, End, Graph
+from pydantic_graph.exceptions import GraphNodeStatusError
+from pydantic_graph.persistence import BaseStatePersistence, EndSnapshot, NodeSnapshot, Snapshot, SnapshotStatus
+
+from pygentic_ai.workflows.nodes import start_node_for
+from pygentic_ai.workflows.state import WorkflowState
+
+_RESUMABLE_STATUSES: tuple[SnapshotStatus, ...] = ("created", "pending", "running", "error")
+
+
+class CheckpointPersistence(BaseStatePersistence[WorkflowState, str]):
+    """Graph state persistence writing one snapshot at a time.
+
+    The snapshots of the run are kept in memory and every change is written
+    as a single record, so checkpointing a step costs one small write instead
+    of rewriting the run history. A node left ``running`` by a worker that
+    died (or that failed) is handed out again by ``load_next``, so resuming
+    repeats only that node, not the steps completed before it.
+
+    Args:
+        run_id: Identifier of the workflow run
+    """
+
+    def __init__(self, run_id: str) -> None:
+        self.run_id = run_id
+        self._adapter: pydantic.TypeAdapter[Snapshot[WorkflowState, str]] | None = None
+        self._snapshots: dict[str, Snapshot[WorkflowState, str]] | None = None
+
+    async def snapshot_node(self, state: WorkflowState, next_node: BaseNode[WorkflowState, Any, str]) -> None:
+        await self._save(NodeSnapshot(state=state, node=next_node))
+
+    async def snapshot_node_if_new(
+        self, snapshot_id: str, state: WorkflowState, next_node: BaseNode[WorkflowState, Any, str]
+    ) -> None:
+        if snapshot_id not in await self._loaded():
+            await self._save(NodeSnapshot(state=state, node=next_node))
+
+    async def snapshot_end(self, state: WorkflowState, end: End[str]) -> None:
+        await self._save(EndSnapshot(state=state, result=end))
+
+    @asynccontextmanager
+    async def record_run(self, snapshot_id: str) -> AsyncIterator[None]:
+        snapshots = await self._loaded()
+        if (snapshot := snapshots.get(snapshot_id)) is None:
+            raise LookupError(f"No snapshot found with id={snapshot_id!r}")
+        assert isinstance(snapshot, NodeSnapshot), "Only NodeSnapshot can be recorded"
+        GraphNodeStatusError.check(snapshot.status)
+        snapshot.status = "running"
+        snapshot.start_ts = datetime.now(tz=timezone.utc)
+        await self._save(snapshot)
+
+        started = perf_counter()
+        try:
+            yield
+        except Exception:
+            snapshot.status = "error"
+            raise
+        else:
+            snapshot.status = "success"
+        finally:
+            snapshot.duration = perf_counter() - started
+            await self._save(snapshot)
+
+    async def load_next(self) -> NodeSnapshot[WorkflowState, str] | None:
+        for snapshot in (await self._loaded()).values():
+            if isinstance(snapshot, NodeSnapshot) and snapshot.status in _RESUMABLE_STATUSES:
+                snapshot.status = "pending"
+                await self._save(snapshot)
+                return snapshot
+        return None
+
+    async def load_all(self) -> list[Snapshot[WorkflowState, str]]:
+        return list((await self._loaded()).values())
+
+    async def result(self) -> str | None:
+        """Get the output of the run if it has finished."""
+        for snapshot in (await self._loaded()).values():
+            if isinstance(snapshot, EndSnapshot):
+                return snapshot.result.data
+        return None
+
+    def should_set_types(self) -> bool:
+        return self._adapter is None
+
+    def set_types(self, state_type: type[WorkflowState], run_end_type: type[str]) -> None:
+        self._adapter = pydantic.TypeAdapter(
+            Annotated[Snapshot[state_type, run_end_type], pydantic.Discriminator("kind")]  # type: ignore[valid-type]
+        )
+
+    @abstractmethod
+    def _write(self, position: int, snapshot: Snapshot[WorkflowState, str], data: bytes) -> None:
+        """Persist one snapshot (called in a worker thread)."""
+
+    @abstractmethod
+    def _read(self) -> list[bytes]:
+        """Read the persisted snapshot records in write order (called in a worker thread)."""
+
+    async def _loaded(self) -> dict[str, Snapshot[WorkflowState, str]]:
+        if self._snapshots is None:
+            assert self._adapter is not None, "set_graph_types must be called before using the persistence"
+            snapshots: dict[str, Snapshot[WorkflowState, str]] = {}
+            for record in await asyncio.to_thread(self._read):
+                snapshot = self._adapter.validate_json(record)
+                snapshots[snapshot.id] = snapshot
+            self._snapshots = snapshots
+        return self._snapshots
+
+    async def _save(self, snapshot: Snapshot[WorkflowState, str]) -> None:
+        snapshots = await self._loaded()
+        snapshots[snapshot.id] = snapshot
+        assert self._adapter is not None
+        data = self._adapter.dump_json(snapshot)
+        position = list(snapshots).index(snapshot.id)
+        await asyncio.to_thread(self._write, position, snapshot, data)
+
+
+class CheckpointStore(ABC):
+    """Storage of workflow checkpoints, handing out one persistence per run."""
+
+    @abstractmethod
+    def for_run(self, run_id: str) -> CheckpointPersistence:
+        """Get the persistence of a workflow run."""
+
+    @abstractmethod
+    def pending_runs(self) -> list[str]:
+        """List runs that have checkpoints but have not finished."""
+
+    @abstractmethod
+    def delete(self, run_id: str) -> None:
+        """Delete the checkpoints of a run."""
+
+
+class JSONLStatePersistence(CheckpointPersistence):
+    """Checkpoints of a run appended to a JSON Lines file.
+
+    Every change appends one line; when a snapshot appears several times the
+    last line wins. A line cut short by a crash is ignored on load.
+
+    Args:
+        path: File holding the run's snapshots
+        run_id: Identifier of the workflow run
+    """
+
+    def __init__(self, path: str | Path, run_id: str) -> None:
+        super().__init__(run_id)
+        self.path = Path(path)
+
+    def _write(self, position: int, snapshot: Snapshot[WorkflowState, str], data: bytes) -> None:
+        with self.path.open("ab") as file:
+            file.write(data + b"\n")
+
+    def _read(self) -> list[bytes]:
+        try:
+            content = self.path.read_bytes()
+        except FileNotFoundError:
+            return []
+        complete, _, partial = content.rpartition(b"\n")
+        if partial:
+            # Drop a line cut short by an interrupted write, so the next append starts on a new line
+            os.truncate(self.path, len(complete) + 1 if complete else 0)
+        return [line for line in complete.split(b"\n") if line]
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Checkpoints stored as one JSON Lines file per run in a directory.
+
+    Args:
+        directory: Directory of the checkpoint files (created if missing)
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def for_run(self, run_id: str) -> JSONLStatePersistence:
+        return JSONLStatePersistence(self.directory / f"{run_id}.jsonl", run_id)
+
+    def pending_runs(self) -> list[str]:
+        pending = []
+        for path in sorted(self.directory.glob("*.jsonl")):
+            if b'"kind":"end"' not in path.read_bytes():
+                pending.append(path.stem)
+        return pending
+
+    def delete(self, run_id: str) -> None:
+        (self.directory / f"{run_id}.jsonl").unlink(missing_ok=True)
+
+
+class SQLiteStatePersistence(CheckpointPersistence):
+    """Checkpoints of a run stored as rows of a SQLite database.
+
+    Args:
+        store: Store owning the database connection
+        run_id: Identifier of the workflow run
+    """
+
+    def __init__(self, store: "SQLiteCheckpointStore", run_id: str) -> None:
+        super().__init__(run_id)
+        self.store = store
+
+    def _write(self, position: int, snapshot: Snapshot[WorkflowState, str], data: bytes) -> None:
+        status = snapshot.status if isinstance(snapshot, NodeSnapshot) else None
+        self.store.execute(
+            "INSERT INTO snapshots (run_id, snapshot_id, position, kind, status, data) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (run_id, snapshot_id) DO UPDATE SET status = excluded.status, data = excluded.data",
+            (self.run_id, snapshot.id, position, snapshot.kind, status, data),
+        )
+
+    def _read(self) -> list[bytes]:
+        rows = self.store.execute(
+            "SELECT data FROM snapshots WHERE run_id = ? ORDER BY position",
+            (self.run_id,),
+        )
+        return [row[0] for row in rows]
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Checkpoints of many runs stored in one SQLite database.
+
+    The database runs in WAL mode with ``synchronous=NORMAL``, so a checkpoint
+    is a single-row upsert that does not wait for a disk flush; a process
+    crash loses nothing, a power loss may lose the last checkpoints.
+
+    Args:
+        path: Database file
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            "run_id TEXT NOT NULL, snapshot_id TEXT NOT NULL, position INTEGER NOT NULL, "
+            "kind TEXT NOT NULL, status TEXT, data BLOB NOT NULL, "
+            "PRIMARY KEY (run_id, snapshot_id))"
+        )
+
+    def for_run(self, run_id: str) -> SQLiteStatePersistence:
+        return SQLiteStatePersistence(self, run_id)
+
+    def pending_runs(self) -> list[str]:
+        rows = self.execute("SELECT run_id FROM snapshots GROUP BY run_id HAVING SUM(kind = 'end') = 0 ORDER BY run_id")
+        return [row[0] for row in rows]
+
+    def delete(self, run_id: str) -> None:
+        self.execute("DELETE FROM snapshots WHERE run_id = ?", (run_id,))
+
+    def execute(self, sql: str, parameters: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        """Execute a statement and fetch its rows."""
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+async def run_checkpointed(
+    graph: Graph[WorkflowState, dict, str],
+    store: CheckpointStore,
+    deps: dict[str, Any],
+    run_id: str | None = None,
+) -> str:
+    """Run a workflow with checkpoints, resuming it if it was interrupted.
+
+    Starting a run whose checkpoints already exist continues from the last
+    completed step, so model calls made before the interruption are not
+    repeated. The deps are not persisted and must be passed again on resume.
+
+    Args:
+        graph: Workflow graph to run
+        store: Checkpoint store
+        deps: Workflow dependencies (e.g. from ``manager.to_deps()``)
+        run_id: Identifier of the run (defaults to ``deps["run_id"]`` or a new one)
+
+    Returns:
+        Output of the workflow
+
+    Example:
+        ```python
+        from pygentic_ai.workflows import SQLiteCheckpointStore, run_checkpointed
+
+        store = SQLiteCheckpointStore("checkpoints.db")
+        output = await run_checkpointed(user_assistant_graph, store, manager.to_deps(message=msg), run_id=msg_id)
+        ```
+    """
+    run_id = run_id or deps.get("run_id") or uuid.uuid4().hex
+    persistence = store.for_run(run_id)
+    persistence.set_graph_types(graph)
+
+    if (output := await persistence.result()) is not None:
+        return output
+    if await persistence.load_all():
+        async with graph.iter_from_persistence(persistence, deps=deps) as run:
+            async for _ in run:
+                pass
+        assert run.result is not None
+        return run.result.output
+
+    result = await graph.run(
+        start_node_for(graph), state=WorkflowState(run_id=run_id), deps=deps, persistence=persistence
+    )
+    return result.output
@@ -0,0 +1,77 @@
+"""Workflow execution with an end-to-end deadline."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from pydantic_graph import BaseNode, End, Graph
+
+from pygentic_ai.context import execution_scope
+from pygentic_ai.static.catalog import message_catalog
+from pygentic_ai.workflows.agent_workflow import user_assistant_graph
+from pygentic_ai.workflows.nodes import start_node_for
+from pygentic_ai.workflows.state import WorkflowState
+
+if TYPE_CHECKING:
+    from pygentic_ai.profiling import RunProfile
+
+
+async def run_workflow(
+    deps: dict[str, Any],
+    graph: Graph[WorkflowState, dict, str] = user_assistant_graph,
+    *,
+    budget: float | None = None,
+    state: WorkflowState | None = None,
+) -> str:
+    """Run a workflow, answering with a generic error message if it runs out of time.
+
+    The deadline is split across the workflow nodes and enforced on every
+    agent call, which is cancelled when its budget runs out. Cancelling the
+    task running this function (e.g. when the client disconnects) cancels the
+    in-flight agent calls and releases their provider connections. Runs
+    profiled by ``Profiler.run()`` are timed node by node.
+
+    Args:
+        deps: Workflow dependencies (e.g. from ``manager.to_deps()``)
+        graph: Workflow graph to run
+        budget: End-to-end time budget in seconds
+        state: Initial workflow state
+
+    Returns:
+        Output of the workflow, or the generic error message of the message
+        catalog in the user's language on timeout
+
+    Example:
+        ```python
+        from pygentic_ai.workflows import run_workflow
+
+        deps = manager.to_deps(message="Hello!", chat_history=[], language="polish")
+        response = await run_workflow(deps, budget=10)
+        ```
+    """
+    deadline = time.monotonic() + budget if budget is not None else None
+    try:
+        async with asyncio.timeout(budget):
+            with execution_scope(deadline=deadline) as scope:
+                if scope.profile is not None:
+                    return await _run_profiled(graph, state or WorkflowState(), deps, scope.profile)
+                result = await graph.run(start_node_for(graph), state=state or WorkflowState(), deps=deps)
+    except TimeoutError:
+        # No time is left for a translation, which is made in the background for later requests
+        catalog = deps.get("message_catalog") or message_catalog
+        return catalog.get("error_generic", deps.get("language"), translator=deps.get("translator"))
+    return result.output
+
+
+async def _run_profiled(
+    graph: Graph[WorkflowState, dict, str],
+    state: WorkflowState,
+    deps: dict[str, Any],
+    profile: "RunProfile",
+) -> str:
+    async with graph.iter(start_node_for(graph), state=state, deps=deps) as graph_run:
+        node: BaseNode[WorkflowState, dict, str] | End[str] = graph_run.next_node
+        while not isinstance(node, End):
+            with profile.node(type(node).__name__):
+                node = await graph_run.next(node)
+    return node.data
@@ -65,6 +65,7 @@ class WorkflowState:
         task_type: The classified task type (conversation, refuse, translate)
         generated_response: The generated response from the agent
         refusal_info: Information about refusal if applicable
+        run_id: Identifier of the workflow run, used to attribute agent calls
 
     Example:
         ```python
@@ -80,6 +81,7 @@ class WorkflowState:
     task_type: TaskType | None = None
     generated_response: str = ""
     refusal_info: RefusalInfo | None = None
+    run_id: str = ""
 
     def set_refusal(self, message: str, reason: str) -> None:
         """Set refusal information.
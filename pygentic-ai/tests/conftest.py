@@ -0,0 +1,27 @@
+"""Shared fixtures for pygentic-ai tests."""
+
+from collections.abc import Iterator
+from contextlib import ExitStack
+
+import pytest
+from pydantic_ai.models.test import TestModel
+
+from pygentic_ai import AgentManager
+from pygentic_ai.engines import GenericRouter, GuardrailsAgent, ReasoningAgent, SimpleTranslatorWorker
+
+
+@pytest.fixture
+def test_manager() -> Iterator[AgentManager]:
+    """AgentManager with the default workflow agents backed by local test models."""
+    manager = AgentManager()
+    manager.register_instance("router", GenericRouter(api_key="sk-test"))
+    manager.register_instance("agent", ReasoningAgent(api_key="sk-test"))
+    manager.register_instance("guardrails", GuardrailsAgent(api_key="sk-test"))
+    manager.register_instance("translator", SimpleTranslatorWorker(api_key="sk-test"))
+
+    with ExitStack() as stack:
+        router_model = TestModel(custom_output_args={"route": 1, "reasoning": "General conversation"})
+        stack.enter_context(manager.get("router").agent.override(model=router_model))
+        for name in ("agent", "guardrails", "translator"):
+            stack.enter_context(manager.get(name).agent.override(model=TestModel(call_tools=[])))
+        yield manager
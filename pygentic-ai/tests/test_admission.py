@@ -0,0 +1,71 @@
+"""Tests for admission control of workflow runs."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from pydantic_ai.models.test import TestModel
+
+from pygentic_ai import AgentManager
+from pygentic_ai.workflows import AdmissionController, OverloadedError
+
+
+async def test_queue_and_shed() -> None:
+    """Test that excess requests queue in order and are shed when the queue is full."""
+    admission = AdmissionController(max_in_flight=1, max_queue=1, max_queue_delay=1.0)
+    order: list[str] = []
+
+    async def request(name: str) -> None:
+        async with admission.admit() as waited:
+            order.append(f"{name}:{waited}")
+            await asyncio.sleep(0.01)
+
+    first = asyncio.create_task(request("first"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(request("second"))
+    await asyncio.sleep(0)
+
+    assert admission.stats.queue_depth == 1
+    with pytest.raises(OverloadedError):
+        await request("third")
+
+    await asyncio.gather(first, second)
+    assert order == ["first:False", "second:True"]
+    assert admission.stats.rejected_queue_full == 1
+    assert admission.stats.in_flight == 0
+
+
+async def test_queue_delay_timeout() -> None:
+    """Test that requests waiting longer than the max queue delay are rejected."""
+    admission = AdmissionController(max_in_flight=1, max_queue=4, max_queue_delay=0.02)
+
+    async with admission.admit():
+        with pytest.raises(OverloadedError):
+            async with admission.admit():
+                pass
+
+    assert admission.stats.rejected_timeout == 1
+    assert admission.stats.shed == 1
+    assert admission.stats.in_flight == 0
+    assert admission.stats.queue_depth == 0
+
+
+async def test_degraded_run_skips_guardrails(test_manager: AgentManager, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that requests admitted while over capacity use the degraded deps."""
+
+    async def reformat(*args: Any, **kwargs: Any) -> str:
+        return "reformatted"
+
+    monkeypatch.setattr(test_manager.get("guardrails"), "reformat", reformat)
+    admission = AdmissionController(max_in_flight=1, degraded_deps={"skip_guardrails": True})
+    deps = test_manager.to_deps(message="Hello", chat_history=[])
+    answer = TestModel(custom_output_text="Hello, how can I help?")
+
+    with test_manager.get("agent").agent.override(model=answer):
+        assert await admission.run(deps) == "reformatted"
+
+        async with admission.admit():
+            degraded = asyncio.create_task(admission.run(deps))
+            await asyncio.sleep(0.01)
+        assert await degraded == "Hello, how can I help?"
+    assert admission.stats.degraded == 1
@@ -0,0 +1,94 @@
+"""Tests for the batch workflow runner."""
+
+import json
+import threading
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from pygentic_ai import AgentManager
+from pygentic_ai.workflows import BatchRunner, BatchStats, batch
+
+
+async def test_stream_keeps_input_order(test_manager: AgentManager) -> None:
+    """Test that ordered batches yield results in input order."""
+
+    async def messages() -> AsyncIterator[str]:
+        for index in range(6):
+            yield f"Question {index}"
+
+    runner = BatchRunner(test_manager, concurrency=3, ordered=True, max_pending=4)
+    results = [result async for result in runner.stream(messages())]
+
+    assert [result.offset for result in results] == list(range(6))
+    assert all(result.output and result.error is None for result in results)
+    assert runner.stats.completed == 6
+    assert runner.stats.in_flight == 0
+
+
+async def test_run_writes_results_and_resumes(test_manager: AgentManager, tmp_path: Path) -> None:
+    """Test that results are written incrementally and completed offsets are skipped on resume."""
+    inputs = tmp_path / "inputs.jsonl"
+    inputs.write_text("\n".join(json.dumps({"message": f"Question {index}"}) for index in range(5)))
+    output = tmp_path / "results.jsonl"
+    output.write_text(json.dumps({"offset": 0, "output": "done"}) + "\n" + '{"offset": 1, "outp')
+    reports: list[BatchStats] = []
+
+    runner = BatchRunner(test_manager, concurrency=2, on_progress=reports.append)
+    stats = await runner.run(inputs, output)
+
+    lines = [json.loads(line) for line in output.read_text().splitlines()[1:]]
+    assert sorted(line["offset"] for line in lines) == [1, 2, 3, 4]
+    assert stats.skipped == 1
+    assert stats.completed == 4
+    assert reports
+    assert reports[-1].throughput > 0
+
+
+async def test_results_are_written_off_the_event_loop(
+    test_manager: AgentManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that results are written in batches from worker threads."""
+    writes: list[tuple[int, int]] = []
+    write_lines = batch._write_lines
+
+    def record(file: Any, lines: list[str]) -> None:
+        writes.append((threading.get_ident(), len(lines)))
+        write_lines(file, lines)
+
+    monkeypatch.setattr(batch, "_write_lines", record)
+    output = tmp_path / "results.jsonl"
+
+    stats = await BatchRunner(test_manager, concurrency=8).run([f"Question {index}" for index in range(40)], output)
+
+    assert stats.completed == 40
+    assert sorted(json.loads(line)["offset"] for line in output.read_text().splitlines()) == list(range(40))
+    assert sum(count for _, count in writes) == 40
+    assert threading.get_ident() not in {thread for thread, _ in writes}
+
+
+async def test_resume_retries_failed_items(test_manager: AgentManager, tmp_path: Path) -> None:
+    """Test that an item failing on a transient error is retried on resume and superseded."""
+    output = tmp_path / "results.jsonl"
+    attempts: list[str] = []
+
+    def flaky(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        prompt = str(messages[0].parts[-1].content)
+        attempts.append(prompt)
+        if "Question 1" in prompt and attempts.count(prompt) == 1:
+            raise ConnectionError("rate limited")
+        return ModelResponse(parts=[TextPart("Answer")])
+
+    with test_manager.get("agent").agent.override(model=FunctionModel(flaky)):
+        first = await BatchRunner(test_manager, concurrency=2).run([f"Question {index}" for index in range(3)], output)
+        assert first.failed == 1
+        second = await BatchRunner(test_manager, concurrency=2).run([f"Question {index}" for index in range(3)], output)
+
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert second.skipped == 2
+    assert second.completed == 1
+    assert [(line["offset"], line["error"] is None) for line in lines if line["offset"] == 1] == [(1, False), (1, True)]
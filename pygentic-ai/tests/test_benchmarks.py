@@ -0,0 +1,35 @@
+"""Smoke tests for the benchmark suite."""
+
+import random
+
+import pytest
+
+from benchmarks import suite
+from benchmarks.fake_models import FakeModelFactory, LatencyProfile
+
+
+def test_latency_profiles_are_seeded() -> None:
+    """Test that latency samples repeat for a seed and include the token generation time."""
+    profile = LatencyProfile(distribution="lognormal", mean=0.1, jitter=0.5, tokens_per_second=100, output_tokens=20)
+    first = [profile.sample(random.Random(7)) for _ in range(3)]
+    assert first == [profile.sample(random.Random(7)) for _ in range(3)]
+    assert all(sample > 0.2 for sample in first)
+    assert LatencyProfile(distribution="fixed", mean=0.1).sample(random.Random()) == 0.1
+    with pytest.raises(ValueError, match="Unknown distribution"):
+        LatencyProfile(distribution="bimodal")
+
+
+@pytest.mark.parametrize("scenario", ["graph", "fused_graph", "engines", "manager"])
+async def test_scenarios_report_metrics(scenario: str) -> None:
+    """Test that every scenario runs against the fake models and reports comparable metrics."""
+    factory = FakeModelFactory(profile=LatencyProfile(mean=0.0, output_tokens=5))
+    result = await suite.run_scenario(scenario, factory, requests=6, concurrency=3, warmup=1)
+
+    assert result["requests"] == 6
+    assert result["rps"] > 0
+    assert result["model_calls_per_request"] >= 2
+    assert result["latency"]["p50"] <= result["latency"]["p99"] <= result["latency"]["max"]
+    assert result["nodes"]
+    assert all(stats["count"] > 0 for stats in result["nodes"].values())
+    baseline = {"schema": suite.RESULTS_SCHEMA, "metadata": {"created": "", "config": {}}, "results": [result]}
+    assert suite.compare([result], baseline, threshold=0.1) == []
@@ -0,0 +1,111 @@
+"""Tests for recording and replaying agent model traffic."""
+
+import asyncio
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart, ToolReturnPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.models.test import TestModel
+
+from pygentic_ai import AgentManager, Cassette, CassetteMissError
+from pygentic_ai.context import execution_scope
+from pygentic_ai.engines import GenericRouter, GuardrailsAgent, ReasoningAgent, SimpleTranslatorWorker
+from pygentic_ai.workflows import run_workflow
+
+
+def current_time() -> str:
+    """Get the current time."""
+    return datetime.now().isoformat()
+
+
+async def _answer_with_clock(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+    await asyncio.sleep(0.02)
+    if not any(isinstance(part, ToolReturnPart) for message in messages for part in message.parts):
+        return ModelResponse(parts=[ToolCallPart("current_time", {}, tool_call_id="call-1")])
+    return ModelResponse(parts=[TextPart("It is late.")])
+
+
+def _manager(live: bool) -> AgentManager:
+    """Workflow agents; live ones answer from local models, the others would call OpenAI."""
+    manager = AgentManager()
+    manager.register_instance("router", GenericRouter(api_key="sk-test"))
+    manager.register_instance("agent", ReasoningAgent(api_key="sk-test", tool_list=[current_time]))
+    manager.register_instance("guardrails", GuardrailsAgent(api_key="sk-test"))
+    manager.register_instance("translator", SimpleTranslatorWorker(api_key="sk-test"))
+    if live:
+        manager.get("router").agent.model = TestModel(custom_output_args={"route": 1, "reasoning": "Question"})
+        manager.get("agent").agent.model = FunctionModel(_answer_with_clock)
+        manager.get("guardrails").agent.model = TestModel(custom_output_text="It is late!")
+    return manager
+
+
+async def test_workflow_replays_offline(tmp_path: Path) -> None:
+    """Test that a recorded workflow, including tool calls, is replayed without the models."""
+    path = tmp_path / "traffic.jsonl.gz"
+    recorder = Cassette(path, mode="record")
+    with execution_scope(cassette=recorder):
+        recorded = await run_workflow(_manager(live=True).to_deps(message="What time is it?", chat_history=[]))
+    recorder.save()
+
+    assert recorded == "It is late!"
+    assert [entry.agent for entry in recorder] == [
+        "GenericRouter",
+        "ReasoningAgent",
+        "ReasoningAgent",
+        "GuardrailsAgent",
+    ]
+    assert recorder.entries[1].node == "generate"
+
+    player = Cassette(path)
+    with execution_scope(cassette=player):
+        replayed = await run_workflow(_manager(live=False).to_deps(message="What time is it?", chat_history=[]))
+
+    assert replayed == recorded
+    assert player.stats.replayed == 4
+    assert player.stats.misses == 0
+
+
+async def test_latency_is_reproduced(tmp_path: Path) -> None:
+    """Test that replayed responses can wait for their recorded latency, scaled."""
+    path = tmp_path / "traffic.jsonl"
+    recorder = Cassette(path, mode="record")
+    agent = ReasoningAgent(api_key="sk-test", tool_list=[current_time])
+    model = FunctionModel(_answer_with_clock)
+    with execution_scope(cassette=recorder):
+        await agent.generate_response("Hello", model=model)
+    recorder.save()
+
+    elapsed = {}
+    for scale in (1.0, 0.0):
+        player = Cassette(path, reproduce_latency=True, latency_scale=scale)
+        started = time.perf_counter()
+        with execution_scope(cassette=player):
+            await agent.generate_response("Hello", model=model)
+        elapsed[scale] = time.perf_counter() - started
+
+    recorded_latency = sum(entry.latency for entry in recorder)
+    assert elapsed[1.0] >= recorded_latency >= 0.04
+    assert elapsed[0.0] < elapsed[1.0]
+
+
+async def test_repeated_requests_replay_in_order(tmp_path: Path) -> None:
+    """Test that a request recorded several times gets its responses in order, then starts over."""
+    path = tmp_path / "traffic.jsonl"
+    recorder = Cassette(path, mode="record")
+    agent = SimpleTranslatorWorker(api_key="sk-test")
+    with execution_scope(cassette=recorder):
+        for text in ("Hallo", "Servus"):
+            await agent.translate("Hello", "german", model=TestModel(custom_output_text=text))
+    recorder.save()
+
+    player = Cassette(path)
+    with execution_scope(cassette=player):
+        replies = [await agent.translate("Hello", "german") for _ in range(3)]
+        with pytest.raises(CassetteMissError):
+            await agent.translate("Goodbye", "german")
+
+    assert replies == ["Hallo", "Servus", "Hallo"]
+    assert player.stats.misses == 1
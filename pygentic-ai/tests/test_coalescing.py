@@ -0,0 +1,120 @@
+"""Tests for coalescing identical workflow requests."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from pygentic_ai import AgentManager
+from pygentic_ai.workflows import WorkflowCoalescer
+
+
+class FakeRunner:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, deps: dict[str, Any], graph: Any, budget: float | None = None) -> str:
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"answer to {deps['message']}"
+
+
+async def test_identical_requests_share_one_run() -> None:
+    """Test that concurrent identical requests share a run and different ones do not."""
+    runner = FakeRunner()
+    coalescer = WorkflowCoalescer(runner=runner)
+    deps = {"message": "Hello", "language": "english", "chat_history": []}
+
+    requests = [asyncio.create_task(coalescer.run(dict(deps))) for _ in range(3)]
+    other = asyncio.create_task(coalescer.run({**deps, "language": "polish"}))
+    await asyncio.sleep(0)
+    runner.release.set()
+
+    assert await asyncio.gather(*requests) == ["answer to Hello"] * 3
+    await other
+    assert runner.calls == 2
+    assert coalescer.stats.coalesced == 2
+    assert coalescer.in_flight == 0
+
+
+async def test_run_survives_leader_cancellation() -> None:
+    """Test that the shared run continues while any request still waits for it."""
+    runner = FakeRunner()
+    coalescer = WorkflowCoalescer(runner=runner)
+    deps = {"message": "Hello"}
+
+    leader = asyncio.create_task(coalescer.run(deps))
+    follower = asyncio.create_task(coalescer.run(deps))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    runner.release.set()
+
+    assert await follower == "answer to Hello"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert runner.cancelled == 0
+
+
+async def test_run_cancelled_when_all_requests_leave() -> None:
+    """Test that the shared run is cancelled once nobody waits for it."""
+    runner = FakeRunner()
+    coalescer = WorkflowCoalescer(runner=runner)
+
+    requests = [asyncio.create_task(coalescer.run({"message": "Hello"})) for _ in range(2)]
+    await asyncio.sleep(0)
+    for request in requests:
+        request.cancel()
+    await asyncio.gather(*requests, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert runner.cancelled == 1
+    assert coalescer.stats.cancelled_runs == 1
+    assert coalescer.in_flight == 0
+
+
+class ClosableAgent:
+    def __init__(self, model: str = "small") -> None:
+        self.model = model
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def test_shared_run_pins_its_agents() -> None:
+    """Test that a reload does not close the agents of a shared run after its first request left."""
+    manager = AgentManager()
+    manager.register("agent", ClosableAgent)
+    await manager.initialize()
+    old_agent = manager.get("agent")
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def runner(deps: dict[str, Any], graph: Any, budget: float | None = None) -> str:
+        started.set()
+        await release.wait()
+        return "closed" if deps["agent"].closed else f"{deps['agent'].model} agent"
+
+    coalescer = WorkflowCoalescer(runner=runner, manager=manager)
+    leader = asyncio.create_task(coalescer.run({"message": "Hello"}))
+    await started.wait()
+    follower = asyncio.create_task(coalescer.run({"message": "Hello"}))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    retire = asyncio.create_task(manager.reload({"agent": (ClosableAgent, {"model": "large"})}, wait=True))
+    await asyncio.sleep(0.01)
+    assert not old_agent.closed
+    release.set()
+
+    assert await follower == "small agent"
+    await retire
+    assert old_agent.closed
+    assert manager.in_flight == 0
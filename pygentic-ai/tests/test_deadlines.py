@@ -0,0 +1,53 @@
+"""Tests for deadline propagation across workflow nodes and agent calls."""
+
+import asyncio
+import time
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_graph import GraphRunContext
+
+from pygentic_ai import AgentManager
+from pygentic_ai.context import DeadlineExceededError, current_scope, execution_scope
+from pygentic_ai.static import ERROR_GENERIC
+from pygentic_ai.workflows import WorkflowState, run_workflow
+from pygentic_ai.workflows.nodes.base import node_scope
+
+
+def test_node_gets_share_of_remaining_time() -> None:
+    """Test that node deadlines are split from the run deadline and only tighten it."""
+    ctx = GraphRunContext(state=WorkflowState(), deps={})
+    with execution_scope(deadline=time.monotonic() + 10):
+        with node_scope(ctx, "classify"):
+            assert 2 < current_scope().remaining() <= 2.5
+        with execution_scope(deadline=time.monotonic() + 60):
+            assert current_scope().remaining() <= 10
+
+
+async def test_expired_deadline_cancels_agent_call(test_manager: AgentManager) -> None:
+    """Test that a slow agent call is cancelled and the user gets the generic error."""
+    cancelled = asyncio.Event()
+
+    async def slow(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        raise AssertionError("the call should have been cancelled")
+
+    deps = test_manager.to_deps(message="Hello", chat_history=[], language="polish")
+    started = time.monotonic()
+    with test_manager.get("agent").agent.override(model=FunctionModel(slow)):
+        response = await run_workflow(deps, budget=0.2)
+
+    assert response == ERROR_GENERIC["polish"].strip()
+    assert time.monotonic() - started < 1
+    assert cancelled.is_set()
+
+
+async def test_agent_call_without_time_left(test_manager: AgentManager) -> None:
+    """Test that agent calls fail fast once the deadline has passed."""
+    with execution_scope(deadline=time.monotonic() - 1), pytest.raises(DeadlineExceededError):
+        await test_manager.get("agent").generate_response("Hello")
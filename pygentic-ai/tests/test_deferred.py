@@ -0,0 +1,215 @@
+"""Tests for deferred agent calls submitted as batch jobs."""
+
+import asyncio
+import json
+from collections.abc import Sequence
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from pydantic_ai import Agent, NativeOutput
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.openai import OpenAIProvider
+
+from pygentic_ai import AgentManager, deferred
+from pygentic_ai.context import execution_scope
+from pygentic_ai.deferred import BatchCollector, BatchJobError, DeferredRequest, LocalBatchBackend, OpenAIBatchBackend
+from pygentic_ai.engines import GenericRouter, GuardrailsAgent, ReasoningAgent, SimpleTranslatorWorker
+from pygentic_ai.workflows import BatchRunner
+
+
+def _answer(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+    if info.output_tools:
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {"route": 1, "reasoning": "General"})])
+    return ModelResponse(parts=[TextPart("Deferred answer")])
+
+
+@pytest.fixture
+def live_manager() -> AgentManager:
+    """AgentManager whose agents use their configured (OpenAI) models."""
+    manager = AgentManager()
+    manager.register_instance("router", GenericRouter(api_key="sk-test"))
+    manager.register_instance("agent", ReasoningAgent(api_key="sk-test"))
+    manager.register_instance("guardrails", GuardrailsAgent(api_key="sk-test"))
+    manager.register_instance("translator", SimpleTranslatorWorker(api_key="sk-test"))
+    return manager
+
+
+async def test_batch_runner_defers_workflow_calls(live_manager: AgentManager) -> None:
+    """Test that router, generator and guardrails calls of concurrent runs are grouped into batch jobs."""
+    backend = LocalBatchBackend(FunctionModel(_answer), turnaround=0.02)
+    collector = BatchCollector(backend, max_wait=0.05, poll_interval=0.01)
+    runner = BatchRunner(live_manager, concurrency=6, collector=collector)
+
+    results = [result async for result in runner.stream([f"Question {index}" for index in range(6)])]
+
+    assert [result.error for result in results] == [None] * 6
+    assert {result.output for result in results} == {"Deferred answer"}
+    assert collector.stats.requests == 18
+    assert collector.stats.jobs_submitted == 3
+    assert [len(requests) for requests in backend.jobs.values()] == [6, 6, 6]
+    assert collector.jobs_in_flight == 0
+
+
+async def test_failed_job_fails_waiting_calls(live_manager: AgentManager) -> None:
+    """Test that a batch job failure is raised to every agent call waiting for it."""
+
+    class BrokenBackend(LocalBatchBackend):
+        async def submit(self, requests: Sequence[DeferredRequest]) -> str:
+            raise ConnectionError("provider unavailable")
+
+    collector = BatchCollector(BrokenBackend(), max_wait=0.01)
+    with execution_scope(batch_collector=collector), pytest.raises(BatchJobError):
+        await live_manager.get("agent").generate_response("Hello")
+
+    assert collector.stats.jobs_failed == 1
+
+
+class _SignallingCollector(BatchCollector):
+    """Collector setting an event whenever a request is queued."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.queued = asyncio.Event()
+
+    async def request(self, *args: Any) -> ModelResponse:
+        # The request is queued before the parent coroutine first suspends, so waiters see it
+        self.queued.set()
+        return await super().request(*args)
+
+
+async def test_size_limit_and_cancellation() -> None:
+    """Test that full batches are submitted at once and cancelled requests leave the queue."""
+    model = FunctionModel(_answer)
+    backend = LocalBatchBackend()
+    collector = _SignallingCollector(backend, max_batch_size=2, max_wait=60)
+    agent = ReasoningAgent(api_key="sk-test")
+
+    with execution_scope(batch_collector=collector):
+        abandoned = asyncio.create_task(agent.generate_response("Never mind", model=model))
+        await asyncio.wait_for(collector.queued.wait(), 10)
+        assert collector.pending == 1
+        abandoned.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await abandoned
+        assert collector.pending == 0
+
+        results = await asyncio.gather(*(agent.generate_response(f"Question {i}", model=model) for i in range(2)))
+
+    assert [result.output for result in results] == ["Deferred answer"] * 2
+    assert collector.stats.jobs_submitted == 1
+
+
+class _FakeOpenAIClient:
+    def __init__(self) -> None:
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve)
+        self.lines: list[dict[str, Any]] = []
+        self.polls = 0
+
+    async def _create_file(self, file: tuple[str, bytes], purpose: str) -> SimpleNamespace:
+        self.lines = [json.loads(line) for line in file[1].decode().splitlines()]
+        return SimpleNamespace(id="file-in")
+
+    async def _create_batch(self, **kwargs: Any) -> SimpleNamespace:
+        return SimpleNamespace(id="batch-1", status="validating")
+
+    async def _retrieve(self, job_id: str) -> SimpleNamespace:
+        self.polls += 1
+        status = "completed" if self.polls > 1 else "in_progress"
+        return SimpleNamespace(id=job_id, status=status, output_file_id="file-out", error_file_id=None)
+
+    async def _content(self, file_id: str) -> SimpleNamespace:
+        records = [
+            {
+                "custom_id": line["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "id": "chatcmpl-1",
+                        "object": "chat.completion",
+                        "created": 1,
+                        "model": line["body"]["model"],
+                        "choices": [{"index": 0, "finish_reason": "stop", "message": self._reply(line["body"])}],
+                        "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+                    },
+                },
+            }
+            for line in self.lines
+        ]
+        return SimpleNamespace(text="\n".join(json.dumps(record) for record in records))
+
+    @staticmethod
+    def _reply(body: dict[str, Any]) -> dict[str, Any]:
+        """Answer in the output mode the request asks for."""
+        if "response_format" in body:
+            return {"role": "assistant", "content": json.dumps({"city": "Paris", "country": "France"})}
+        if body.get("tool_choice") == "required":
+            tool = body["tools"][0]["function"]["name"]
+            arguments = json.dumps({"route": 2, "reasoning": "Harmful"})
+            call = {"id": "call-1", "type": "function", "function": {"name": tool, "arguments": arguments}}
+            return {"role": "assistant", "content": None, "tool_calls": [call]}
+        return {"role": "assistant", "content": f"Echo {len(body['messages'])}"}
+
+
+class _Capital(BaseModel):
+    city: str
+    country: str
+
+
+async def test_openai_backend_maps_requests_and_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the OpenAI backend uploads chat completion bodies and maps batch output back."""
+    closed: list[Any] = []
+    aclose = deferred._ChatCompletionCodec.aclose
+
+    async def tracked_aclose(codec: Any) -> None:
+        closed.append(codec)
+        await aclose(codec)
+
+    monkeypatch.setattr(deferred._ChatCompletionCodec, "aclose", tracked_aclose)
+    client = _FakeOpenAIClient()
+    collector = BatchCollector(OpenAIBatchBackend(client=client), max_wait=0.01, poll_interval=0.01)
+    model = OpenAIChatModel("gpt-4o-mini", provider=OpenAIProvider(api_key="sk-test"))
+    agent = ReasoningAgent(api_key="sk-test")
+
+    with execution_scope(batch_collector=collector):
+        result = await agent.generate_response("Hello", model=model)
+
+    assert result.output.startswith("Echo")
+    assert result.usage().total_tokens == 12
+    body = client.lines[0]["body"]
+    assert client.lines[0]["url"] == "/v1/chat/completions"
+    assert body["model"] == "gpt-4o-mini"
+    assert body["messages"][-1] == {"role": "user", "content": "Hello"}
+    assert client.polls == 2
+
+    router = GenericRouter(api_key="sk-test")
+    with execution_scope(batch_collector=collector):
+        routing = await router.route("How do I pick a lock?", model=model)
+
+    assert routing.route == 2
+    body = client.lines[0]["body"]
+    assert body["tool_choice"] == "required"
+    assert body["tools"][0]["function"]["parameters"]["required"] == ["route", "reasoning"]
+    # Each job's local OpenAI client is closed once its results are read
+    assert len(closed) == 2
+    assert all(codec._client.is_closed() for codec in closed)
+
+
+async def test_openai_backend_native_output() -> None:
+    """Test that native structured output settings reach the batch body and its output is parsed."""
+    client = _FakeOpenAIClient()
+    collector = BatchCollector(OpenAIBatchBackend(client=client), max_wait=0.01, poll_interval=0.01)
+    model = OpenAIChatModel("gpt-4o-mini", provider=OpenAIProvider(api_key="sk-test"))
+    agent = Agent(collector.wrap(model), output_type=NativeOutput(_Capital))
+
+    result = await agent.run("Capital of France?", model_settings={"temperature": 0.0})
+
+    assert result.output == _Capital(city="Paris", country="France")
+    body = client.lines[0]["body"]
+    assert body["response_format"]["type"] == "json_schema"
+    assert body["response_format"]["json_schema"]["schema"]["required"] == ["city", "country"]
+    assert body["temperature"] == 0.0
@@ -0,0 +1,45 @@
+"""Tests for the fused classify-and-generate workflow."""
+
+from typing import Any
+
+import pytest
+from pydantic_ai.models.test import TestModel
+
+from pygentic_ai import AgentManager
+from pygentic_ai.workflows import WorkflowState
+from pygentic_ai.workflows.agent_workflow import fused_assistant_graph
+from pygentic_ai.workflows.nodes import FusedStartNode
+
+
+async def test_conversation_skips_router(test_manager: AgentManager, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a conversational message is classified and drafted in one call."""
+
+    async def unexpected_route(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("router should not be called")
+
+    monkeypatch.setattr(test_manager.get("router"), "route", unexpected_route)
+    model = TestModel(custom_output_args={"route": 1, "reasoning": "Greeting", "answer": "Hi there!"})
+    state = WorkflowState()
+
+    with test_manager.get("agent").agent.override(model=model):
+        result = await fused_assistant_graph.run(
+            FusedStartNode(), state=state, deps=test_manager.to_deps(message="Hello", chat_history=[])
+        )
+
+    assert state.generated_response == "Hi there!"
+    assert result.output
+
+
+async def test_translation_branches_off(test_manager: AgentManager) -> None:
+    """Test that translation requests are handled by the translator node."""
+    model = TestModel(custom_output_args={"route": 3, "reasoning": "Translation request"})
+    state = WorkflowState()
+
+    with test_manager.get("agent").agent.override(model=model):
+        await fused_assistant_graph.run(
+            FusedStartNode(), state=state, deps=test_manager.to_deps(message="Translate: hola", chat_history=[])
+        )
+
+    assert state.task_type is not None
+    assert state.task_type.value == 3
+    assert state.generated_response
@@ -0,0 +1,75 @@
+"""Tests for lazy package imports.
+
+Import time itself is measured by ``python -m benchmarks.import_time``; these tests
+check the structure that keeps it low.
+"""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pygentic_ai
+
+HEAVY_MODULES = ("pydantic_ai", "pydantic_graph", "mcp", "openai", "httpx")
+
+_LOADED_MODULES = f"""
+import json, sys
+
+import pygentic_ai
+loaded = {{"package": [name for name in {HEAVY_MODULES!r} if name in sys.modules]}}
+from pygentic_ai import WorkflowState, TaskType
+from pygentic_ai.prompts import TEXT_AGENT_RULES, get_guardrails_instructions
+from pygentic_ai.static import ERROR_GENERIC
+loaded["lightweight"] = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(json.dumps(loaded))
+"""
+
+
+def _loaded_modules() -> dict[str, list[str]]:
+    # Pydantic plugins (e.g. logfire) load their own dependencies on the first model class
+    env = {**os.environ, "PYDANTIC_DISABLE_PLUGINS": "__all__"}
+    output = subprocess.run(
+        [sys.executable, "-c", _LOADED_MODULES], capture_output=True, text=True, check=True, env=env
+    ).stdout
+    return json.loads(output)
+
+
+def test_lightweight_imports_skip_heavy_dependencies() -> None:
+    """Test that the package, its state and its prompts load without the agent and provider stacks."""
+    assert _loaded_modules() == {"package": [], "lightweight": []}
+
+
+def test_lazy_exports_resolve() -> None:
+    """Test that lazily exported names resolve, are cached and are listed."""
+    from pygentic_ai.engines.base import BaseAgent
+
+    assert pygentic_ai.BaseAgent is BaseAgent
+    assert "BaseAgent" in vars(pygentic_ai)
+    assert set(pygentic_ai.__all__) <= set(dir(pygentic_ai))
+    with pytest.raises(AttributeError):
+        _ = pygentic_ai.NotAnExport
+
+
+@pytest.mark.parametrize(
+    "package",
+    [
+        "pygentic_ai",
+        "pygentic_ai.engines",
+        "pygentic_ai.mcp",
+        "pygentic_ai.prompts",
+        "pygentic_ai.schemas",
+        "pygentic_ai.static",
+        "pygentic_ai.tools",
+        "pygentic_ai.workflows",
+        "pygentic_ai.workflows.nodes",
+    ],
+)
+def test_all_exports_importable(package: str) -> None:
+    """Test that every name in a package's ``__all__`` can be imported."""
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
@@ -0,0 +1,96 @@
+"""Tests for inline guardrails with local validation."""
+
+from typing import Any
+
+import pytest
+from pydantic_ai.models.test import TestModel
+
+from pygentic_ai import AgentManager
+from pygentic_ai.engines import GuardrailsAgent, ReasoningAgent, ReasoningAgentDeps
+from pygentic_ai.prompts import get_output_constraints, get_output_rules, prompt_registry
+from pygentic_ai.workflows import WorkflowState
+from pygentic_ai.workflows.agent_workflow import user_assistant_graph
+from pygentic_ai.workflows.nodes import StartNode
+
+
+@pytest.mark.parametrize(
+    ("message", "valid"),
+    [
+        ("The meeting starts at 10:30, see https://example.com.", True),
+        ("Glad to help :)", False),
+        ("Glad to help 😀", False),
+        ("Answer: the capital is Paris.", False),
+        ("word " * 400, False),
+    ],
+)
+def test_validate(message: str, valid: bool) -> None:
+    """Test the local guardrail validators."""
+    guardrails = GuardrailsAgent(api_key="sk-test")
+    assert (guardrails.validate(message) == []) is valid
+
+
+def test_inline_constraints_in_instructions() -> None:
+    """Test that inline guardrails add the constraints to the agent instructions."""
+    agent = ReasoningAgent(api_key="sk-test", inline_guardrails=True, soft_word_limit=120)
+
+    with agent.agent.override(model=TestModel(call_tools=[])):
+        result = agent.agent.run_sync("Hello", deps=ReasoningAgentDeps(language="polish"))
+
+    instructions = result.all_messages()[0].instructions
+    assert "around 120 words" in instructions
+    assert "written in polish language" in instructions
+
+
+def test_inline_constraints_share_the_guardrails_rules() -> None:
+    """Test that the agent constraints and the guardrails instructions render the same rules."""
+    rules = get_output_rules(120)
+
+    assert rules in get_output_constraints("polish", 120)
+    assert rules in prompt_registry.text("guardrails", language="polish", output_rules=rules)
+
+
+async def test_valid_answer_skips_guardrails_model(test_manager: AgentManager, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a valid inline-guarded answer is returned without reformatting."""
+    reformat_calls: list[str] = []
+
+    async def reformat(message: str, *args: Any, **kwargs: Any) -> str:
+        reformat_calls.append(message)
+        return "reformatted"
+
+    agent = test_manager.get("agent")
+    monkeypatch.setattr(agent, "inline_guardrails", True)
+    monkeypatch.setattr(test_manager.get("guardrails"), "reformat", reformat)
+    deps = test_manager.to_deps(message="Hello", chat_history=[])
+
+    with agent.agent.override(model=TestModel(custom_output_text="Hello, how can I help?")):
+        result = await user_assistant_graph.run(StartNode(), state=WorkflowState(), deps=deps)
+    assert result.output == "Hello, how can I help?"
+    assert reformat_calls == []
+
+    with agent.agent.override(model=TestModel(custom_output_text="Answer: hello :)")):
+        result = await user_assistant_graph.run(StartNode(), state=WorkflowState(), deps=deps)
+    assert result.output == "reformatted"
+    assert reformat_calls == ["Answer: hello :)"]
+
+
+async def test_translations_are_always_reformatted(test_manager: AgentManager, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that translator output goes through the guardrails model even with inline guardrails."""
+    reformat_calls: list[str] = []
+
+    async def reformat(message: str, *args: Any, **kwargs: Any) -> str:
+        reformat_calls.append(message)
+        return "reformatted"
+
+    monkeypatch.setattr(test_manager.get("agent"), "inline_guardrails", True)
+    monkeypatch.setattr(test_manager.get("guardrails"), "reformat", reformat)
+    router_model = TestModel(custom_output_args={"route": 3, "reasoning": "Translation"})
+    deps = test_manager.to_deps(message="Translate 'thank you' to Polish", chat_history=[])
+
+    with (
+        test_manager.get("router").agent.override(model=router_model),
+        test_manager.get("translator").agent.override(model=TestModel(custom_output_text="Dziękuję")),
+    ):
+        result = await user_assistant_graph.run(StartNode(), state=WorkflowState(), deps=deps)
+
+    assert result.output == "reformatted"
+    assert reformat_calls == ["Dziękuję"]
@@ -0,0 +1,102 @@
+"""Tests for hot reload of agent configuration."""
+
+import asyncio
+
+import pytest
+
+from pygentic_ai import AgentManager
+
+
+class ClosableAgent:
+    def __init__(self, model: str = "small") -> None:
+        self.model = model
+        self.initialized = False
+        self.closed = False
+
+    async def initialize(self) -> None:
+        self.initialized = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FailingAgent(ClosableAgent):
+    async def initialize(self) -> None:
+        raise ConnectionError("MCP server unavailable")
+
+
+async def test_reload_swaps_changed_agents_only() -> None:
+    """Test that reload replaces changed agents and reuses unchanged ones."""
+    manager = AgentManager()
+    manager.register("agent", ClosableAgent, model="small")
+    manager.register("router", ClosableAgent, model="tiny")
+    await manager.initialize()
+    old_agent = manager.get("agent")
+    router = manager.get("router")
+
+    created = await manager.reload({"agent": (ClosableAgent, {"model": "large"})}, wait=True)
+
+    assert created == ["agent"]
+    assert manager.version == 1
+    assert manager.get("agent").model == "large"
+    assert manager.get("agent").initialized
+    assert manager.get("router") is router
+    assert old_agent.closed
+    assert not router.closed
+
+
+async def test_reload_drains_in_flight_sessions() -> None:
+    """Test that in-flight sessions keep their agents until they finish."""
+    manager = AgentManager()
+    manager.register("agent", ClosableAgent)
+    await manager.initialize()
+
+    async with manager.session(message="Hello") as deps:
+        old_agent = deps["agent"]
+        await manager.reload({"agent": (ClosableAgent, {"model": "large"})}, remove=["missing"])
+        await asyncio.sleep(0)
+
+        assert deps["message"] == "Hello"
+        assert manager.to_deps()["agent"] is not old_agent
+        assert not old_agent.closed
+
+    await asyncio.sleep(0.01)
+    assert old_agent.closed
+    assert manager.in_flight == 0
+
+
+async def test_to_deps_does_not_pin_agents() -> None:
+    """Test that ``to_deps`` returns a plain dict that does not hold back a reload."""
+    manager = AgentManager()
+    manager.register("agent", ClosableAgent)
+    await manager.initialize()
+
+    deps = manager.to_deps(message="Hello")
+    assert type(deps) is dict
+    assert manager.in_flight == 0
+
+    await manager.reload({"agent": (ClosableAgent, {"model": "large"})}, wait=True, drain_timeout=1)
+    assert deps["agent"].closed
+
+
+async def test_failed_reload_closes_created_agents() -> None:
+    """Test that agents created by a failing reload are closed and the current ones kept."""
+    manager = AgentManager()
+    manager.register("agent", ClosableAgent)
+    await manager.initialize()
+    current = manager.get("agent")
+    created: list[ClosableAgent] = []
+
+    def tracked(model: str) -> ClosableAgent:
+        agent = ClosableAgent(model)
+        created.append(agent)
+        return agent
+
+    with pytest.raises(ConnectionError):
+        await manager.reload({"agent": (tracked, {"model": "large"}), "search": (FailingAgent, {})})
+
+    assert manager.get("agent") is current
+    assert manager.version == 0
+    assert created[0].initialized
+    assert created[0].closed
+    assert not current.closed
@@ -0,0 +1,159 @@
+"""Tests for shared MCP server connections."""
+
+import asyncio
+from typing import Any
+
+from mcp import types as mcp_types
+
+from pygentic_ai.engines import ReasoningAgent
+from pygentic_ai.mcp import CatalogMCPServer, MCPConnectionPool, MCPToolCatalog
+
+
+class FakeMCPServer:
+    """Stand-in for an MCP server counting opened sessions and tool listings."""
+
+    def __init__(self, url: str, catalog: MCPToolCatalog) -> None:
+        self.url = url
+        self.catalog = catalog
+        self.sessions = 0
+        self.fail_listings = 0
+        self.listings = 0
+        self.fail_pings = 0
+        self.pings = 0
+
+    async def list_tools(self) -> list[mcp_types.Tool]:
+        return await self.catalog.list_tools(self.url, self.fetch_tools)
+
+    async def fetch_tools(self) -> list[mcp_types.Tool]:
+        self.listings += 1
+        if self.fail_listings:
+            self.fail_listings -= 1
+            raise ConnectionError("connection dropped")
+        await asyncio.sleep(0.01)
+        return [mcp_types.Tool(name=f"tool_{self.listings}", inputSchema={"type": "object"})]
+
+    async def ping(self) -> None:
+        self.pings += 1
+        if self.fail_pings:
+            self.fail_pings -= 1
+            raise ConnectionError("connection dropped")
+
+    async def __aenter__(self) -> "FakeMCPServer":
+        self.sessions += 1
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+
+def test_agents_share_pooled_server() -> None:
+    """Test that agents pointing at the same URL share one server."""
+    pool = MCPConnectionPool(server_factory=FakeMCPServer)  # type: ignore[arg-type]
+    url = "http://localhost:8000/mcp"
+
+    first = ReasoningAgent(api_key="sk-test", mcp_urls=[url], mcp_connection_pool=pool)
+    second = ReasoningAgent(api_key="sk-test", mcp_urls=[url, "invalid-url"], mcp_connection_pool=pool)
+
+    assert first.mcp_servers == second.mcp_servers
+    assert first.mcp_servers[0] is second.mcp_servers[0]
+    assert url in pool
+
+
+async def test_pool_keeps_alive_and_reconnects() -> None:
+    """Test that the keeper checks the session and reconnects after a failure."""
+    pool = MCPConnectionPool(
+        server_factory=FakeMCPServer,  # type: ignore[arg-type]
+        keepalive_interval=0.01,
+        initial_backoff=0.01,
+    )
+    url = "http://localhost:8000/mcp"
+    server: Any = pool.get(url).wrapped
+    server.fail_pings = 1
+
+    assert await pool.connect(url)
+    await asyncio.sleep(0.1)
+    await pool.close()
+
+    stats = pool.stats()[0]
+    assert server.pings > 1
+    assert server.listings == 0
+    assert server.sessions == 2
+    assert stats.failures == 1
+    assert not stats.connected
+
+
+async def test_tool_list_changes_mark_the_listing_stale() -> None:
+    """Test that a list-changed notification makes the next access refresh the listing."""
+    catalog = MCPToolCatalog()
+    url = "http://localhost:8000/mcp"
+    server = CatalogMCPServer(url, catalog)
+    catalog.store(url, [mcp_types.Tool(name="old", inputSchema={"type": "object"})])
+
+    await server._handle_notification(
+        mcp_types.ServerNotification(mcp_types.ToolListChangedNotification(method="notifications/tools/list_changed"))
+    )
+    fetched = asyncio.Event()
+
+    async def fetch() -> list[mcp_types.Tool]:
+        fetched.set()
+        return [mcp_types.Tool(name="new", inputSchema={"type": "object"})]
+
+    assert [tool.name for tool in await catalog.list_tools(url, fetch)] == ["old"]
+    await asyncio.wait_for(fetched.wait(), 1)
+    assert catalog.stale_hits == 1
+    assert [tool.name for tool in await catalog.list_tools(url, fetch)] == ["new"]
+
+
+async def test_pool_resets_inherited_connections() -> None:
+    """Test that a reset pool (as in a forked worker) reconnects with fresh servers."""
+    pool = MCPConnectionPool(server_factory=FakeMCPServer)  # type: ignore[arg-type]
+    url = "http://localhost:8000/mcp"
+    toolset = pool.get(url)
+    inherited: Any = toolset.wrapped
+    assert await pool.connect(url)
+    inherited_keeper = toolset.pool_entry.keeper
+    assert inherited_keeper is not None
+
+    pool.reset()
+    server: Any = toolset.wrapped
+
+    assert server is not inherited
+    assert toolset.pool_entry.keeper is None
+    assert not toolset.pool_entry.connected.is_set()
+    assert await pool.connect(url)
+    assert server.sessions == 1
+    await pool.close()
+    # A forked child never runs the parent's keeper; here it still exists and is stopped by hand
+    inherited_keeper.cancel()
+
+
+async def test_pool_discovers_servers_concurrently() -> None:
+    """Test that discovery fetches each server once and serves listings from the catalog."""
+    pool = MCPConnectionPool(server_factory=FakeMCPServer)  # type: ignore[arg-type]
+    urls = ["http://a.local/mcp", "http://b.local/mcp"]
+
+    await pool.discover([*urls, *urls])
+    tools = await pool.get(urls[0]).list_tools()
+
+    assert [tool.name for tool in tools] == ["tool_1"]
+    assert all(url in pool.catalog for url in urls)
+    assert pool.catalog.misses == 2
+    assert pool.catalog.hits == 1
+
+
+async def test_catalog_serves_stale_while_revalidating() -> None:
+    """Test that expired listings are served while refreshed in the background."""
+    catalog = MCPToolCatalog(ttl=0.0, max_stale=None)
+    server = FakeMCPServer("http://a.local/mcp", catalog)
+
+    first = await server.list_tools()
+    stale = await server.list_tools()
+    await asyncio.sleep(0.05)
+    refreshed = await server.list_tools()
+
+    assert stale is first
+    assert refreshed[0].name == "tool_2"
+    assert catalog.stale_hits == 2
+
+    catalog.invalidate(server.url)
+    assert server.url not in catalog
@@ -0,0 +1,52 @@
+"""Tests for per-call agent overrides."""
+
+import asyncio
+
+from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.models.test import TestModel
+
+from pygentic_ai import UsageLedger
+from pygentic_ai.engines import GuardrailsAgent, GuardrailsDeps, ReasoningAgent
+
+
+async def echo_instructions(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+    await asyncio.sleep(0.01)
+    request = messages[-1]
+    assert isinstance(request, ModelRequest)
+    return ModelResponse(parts=[TextPart(request.instructions or "")])
+
+
+async def test_concurrent_languages_on_one_agent() -> None:
+    """Test that concurrent calls with different languages share one agent."""
+    agent = ReasoningAgent(api_key="sk-test", language="english")
+
+    with agent.agent.override(model=FunctionModel(echo_instructions)):
+        polish, german, default = await asyncio.gather(
+            agent.generate_response("Cześć", language="polish"),
+            agent.generate_response("Hallo", language="german"),
+            agent.generate_response("Hello"),
+        )
+
+    assert "respond in polish language" in polish.output
+    assert "respond in german language" in german.output
+    assert "respond in english language" in default.output
+    assert agent.language == "english"
+
+
+async def test_model_and_deps_overrides() -> None:
+    """Test per-call model and deps overrides."""
+    ledger = UsageLedger()
+    guardrails = GuardrailsAgent(api_key="sk-test", ledger=ledger)
+
+    output = await guardrails.reformat(
+        "A long answer",
+        model=FunctionModel(echo_instructions),
+        deps=GuardrailsDeps(language="spanish", soft_word_limit=40),
+    )
+    await guardrails.reformat("Another answer", model=TestModel())
+
+    assert "returned in spanish language" in output
+    assert "around 40 words" in output
+    assert "test:test" in ledger.breakdown("model")
+    assert "openai:gpt-4o" not in ledger.breakdown("model")
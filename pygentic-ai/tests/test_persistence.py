@@ -0,0 +1,52 @@
+"""Tests for checkpointing and resuming workflow runs."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pygentic_ai import AgentManager
+from pygentic_ai.workflows import CheckpointStore, FileCheckpointStore, SQLiteCheckpointStore, run_checkpointed
+from pygentic_ai.workflows.agent_workflow import user_assistant_graph
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> CheckpointStore:
+    if request.param == "sqlite":
+        return SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+    return FileCheckpointStore(tmp_path / "checkpoints")
+
+
+async def test_resume_skips_completed_steps(
+    test_manager: AgentManager, store: CheckpointStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a resumed run continues after the last completed node."""
+    agent = test_manager.get("agent")
+    guardrails = test_manager.get("guardrails")
+    generate_response = agent.generate_response
+    reformat = guardrails.reformat
+    calls = {"generate": 0}
+
+    async def counted_generate(*args: Any, **kwargs: Any) -> Any:
+        calls["generate"] += 1
+        return await generate_response(*args, **kwargs)
+
+    async def failing_reformat(*args: Any, **kwargs: Any) -> str:
+        raise RuntimeError("worker died")
+
+    monkeypatch.setattr(agent, "generate_response", counted_generate)
+    monkeypatch.setattr(guardrails, "reformat", failing_reformat)
+    deps = test_manager.to_deps(message="Hello", chat_history=[])
+
+    with pytest.raises(RuntimeError):
+        await run_checkpointed(user_assistant_graph, store, deps, run_id="run-1")
+    assert store.pending_runs() == ["run-1"]
+
+    monkeypatch.setattr(guardrails, "reformat", reformat)
+    output = await run_checkpointed(user_assistant_graph, store, deps, run_id="run-1")
+
+    assert output
+    assert calls["generate"] == 1
+    assert store.pending_runs() == []
+    assert await run_checkpointed(user_assistant_graph, store, deps, run_id="run-1") == output
+    assert calls["generate"] == 1
@@ -0,0 +1,138 @@
+"""Tests for the framework overhead profiler."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart, ToolReturnPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.models.test import TestModel
+
+from pygentic_ai import AgentManager, Profiler
+from pygentic_ai.context import current_scope
+from pygentic_ai.engines import GenericRouter, GuardrailsAgent, ReasoningAgent, SimpleTranslatorWorker
+from pygentic_ai.profiling import ProfiledModel, RunProfile, profiled_tool
+from pygentic_ai.workflows import run_workflow
+
+
+def lookup_order(order_id: str) -> str:
+    """Look up the status of an order."""
+    time.sleep(0.03)
+    return f"Order {order_id} has shipped."
+
+
+async def _answer(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+    await asyncio.sleep(0.05)
+    if not any(isinstance(part, ToolReturnPart) for message in messages for part in message.parts):
+        return ModelResponse(parts=[ToolCallPart("lookup_order", {"order_id": "42"})])
+    return ModelResponse(parts=[TextPart("Your order has shipped.")])
+
+
+def _manager() -> AgentManager:
+    manager = AgentManager()
+    manager.register_instance("router", GenericRouter(api_key="sk-test"))
+    manager.register_instance("agent", ReasoningAgent(api_key="sk-test", tool_list=[lookup_order]))
+    manager.register_instance("guardrails", GuardrailsAgent(api_key="sk-test"))
+    manager.register_instance("translator", SimpleTranslatorWorker(api_key="sk-test"))
+    manager.get("router").agent.model = TestModel(custom_output_args={"route": 1, "reasoning": "Order status"})
+    manager.get("agent").agent.model = FunctionModel(_answer)
+    manager.get("guardrails").agent.model = TestModel(custom_output_text="Your order has shipped!")
+    return manager
+
+
+async def test_time_is_split_by_node_and_agent() -> None:
+    """Test that model, tool and framework time are reported per node and per agent."""
+    profiler = Profiler()
+    with profiler.run() as profile:
+        output = await run_workflow(_manager().to_deps(message="Where is order 42?", chat_history=[]))
+
+    assert output == "Your order has shipped!"
+    assert profile is not None
+    report = profiler.report()
+    assert report["profiled_runs"] == 1
+    assert set(report["nodes"]) == {"StartNode", "ClassifyNode", "GenerateNode", "GuardrailsNode"}
+
+    generation = report["agents"]["ReasoningAgent"]
+    assert generation["model"] >= 0.1
+    assert generation["tools"] >= 0.03
+    assert generation["framework"] == generation["wall"] - generation["model"] - generation["tools"]
+    assert report["nodes"]["GenerateNode"]["model"] == generation["model"]
+    assert report["nodes"]["ClassifyNode"]["tools"] == 0
+
+    workflow = report["workflow"]
+    assert workflow["wall"] >= sum(node["wall"] for node in report["nodes"].values())
+    assert workflow["model"] == sum(agent["model"] for agent in report["agents"].values())
+    assert "GenerateNode" in profiler.summary()
+
+
+async def test_unsampled_runs_are_not_profiled() -> None:
+    """Test that runs outside the sample are counted but not timed."""
+    profiler = Profiler(sample_rate=0.0)
+    with profiler.run() as profile:
+        assert profile is None
+        assert current_scope().profile is None
+        await run_workflow(_manager().to_deps(message="Where is order 42?", chat_history=[]))
+
+    report = profiler.report()
+    assert report["runs"] == 1
+    assert report["profiled_runs"] == 0
+    assert report["agents"] == {}
+
+
+async def _stream_answer(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+    for chunk in ("Your order ", "has shipped."):
+        await asyncio.sleep(0.03)
+        yield chunk
+
+
+async def test_streamed_responses_count_as_model_time() -> None:
+    """Test that a streamed model response is timed until the stream is closed."""
+    profile = RunProfile()
+    agent = Agent(ProfiledModel(FunctionModel(stream_function=_stream_answer), profile))
+
+    async with agent.run_stream("Where is order 42?") as result:
+        assert await result.get_output() == "Your order has shipped."
+
+    assert profile.model_time >= 0.06
+
+
+async def test_tools_skip_the_scope_outside_profiled_runs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that profiled tools call the tool directly while no run is profiled."""
+
+    async def lookup_order_async(order_id: str) -> str:
+        return f"Order {order_id} has shipped."
+
+    tools = [profiled_tool(lookup_order), profiled_tool(lookup_order_async)]
+    lookups: list[object] = []
+    monkeypatch.setattr("pygentic_ai.profiling.current_scope", lambda: lookups.append(None) or current_scope())
+
+    assert tools[0]("42") == await tools[1]("42") == "Order 42 has shipped."
+    assert lookups == []
+
+    profiler = Profiler()
+    with profiler.run() as profile:
+        tools[0]("42")
+        await tools[1]("42")
+    assert len(lookups) == 2
+    assert profile is not None
+    assert profile.tool_time >= 0.03
+
+
+def _blocking_call() -> None:
+    time.sleep(0.2)
+
+
+async def test_blocking_calls_are_reported() -> None:
+    """Test that a sync call blocking the event loop is reported with its stack and lag."""
+    async with Profiler(lag_interval=0.01, block_threshold=0.05) as profiler:
+        await asyncio.sleep(0.03)
+        _blocking_call()
+        await asyncio.sleep(0.03)
+
+    report = profiler.report()
+    assert report["loop_lag"]["max"] >= 0.15
+    [blocking] = report["blocking_calls"]
+    assert blocking["duration"] >= 0.15
+    assert "_blocking_call" in blocking["stack"][-1]
@@ -0,0 +1,85 @@
+"""Tests for the prompt template registry."""
+
+from types import SimpleNamespace
+
+import pytest
+from pydantic_ai import capture_run_messages
+from pydantic_ai.models.test import TestModel
+
+from pygentic_ai.engines import SimpleTranslatorWorker
+from pygentic_ai.prompts import PromptRegistry, estimate_tokens, get_guardrails_instructions, prompt_registry
+
+
+def test_render_is_memoized_per_parameters() -> None:
+    """Test that each parameter set is rendered once and token counts are computed once."""
+    counted: list[str] = []
+
+    def counter(text: str) -> int:
+        counted.append(text)
+        return len(text.split())
+
+    registry = PromptRegistry(token_counter=counter)
+    registry.register("greeting", "Say hello in {language}.")
+
+    first = registry.render("greeting", language="polish")
+    assert registry.render("greeting", language="polish") is first
+    assert registry.render("greeting", language="german").text == "Say hello in german."
+    assert first.tokens == 4
+    assert first.tokens == 4
+    assert counted == ["Say hello in polish."]
+    assert registry.stats.hits == 1
+    assert registry.stats.misses == 2
+
+
+def test_versions_and_hashes() -> None:
+    """Test that a new version becomes active, old versions stay available and hashes change."""
+    registry = PromptRegistry(token_counter=estimate_tokens)
+    v1 = registry.register("summary", "Summarize in {words} words.", words=50)
+    fingerprint = registry.fingerprint()
+    v2 = registry.register("summary", "Summarize briefly, in at most {words} words.", version="2", words=50)
+
+    assert registry.text("summary") == "Summarize briefly, in at most 50 words."
+    assert registry.render("summary", version="1", words=10).text == "Summarize in 10 words."
+    assert v1.version_hash != v2.version_hash
+    assert registry.version_hash("summary") == v2.version_hash
+    assert registry.version_hashes() == {"summary": v2.version_hash}
+    assert registry.fingerprint() != fingerprint
+    assert v2.fields == {"words"}
+    with pytest.raises(KeyError):
+        registry.get("summary", version="3")
+
+
+def test_lru_eviction() -> None:
+    """Test that the rendered prompt cache stays bounded."""
+    registry = PromptRegistry(token_counter=estimate_tokens, max_entries=2)
+    registry.register("echo", "{value}")
+    for value in range(3):
+        registry.render("echo", value=value)
+
+    assert registry.stats.evictions == 1
+    registry.render("echo", value=0)
+    assert registry.stats.misses == 4
+
+
+def test_builtin_prompts_use_registry() -> None:
+    """Test that the built-in instruction builders render through the shared registry."""
+    ctx = SimpleNamespace(deps=SimpleNamespace(language="polish", soft_word_limit=120))
+    hits = prompt_registry.stats.hits
+
+    text = get_guardrails_instructions(ctx)
+    assert text is get_guardrails_instructions(ctx)
+    assert "**The output MUST be returned in polish language.**" in text
+    assert "around 120 words" in text
+    assert prompt_registry.stats.hits > hits
+    assert {"guardrails", "translator", "router", "agent.general"} <= set(prompt_registry.version_hashes())
+
+
+async def test_translator_uses_single_rendered_instruction() -> None:
+    """Test that the translator sends one instruction block with the target language."""
+    translator = SimpleTranslatorWorker(api_key="sk-test")
+    with translator.agent.override(model=TestModel(call_tools=[])), capture_run_messages() as messages:
+        await translator.translate("Hello", "german")
+
+    instructions = messages[0].instructions
+    assert instructions is not None
+    assert instructions.count("Please translate the following text into german language.") == 1
@@ -0,0 +1,131 @@
+"""Tests for the priority lane scheduler."""
+
+import asyncio
+
+import pytest
+from pydantic_ai.models.test import TestModel
+
+from pygentic_ai import Lane, LaneScheduler
+from pygentic_ai.context import execution_scope
+from pygentic_ai.engines import ReasoningAgent
+
+
+async def _hold(scheduler: LaneScheduler, lane: str, order: list[str], release: asyncio.Event) -> None:
+    async with scheduler.slot(lane):
+        order.append(lane)
+        await release.wait()
+
+
+async def test_interactive_jumps_queued_batch_work() -> None:
+    """Test that queued batch calls yield to interactive calls without interrupting running ones."""
+    scheduler = LaneScheduler(max_concurrency=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    running = asyncio.create_task(_hold(scheduler, "batch", order, release))
+    await asyncio.sleep(0)
+    queued = [asyncio.create_task(_hold(scheduler, "batch", order, release)) for _ in range(2)]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(_hold(scheduler, "interactive", order, release))
+    await asyncio.sleep(0)
+
+    assert order == ["batch"]
+    assert scheduler.stats()["batch"].queued == 2
+    release.set()
+    await asyncio.gather(running, interactive, *queued)
+
+    assert order == ["batch", "interactive", "batch", "batch"]
+    stats = scheduler.stats()
+    assert stats["batch"].completed == 3
+    assert stats["batch"].deferred == 2
+    assert stats["interactive"].running == 0
+
+
+async def test_weighted_share_between_lanes() -> None:
+    """Test that backlogged lanes share capacity in proportion to their weights."""
+    scheduler = LaneScheduler(lanes=[Lane("a", weight=3), Lane("b", weight=1)], max_concurrency=1, default_lane="a")
+    order: list[str] = []
+    release = asyncio.Event()
+
+    blocker = asyncio.create_task(_hold(scheduler, "a", [], release))
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(_hold(scheduler, lane, order, release)) for lane in ["a"] * 6 + ["b"] * 2]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(blocker, *tasks)
+
+    assert order[:4].count("a") == 3
+    assert order[:4].count("b") == 1
+
+
+async def test_lane_concurrency_limit() -> None:
+    """Test that a lane never runs more calls than its cap, leaving capacity to other lanes."""
+    scheduler = LaneScheduler(lanes=[Lane("interactive"), Lane("batch", max_concurrency=1)], max_concurrency=4)
+    release = asyncio.Event()
+
+    batch = [asyncio.create_task(_hold(scheduler, "batch", [], release)) for _ in range(3)]
+    interactive = asyncio.create_task(_hold(scheduler, "interactive", [], release))
+    await asyncio.sleep(0)
+
+    stats = scheduler.stats()
+    assert stats["batch"].running == 1
+    assert stats["batch"].queued == 2
+    assert stats["interactive"].running == 1
+    release.set()
+    await asyncio.gather(interactive, *batch)
+
+
+async def test_token_budget_delays_lane() -> None:
+    """Test that a lane over its token budget waits until the window frees up."""
+    scheduler = LaneScheduler(
+        lanes=[Lane("interactive"), Lane("batch", tokens_per_minute=6000)], token_window=0.05, max_concurrency=4
+    )
+    scheduler.record_tokens("batch", 10)
+
+    async with asyncio.timeout(1):
+        async with scheduler.slot("batch"):
+            pass
+    assert scheduler.stats()["batch"].max_wait > 0.02
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"tokens_per_minute": 0}, {"weight": 0.0}, {"max_concurrency": 0}],
+)
+def test_lane_rejects_invalid_limits(options: dict[str, float]) -> None:
+    """Test that lanes that could never run (or never wake up) are rejected."""
+    with pytest.raises(ValueError, match="bulk"):
+        Lane("bulk", **options)
+
+
+async def test_cancelled_waiter_leaves_queue() -> None:
+    """Test that a call cancelled while queued does not take a slot."""
+    scheduler = LaneScheduler(max_concurrency=1)
+    release = asyncio.Event()
+    running = asyncio.create_task(_hold(scheduler, "interactive", [], release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(_hold(scheduler, "batch", [], release), timeout=0.01)
+
+    assert scheduler.stats()["batch"].queued == 0
+    release.set()
+    await running
+    async with scheduler.slot("batch"):
+        assert scheduler.stats()["batch"].running == 1
+
+
+async def test_agent_calls_use_scope_lane() -> None:
+    """Test that agent calls run in the lane of the execution scope and charge its tokens."""
+    scheduler = LaneScheduler()
+    agent = ReasoningAgent(api_key="sk-test", scheduler=scheduler)
+
+    with agent.agent.override(model=TestModel(call_tools=[])):
+        await agent.generate_response("Hello")
+        with execution_scope(lane="batch"):
+            await agent.generate_response("Hello")
+
+    stats = scheduler.stats()
+    assert stats["interactive"].completed == 1
+    assert stats["batch"].completed == 1
+    assert stats["batch"].tokens > 0
@@ -0,0 +1,168 @@
+"""Tests for the workflow HTTP server."""
+
+import asyncio
+import json
+import signal
+import socket
+import struct
+import sys
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from pygentic_ai import AgentManager, Profiler
+from pygentic_ai.context import current_scope
+from pygentic_ai.server import WorkflowServer
+
+
+@pytest.fixture
+async def server(test_manager: AgentManager) -> AsyncIterator[tuple[WorkflowServer, int]]:
+    listener = socket.create_server(("127.0.0.1", 0))
+    workflow_server = WorkflowServer(test_manager)
+    task = asyncio.create_task(workflow_server.serve(listener, install_signal_handlers=False))
+    yield workflow_server, listener.getsockname()[1]
+    workflow_server.stop()
+    await task
+    listener.close()
+
+
+async def request(port: int, method: str, path: str, payload: Any = None) -> tuple[int, dict[str, Any]]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, response_body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(response_body)
+
+
+async def test_workflow_and_health(server: tuple[WorkflowServer, int]) -> None:
+    """Test that the server runs the workflow and reports worker health."""
+    workflow_server, port = server
+
+    status, payload = await request(port, "POST", "/workflow", {"message": "Hello", "language": "english"})
+    assert status == 200
+    assert payload["response"]
+
+    status, health = await request(port, "GET", "/healthz")
+    assert status == 200
+    assert health["status"] == "ok"
+    assert health["handled"] == 1
+
+
+async def test_invalid_requests(server: tuple[WorkflowServer, int]) -> None:
+    """Test that malformed requests are rejected."""
+    _, port = server
+
+    assert (await request(port, "POST", "/workflow", {"text": "Hello"}))[0] == 400
+    assert (await request(port, "GET", "/workflow"))[0] == 405
+    assert (await request(port, "GET", "/missing"))[0] == 404
+    assert (await request(port, "GET", "/profile"))[0] == 404
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"POST /workflow HTTP/1.1\r\nHost: test\r\nContent-Length: -5\r\n\r\n")
+    response = await reader.read()
+    writer.close()
+    assert response.startswith(b"HTTP/1.1 400")
+    assert b"Invalid Content-Length" in response
+
+
+async def test_profile_endpoint(test_manager: AgentManager) -> None:
+    """Test that a server with a profiler times its runs and reports them."""
+    listener = socket.create_server(("127.0.0.1", 0))
+    workflow_server = WorkflowServer(test_manager, profiler=Profiler(block_threshold=None))
+    task = asyncio.create_task(workflow_server.serve(listener, install_signal_handlers=False))
+    port = listener.getsockname()[1]
+
+    assert (await request(port, "POST", "/workflow", {"message": "Hello"}))[0] == 200
+    status, report = await request(port, "GET", "/profile")
+
+    workflow_server.stop()
+    await task
+    listener.close()
+    assert status == 200
+    assert report["profiled_runs"] == 1
+    assert {"ClassifyNode", "GenerateNode", "GuardrailsNode"} <= set(report["nodes"])
+    assert "GenericRouter" in report["agents"]
+
+
+async def test_half_close_and_reset_connections(test_manager: AgentManager) -> None:
+    """Test that half-closed clients get their response and reset connections cancel the run."""
+    scopes: list[tuple[str | None, str | None]] = []
+    cancelled = asyncio.Event()
+
+    async def answer(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        scopes.append((current_scope().lane, current_scope().run_id))
+        try:
+            await asyncio.sleep(0.2)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return ModelResponse(parts=[TextPart("Answer")])
+
+    with test_manager.get("agent").agent.override(model=FunctionModel(answer)):
+        listener = socket.create_server(("127.0.0.1", 0))
+        workflow_server = WorkflowServer(test_manager, lane="batch")
+        task = asyncio.create_task(workflow_server.serve(listener, install_signal_handlers=False))
+        port = listener.getsockname()[1]
+
+        body = json.dumps({"message": "Hello", "lane": "interactive", "run_id": "chosen"}).encode()
+        head = f"POST /workflow HTTP/1.0\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(head + body)
+        writer.write_eof()
+        response = await reader.read()
+        writer.close()
+
+        sock = socket.create_connection(("127.0.0.1", port))
+        sock.sendall(head + body)
+        await asyncio.sleep(0.05)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        sock.close()
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        workflow_server.stop()
+        await task
+        listener.close()
+
+    assert response.startswith(b"HTTP/1.1 200")
+    assert scopes[0][0] == "batch"
+    assert scopes[0][1] != "chosen"
+
+
+async def test_prefork_restart_and_shutdown() -> None:
+    """Test that workers are forked from the parent, replaced on SIGHUP and stopped on SIGTERM."""
+    with socket.create_server(("127.0.0.1", 0)) as probe:
+        port = probe.getsockname()[1]
+    code = (
+        "from pygentic_ai import AgentManager\n"
+        "from pygentic_ai.server import WorkflowServer\n"
+        f"WorkflowServer(AgentManager, port={port}, workers=2, drain_timeout=1).serve_forever()\n"
+    )
+    process = await asyncio.create_subprocess_exec(sys.executable, "-c", code)
+
+    async def worker_pid() -> int:
+        for _ in range(100):
+            try:
+                return (await request(port, "GET", "/healthz"))[1]["pid"]
+            except OSError:
+                await asyncio.sleep(0.05)
+        raise AssertionError("server did not start")
+
+    try:
+        first = await worker_pid()
+        assert first != process.pid
+
+        process.send_signal(signal.SIGHUP)
+        await asyncio.sleep(1.5)
+        assert await worker_pid() != first
+
+        process.send_signal(signal.SIGTERM)
+        assert await asyncio.wait_for(process.wait(), 10) == 0
+    finally:
+        if process.returncode is None:
+            process.kill()
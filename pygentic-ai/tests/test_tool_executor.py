@@ -0,0 +1,100 @@
+"""Tests for the tool execution layer."""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+
+import pytest
+from pydantic_ai import ModelRetry, RunContext
+from pydantic_ai.models.test import TestModel
+
+from pygentic_ai.engines import ReasoningAgent
+from pygentic_ai.tools import ToolExecutor, ToolPolicy
+
+
+def slow_lookup(key: str) -> str:
+    """Look up a value by key."""
+    time.sleep(0.05)
+    return f"{key}@{threading.current_thread().name}"
+
+
+def count_primes(limit: int) -> tuple[int, int]:
+    """Count the primes below a limit."""
+    primes = sum(all(n % d for d in range(2, int(n**0.5) + 1)) for n in range(2, limit))
+    return primes, os.getpid()
+
+
+def greet_user(ctx: RunContext[None], name: str) -> str:
+    """Greet a user."""
+    return f"Hello {name}"
+
+
+async def test_sync_tools_run_off_the_event_loop() -> None:
+    """Test that concurrent sync tool calls run in parallel worker threads."""
+    executor = ToolExecutor(max_workers=4)
+    lookup = executor.wrap(slow_lookup)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(lookup(f"k{i}") for i in range(4)))
+    elapsed = time.perf_counter() - started
+
+    assert lookup.__name__ == "slow_lookup"
+    assert all("pygentic-tool" in result for result in results)
+    assert elapsed < 0.15
+    executor.shutdown()
+
+
+async def test_tool_policy_timeout_and_concurrency() -> None:
+    """Test per-tool timeouts and concurrency caps."""
+    executor = ToolExecutor(max_workers=4)
+    executor.set_policy(slow_lookup, ToolPolicy(max_concurrency=1))
+    lookup = executor.wrap(slow_lookup)
+
+    started = time.perf_counter()
+    await asyncio.gather(lookup("a"), lookup("b"))
+    assert time.perf_counter() - started >= 0.1
+
+    executor.set_policy("slow_lookup", ToolPolicy(timeout=0.01))
+    with pytest.raises(ModelRetry):
+        await lookup("c")
+    executor.shutdown()
+
+
+async def test_agent_uses_wrapped_tools() -> None:
+    """Test that wrapped tools keep their schema and are called by the agent."""
+    executor = ToolExecutor()
+    agent = ReasoningAgent(api_key="sk-test", tool_list=[slow_lookup], tool_executor=executor)
+
+    with agent.agent.override(model=TestModel()):
+        result = await agent.generate_response("Look up a key")
+
+    assert "slow_lookup" in result.output
+    assert "pygentic-tool" in result.output
+    executor.shutdown()
+
+
+async def test_process_pool_runs_module_level_tools() -> None:
+    """Test that process-pool tools run in worker processes and unpicklable tools are rejected."""
+    executor = ToolExecutor(max_process_workers=1)
+    executor.set_policy(count_primes, ToolPolicy(use_processes=True))
+    primes = executor.wrap(count_primes)
+
+    count, pid = await primes(100)
+    assert count == 25
+    assert pid != os.getpid()
+
+    @functools.cache
+    def cached_primes(limit: int) -> int:
+        return count_primes(limit)[0]
+
+    executor.set_policy("cached_primes", ToolPolicy(use_processes=True))
+    with pytest.raises(ValueError, match="cannot be pickled"):
+        executor.wrap(cached_primes)
+    with pytest.raises(ValueError, match="RunContext"):
+        executor.set_policy(greet_user, ToolPolicy(use_processes=True))
+    decorated = functools.wraps(count_primes)(lambda limit: count_primes(limit))
+    with pytest.raises(ValueError, match="cannot be pickled"):
+        executor.wrap(decorated)
+    executor.shutdown()
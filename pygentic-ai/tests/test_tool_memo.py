@@ -0,0 +1,69 @@
+"""Tests for tool result memoization."""
+
+from pygentic_ai import AgentMode
+from pygentic_ai.context import execution_scope
+from pygentic_ai.tools import MemoPolicy, MemoScope, ToolManager, ToolMemoCache, Toolpacks
+
+calls: list[str] = []
+
+
+def lookup_customer(customer_id: str, include_orders: bool = False) -> str:
+    """Look up a customer record."""
+    calls.append(customer_id)
+    return f"customer {customer_id} (orders: {include_orders})"
+
+
+class CustomerToolManager(ToolManager):
+    toolpacks = {**ToolManager.toolpacks, Toolpacks.GENERAL: [lookup_customer]}
+
+
+def test_memoized_tool_returns_cached_result() -> None:
+    """Test that calls with equivalent arguments hit the cache."""
+    calls.clear()
+    manager = CustomerToolManager()
+    manager.memoize(lookup_customer, MemoPolicy(ttl=60))
+
+    tool = manager.get_toolpack(AgentMode.GENERAL)[0]
+    assert tool.__name__ == "lookup_customer"
+
+    assert tool("42") == tool(customer_id="42", include_orders=False)
+    tool("43")
+
+    stats = manager.memo_stats()["lookup_customer"]
+    assert calls == ["42", "43"]
+    assert stats.hits == 1
+    assert stats.misses == 2
+
+
+def test_run_scoped_memoization() -> None:
+    """Test that run scoped results are not shared between runs."""
+    calls.clear()
+    manager = CustomerToolManager()
+    manager.memoize("lookup_customer", MemoPolicy(scope=MemoScope.RUN))
+    tool = manager.get_toolpack(AgentMode.GENERAL)[0]
+
+    with execution_scope(run_id="run-1"):
+        tool("42")
+        tool("42")
+    with execution_scope(run_id="run-2"):
+        tool("42")
+    tool("42")
+
+    stats = manager.memo_stats()["lookup_customer"]
+    assert calls == ["42", "42", "42"]
+    assert stats.hits == 1
+    assert stats.bypasses == 1
+
+
+def test_memo_cache_is_bounded() -> None:
+    """Test that the least recently used results are evicted."""
+    calls.clear()
+    cache = ToolMemoCache(max_entries=2)
+    tool = cache.memoize(lookup_customer, MemoPolicy(ttl=None))
+
+    for customer_id in ("1", "2", "3", "1"):
+        tool(customer_id)
+
+    assert len(cache) == 2
+    assert calls == ["1", "2", "3", "1"]
+    assert cache.stats("lookup_customer").evictions == 2
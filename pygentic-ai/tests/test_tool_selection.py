@@ -0,0 +1,82 @@
+"""Tests for query-aware tool selection."""
+
+from pydantic_ai.models.test import TestModel
+from pydantic_ai.tools import ToolDefinition
+
+from pygentic_ai.engines import ReasoningAgent
+from pygentic_ai.tools import DATEUTILS_TOOLS, ToolSelector
+from pygentic_ai.tools.selection import tokenize
+
+
+def list_invoices(customer_id: str) -> str:
+    """List unpaid invoices of a customer."""
+    return "none"
+
+
+def send_email(address: str, body: str) -> str:
+    """Send an email message to an address."""
+    return "sent"
+
+
+def tool_def(name: str, description: str) -> ToolDefinition:
+    return ToolDefinition(name=name, description=description)
+
+
+def test_tokenize_splits_identifiers() -> None:
+    """Test that identifiers are split into terms."""
+    assert tokenize("getWeekday_from_date v2") == ["get", "weekday", "from", "date", "v", "2"]
+
+
+def test_selector_ranks_relevant_tools() -> None:
+    """Test that the best matching tools are kept in their original order."""
+    tools = [
+        tool_def("get_weather", "Get the weather forecast for a city"),
+        tool_def("list_invoices", "List unpaid invoices of a customer"),
+        tool_def("send_email", "Send an email message"),
+        tool_def("get_today_date", "Get today's date"),
+    ]
+    selector = ToolSelector(top_k=2, always_include=["get_today_date"])
+
+    selected = selector.select("Which invoices are unpaid?", tools)
+
+    assert [tool.name for tool in selected] == ["list_invoices", "get_today_date"]
+    assert selector.evaluate("email the customer", relevant={"send_email"}) == 1.0
+    assert selector.evaluate("what is the forecast", relevant={"get_weather", "send_email"}) == 0.5
+    assert selector.stats.recall == 0.75
+
+
+def test_selector_fills_unmatched_slots() -> None:
+    """Test that too few matches are topped up and a query matching nothing keeps every tool."""
+    tools = [
+        tool_def("get_weather", "Get the weather forecast for a city"),
+        tool_def("list_invoices", "List unpaid invoices of a customer"),
+        tool_def("send_email", "Send an email message"),
+        tool_def("get_today_date", "Get today's date"),
+    ]
+    selector = ToolSelector(top_k=3)
+
+    assert [tool.name for tool in selector.select("Which invoices are unpaid?", tools)] == [
+        "get_weather",
+        "list_invoices",
+        "send_email",
+    ]
+    assert selector.select("Jaka będzie jutro pogoda w Krakowie?", tools) == tools
+
+
+async def test_agent_passes_selected_tools_only() -> None:
+    """Test that the agent only exposes selected tools to the model."""
+    selector = ToolSelector(top_k=1)
+    agent = ReasoningAgent(
+        api_key="sk-test",
+        tool_list=[list_invoices, send_email, *DATEUTILS_TOOLS],
+        tool_selector=selector,
+    )
+
+    model = TestModel()
+    with agent.agent.override(model=model):
+        await agent.generate_response("Show me the unpaid invoices")
+
+    assert model.last_model_request_parameters is not None
+    assert [tool.name for tool in model.last_model_request_parameters.function_tools] == ["list_invoices"]
+    assert selector.stats.queries == 1
+    assert selector.stats.reduction == 0.8
@@ -0,0 +1,85 @@
+"""Tests for lazy toolpack loading."""
+
+import sys
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+import pytest
+
+from pygentic_ai import AgentMode
+from pygentic_ai.tools import ToolManager, Toolpacks, get_today_date, tool_registry
+
+TOOLPACK_SOURCE = '''
+def find_invoice(number: str) -> str:
+    """Find an invoice by number."""
+    return number
+
+INVOICE_TOOLS = [find_invoice]
+'''
+
+
+def find_order(number: str) -> str:
+    """Find an order by number."""
+    return number
+
+
+@pytest.fixture
+def toolpack_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Importable toolpack module that has not been imported yet."""
+    (tmp_path / "invoice_toolpack.py").write_text(TOOLPACK_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "invoice_toolpack", raising=False)
+    return "invoice_toolpack"
+
+
+def test_default_toolpacks_resolve() -> None:
+    """Test that built-in toolpacks registered as import strings resolve."""
+    manager = ToolManager()
+
+    tools = manager.get_toolpack(AgentMode.GENERAL)
+
+    assert get_today_date in tools
+    assert Toolpacks.UTILS in manager.import_times
+
+
+def test_toolpack_imported_on_first_use(toolpack_module: str) -> None:
+    """Test that import string toolpacks are imported lazily and cached."""
+    manager = ToolManager()
+    manager.register_toolpack("invoices", f"{toolpack_module}:INVOICE_TOOLS", modes=[AgentMode.GENERAL])
+    assert toolpack_module not in sys.modules
+
+    first = manager.get_toolpack(AgentMode.GENERAL)
+    second = manager.get_toolpack(AgentMode.GENERAL)
+
+    assert toolpack_module in sys.modules
+    assert [tool.__name__ for tool in first][-1] == "find_invoice"
+    assert first == second
+    assert manager.import_times["invoices"] >= 0
+
+
+def test_entry_point_toolpacks(toolpack_module: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that entry point toolpacks are registered without importing them."""
+    entry_point = EntryPoint(
+        name="invoices",
+        value=f"{toolpack_module}:INVOICE_TOOLS",
+        group=tool_registry.TOOLPACK_ENTRY_POINT_GROUP,
+    )
+    monkeypatch.setattr(tool_registry, "entry_points", lambda group: [entry_point])
+    manager = ToolManager()
+
+    assert manager.register_entry_points(modes=[AgentMode.GENERAL]) == ["invoices"]
+    assert toolpack_module not in sys.modules
+    assert "find_invoice" in [tool.__name__ for tool in manager.get_toolpack(AgentMode.GENERAL)]
+
+
+def test_toolpacks_mapping_holds_lists() -> None:
+    """Test that reading a toolpack registered as an import string gives its list of tools."""
+    manager = ToolManager()
+
+    utils = manager.toolpacks[Toolpacks.UTILS]
+    utils.append(find_order)
+
+    assert get_today_date in utils
+    assert manager.toolpacks.get(Toolpacks.UTILS) is utils
+    assert all(isinstance(tools, list) for tools in manager.toolpacks.values())
+    assert find_order in manager.get_toolpack(AgentMode.GENERAL)
@@ -0,0 +1,46 @@
+"""Tests for usage and cost accounting."""
+
+from pygentic_ai import AgentManager, ModelPrice, UsageLedger, WorkflowState, user_assistant_graph
+from pygentic_ai.context import execution_scope
+from pygentic_ai.workflows.nodes import StartNode
+
+
+def test_usage_ledger_prices_and_attribution() -> None:
+    """Test that records are priced and attributed from the execution scope."""
+    from pydantic_ai import RunUsage
+
+    ledger = UsageLedger(prices={"openai:gpt-4o": ModelPrice(2.0, 8.0)})
+
+    with execution_scope(run_id="run-1", node="generate", tenant="acme"):
+        record = ledger.record(RunUsage(requests=1, input_tokens=1_000, output_tokens=500), model="openai:gpt-4o")
+    ledger.record(RunUsage(requests=1, input_tokens=10, output_tokens=10), model="openai:unknown")
+
+    assert record.run_id == "run-1"
+    assert record.tenant == "acme"
+    assert record.cost == (1_000 * 2.0 + 500 * 8.0) / 1_000_000
+
+    run = ledger.run_totals("run-1")
+    assert run.calls == 1
+    assert run.total_tokens == 1_500
+
+    totals = ledger.totals()
+    assert totals.calls == 2
+    assert totals.unpriced_calls == 1
+    assert ledger.rolling_totals(window=60).calls == 2
+    assert set(ledger.breakdown("model")) == {"openai:gpt-4o", "openai:unknown"}
+
+
+async def test_workflow_usage_per_node(test_manager: AgentManager) -> None:
+    """Test that every agent call of a workflow run lands in the ledger."""
+    ledger = UsageLedger()
+    for name in test_manager.list_agents():
+        test_manager.get(name).ledger = ledger
+
+    state = WorkflowState()
+    await user_assistant_graph.run(StartNode(), state=state, deps=test_manager.to_deps(message="Hi", tenant="acme"))
+
+    assert state.run_id
+    by_node = ledger.breakdown("node", run_id=state.run_id)
+    assert set(by_node) == {"classify", "generate", "guardrails"}
+    assert all(record.tenant == "acme" for record in ledger.run_records(state.run_id))
+    assert ledger.run_totals(state.run_id).requests == 3